@@ -45,29 +45,176 @@ Processes all document types from a single input file:
 import re
 # Importing Python modules (csv) so we can use their ready-made tools and functions below.
 import csv
+# Importing Python modules (time) so watch mode can wait between checks of the input folder.
+import time
+# Importing Python modules (hashlib) so a re-run can tell whether the input files changed.
+import hashlib
+# Importing Python modules (sys) so the input fingerprint can find the other scripts this one has loaded.
+import sys
+# Bringing in specific parts (ProcessPoolExecutor) so several input files can be parsed at the same time.
+from concurrent.futures import ProcessPoolExecutor
+# Bringing in specific parts (itemgetter) so sorting by a tuple's first item doesn't need a lambda.
+from operator import itemgetter
 # Bringing in specific parts (Path) from the 'pathlib' module so we can call them directly.
 from pathlib import Path
 
-# Try to import spaCy for enhanced NLP capabilities (optional)
-# Try to run some code. If it errors, we can handle it without crashing.
-try:
-# Importing Python modules (spacy) so we can use their ready-made tools and functions below.
-    import spacy
-    # Save a value into a variable named 'nlp' so we can use it later.
-    nlp = spacy.load("en_core_web_sm")
-    # Save a value into a variable named 'HAVE_SPACY' so we can use it later.
-    HAVE_SPACY = True
-    print("spaCy loaded successfully - enhanced extraction available")
-# If an error happens in the 'try' block, this 'except' block runs to handle it.
-except:
-    # Save a value into a variable named 'HAVE_SPACY' so we can use it later.
-    HAVE_SPACY = False
+# Importing Python modules (functools) so we can cache the spaCy model after the first load.
+import functools
+# Importing Python modules (importlib.util) so we can check if spaCy is installed WITHOUT loading it.
+import importlib.util
+# Importing Python modules (importlib.metadata) so we can read spaCy's and the model's version numbers.
+import importlib.metadata
+
+# Check for spaCy (optional) without loading it yet.
+# Loading the model is slow, so we wait until a statement actually needs it (see get_nlp below).
+# find_spec() only looks for the package on disk; it does not import it.
+# Save a value into a variable named 'HAVE_SPACY' so we can use it later.
+HAVE_SPACY = (importlib.util.find_spec("spacy") is not None
+              and importlib.util.find_spec("en_core_web_sm") is not None)
+# Check a condition. If it's True, run the block under this 'if'.
+if HAVE_SPACY:
+    print("spaCy found - enhanced extraction available (model loads on first use)")
+# If none of the above conditions were True, do this 'else' part.
+else:
     print("Note: spaCy not installed. Using regex-only extraction (still works fine!)")
 
+# Define a function named 'spacy_versions'. This function takes no inputs.
+# A function is a reusable mini-program you can run by its name.
+def spacy_versions():
+    """
+    The installed spaCy and en_core_web_sm versions, e.g. "spacy 3.7.4, en_core_web_sm 3.7.1",
+    or "" if either one is missing. Read from the package info, so nothing is loaded.
+    """
+    # Try to run some code. If it errors, we can handle it without crashing.
+    try:
+        # Send this value back to whoever called the function ('return' ends the function).
+        return (f"spacy {importlib.metadata.version('spacy')}, "
+                f"en_core_web_sm {importlib.metadata.version('en_core_web_sm')}")
+    # If an error happens in the 'try' block, this 'except' block runs to handle it.
+    except importlib.metadata.PackageNotFoundError:
+        return ""
+
+# Define a function named 'get_nlp'. This function takes no inputs.
+# @functools.lru_cache(maxsize=1) remembers the answer, so the model is only loaded ONCE per run.
+@functools.lru_cache(maxsize=1)
+def get_nlp():
+    """
+    Load the spaCy model the first time it is needed. Returns None if it can't be loaded.
+    Uses the trimmed NER-only copy in SPACY_CACHE_DIR when there is one, and saves one there otherwise.
+    The copy is only used if it was made from the spaCy and model versions installed now
+    (saved next to it in SPACY_CACHE_VERSIONS); after an upgrade it is rebuilt.
+    """
+    # Try to run some code. If it errors, we can handle it without crashing.
+    try:
+        # Importing Python modules (spacy) so we can use their ready-made tools and functions below.
+        import spacy
+    # If an error happens in the 'try' block, this 'except' block runs to handle it.
+    except Exception:
+        # Send this value back to whoever called the function ('return' ends the function).
+        return None
+
+    # Save a value into a variable named 'versions' so we can use it later.
+    # (Unknown versions: don't trust or write a saved copy at all.)
+    versions = spacy_versions()
+    # Save a value into a variable named 'cache_dir' so we can use it later.
+    cache_dir = SPACY_CACHE_DIR if versions else None
+
+    # Fast path: load the small copy we saved on an earlier run, if it came from these same versions.
+    # Check a condition. If it's True, run the block under this 'if'.
+    if cache_dir and (cache_dir / "config.cfg").exists() and cached_spacy_versions() == versions:
+        # Try to run some code. If it errors, we can handle it without crashing.
+        try:
+            # Send this value back to whoever called the function ('return' ends the function).
+            return spacy.load(cache_dir)
+        # If an error happens in the 'try' block, this 'except' block runs to handle it.
+        except Exception:
+            # Broken copy - rebuild it below.
+            pass
+
+    # Try to run some code. If it errors, we can handle it without crashing.
+    try:
+        # Only the NER step is used (names); skip loading the steps we never run.
+        # Save a value into a variable named 'nlp' so we can use it later.
+        nlp = spacy.load("en_core_web_sm", exclude=SPACY_EXCLUDE)
+    # If an error happens in the 'try' block, this 'except' block runs to handle it.
+    except Exception:
+        # Send this value back to whoever called the function ('return' ends the function).
+        return None
+
+    # Save the trimmed model so the next run can load it straight from disk.
+    # Check a condition. If it's True, run the block under this 'if'.
+    if cache_dir:
+        # Try to run some code. If it errors, we can handle it without crashing.
+        try:
+            nlp.to_disk(cache_dir)
+            # Written last, so a half-written copy never looks current.
+            (cache_dir / SPACY_CACHE_VERSIONS).write_text(versions, encoding="utf-8")
+        # If an error happens in the 'try' block, this 'except' block runs to handle it.
+        except Exception:
+            # Not being able to write the cache is fine; we just load the full model next time too.
+            pass
+    # Send this value back to whoever called the function ('return' ends the function).
+    return nlp
+
+# Define a function named 'cached_spacy_versions'. This function takes no inputs.
+# A function is a reusable mini-program you can run by its name.
+def cached_spacy_versions():
+    """The versions the saved copy in SPACY_CACHE_DIR was made from ("" if unknown)."""
+    # Try to run some code. If it errors, we can handle it without crashing.
+    try:
+        # Send this value back to whoever called the function ('return' ends the function).
+        return (SPACY_CACHE_DIR / SPACY_CACHE_VERSIONS).read_text(encoding="utf-8")
+    # If an error happens in the 'try' block, this 'except' block runs to handle it.
+    except OSError:
+        return ""
+
 # ============= CONFIGURATION =============
 # Save a value into a variable named 'INPUT_PATH' so we can use it later.
+# This can be a single file, or a folder: every .txt file in the folder is parsed.
 INPUT_PATH = Path(r"C:\Source\Obfuscate\Python\FF Parser\input\SampleFileSTMT.txt") #change this
 
+# How many input files to parse at once (each in its own process). None = one per CPU core.
+# Save a value into a variable named 'MAX_WORKERS' so we can use it later.
+MAX_WORKERS = None
+
+# A single big file can also be split up: when it holds at least this many loan (or rev. credit) statements,
+# the statements are processed in worker processes (MAX_WORKERS of them). Smaller files
+# stay in one process, where starting the workers would cost more than it saves.
+# Save a value into a variable named 'MIN_PARALLEL_STATEMENTS' so we can use it later.
+MIN_PARALLEL_STATEMENTS = 64
+
+# Watch mode: keep running and re-check INPUT_PATH every WATCH_INTERVAL seconds.
+# New or changed files are parsed as they appear and the outputs are rewritten.
+# spaCy and the regex patterns are only loaded once, so each new file is cheap. Stop with Ctrl+C.
+# Save a value into a variable named 'WATCH_INPUT' so we can use it later.
+WATCH_INPUT = False
+# Save a value into a variable named 'WATCH_INTERVAL' so we can use it later.
+WATCH_INTERVAL = 5
+
+# Lazy spaCy (off by default): when True, a quick regex first picks out lines that look like names,
+# and spaCy only runs on those lines (and is never loaded if no line matches). Faster, but spaCy then
+# sees less context, and one-word or punctuated names ("O'BRIEN LLC", "SMITH, JOHN A.") are never
+# offered to it, so the names found can differ. False runs spaCy over the whole customer block.
+# Save a value into a variable named 'LAZY_SPACY' so we can use it later.
+LAZY_SPACY = False
+
+# How many texts spaCy handles per batch in nlp.pipe(), and how many worker processes it uses.
+# More processes only pay off for very large files (each process loads its own copy of the model).
+SPACY_BATCH_SIZE = 64
+SPACY_N_PROCESS = 1
+
+# Pipeline steps we never use. Only NER (person names) is needed; classification just needs the words.
+# Save a value into a variable named 'SPACY_EXCLUDE' so we can use it later.
+SPACY_EXCLUDE = ["tagger", "parser", "attribute_ruler", "lemmatizer", "senter"]
+
+# Where the trimmed spaCy model is saved after the first run, so later runs start faster.
+# Delete this folder to rebuild it (e.g. after upgrading spaCy). Set to None to turn the cache off.
+# Save a value into a variable named 'SPACY_CACHE_DIR' so we can use it later.
+SPACY_CACHE_DIR = Path.home() / ".cache" / "shield" / "spacy_ner_only"
+# File inside SPACY_CACHE_DIR that records which spaCy/model versions the copy was made from.
+# Save a value into a variable named 'SPACY_CACHE_VERSIONS' so we can use it later.
+SPACY_CACHE_VERSIONS = "source_versions.txt"
+
 # Output paths for all document types
 # Save a value into a variable named 'OUTPUT_DIR' so we can use it later.
 OUTPUT_DIR = Path(r"C:\Source\Obfuscate\Python\FF Parser\output") #change this 
@@ -101,27 +248,71 @@ OUT_PAYOFF_XLSX = OUTPUT_DIR / "payoff_notice_only.xlsx"
 OUT_PAST_DUE_TSV = OUTPUT_DIR / "past_due_notice_only.tsv"
 OUT_PAST_DUE_XLSX = OUTPUT_DIR / "past_due_notice_only.xlsx"
 
+# Every output file above, so watch mode can clear the ones whose table no longer has any rows.
+# Save a value into a variable named 'OUTPUT_FILES' so we can use it later.
+OUTPUT_FILES = (
+    OUT_LOAN_HDR_TSV, OUT_LOAN_SUM_TSV, OUT_LOAN_HIST_TSV, OUT_LOAN_HDR_XLSX, OUT_LOAN_SUM_XLSX, OUT_LOAN_HIST_XLSX,
+    OUT_REV_HDR_TSV, OUT_REV_TXN_TSV, OUT_REV_HDR_XLSX, OUT_REV_TXN_XLSX,
+    OUT_ADVICE_TSV, OUT_ADVICE_XLSX, OUT_PAYOFF_TSV, OUT_PAYOFF_XLSX, OUT_PAST_DUE_TSV, OUT_PAST_DUE_XLSX,
+)
+
+# Skip unchanged input (off by default): after each run, a fingerprint of the input files, of the
+# script files in this folder that are loaded, and of which optional packages are installed is saved
+# to INPUT_SIG_PATH along with the list of output files. If the next run finds the same fingerprint and
+# all those outputs still there, nothing is parsed again. Handy when re-running during development.
+# Save a value into a variable named 'SKIP_UNCHANGED' so we can use it later.
+SKIP_UNCHANGED = False
+# Save a value into a variable named 'INPUT_SIG_PATH' so we can use it later.
+INPUT_SIG_PATH = OUTPUT_DIR / "input.sig"
+
 # Try Excel support if xcel isn't downloaded then these will be saved as tsv 
+# xlsxwriter is preferred: in constant_memory mode it writes each row straight to disk
+# instead of keeping the whole workbook in RAM. openpyxl (write-only mode) is the fallback.
+# Try to run some code. If it errors, we can handle it without crashing.
+try:
+    # Importing Python modules (xlsxwriter) so we can use their ready-made tools and functions below.
+    import xlsxwriter
+    # Save a value into a variable named 'HAVE_XLSXWRITER' so we can use it later.
+    HAVE_XLSXWRITER = True
+# If an error happens in the 'try' block, this 'except' block runs to handle it.
+except Exception:
+    # Save a value into a variable named 'HAVE_XLSXWRITER' so we can use it later.
+    HAVE_XLSXWRITER = False
+
 # Try to run some code. If it errors, we can handle it without crashing.
 try:
 # Bringing in specific parts (Workbook) from the 'openpyxl' module so we can call them directly.
     from openpyxl import Workbook
-    # Save a value into a variable named 'HAVE_XLSX' so we can use it later.
-    HAVE_XLSX = True
+    # Save a value into a variable named 'HAVE_OPENPYXL' so we can use it later.
+    HAVE_OPENPYXL = True
 # If an error happens in the 'try' block, this 'except' block runs to handle it.
 except Exception:
-    # Save a value into a variable named 'HAVE_XLSX' so we can use it later.
-    HAVE_XLSX = False
-    print("Note: openpyxl not installed. Excel output will be skipped.")
+    # Save a value into a variable named 'HAVE_OPENPYXL' so we can use it later.
+    HAVE_OPENPYXL = False
+
+# Save a value into a variable named 'HAVE_XLSX' so we can use it later.
+HAVE_XLSX = HAVE_XLSXWRITER or HAVE_OPENPYXL
+# Check a condition. If it's True, run the block under this 'if'.
+if not HAVE_XLSX:
+    print("Note: xlsxwriter/openpyxl not installed. Excel output will be skipped.")
 
 # ============= COMMON UTILITIES =============
 def read_text(path: Path) -> str:
     """Read and normalize (means make the text consistent so the program doesn’t get confused by differences in how files are saved.) text file."""
+    # Reading in text mode already turns Windows (\r\n) and old Mac (\r) line endings into \n
+    # while the file is decoded, so no extra passes over the whole text are needed afterwards.
     # Send this value back to whoever called the function ('return' ends the function).
-    return path.read_text(errors="ignore").replace("\r\n", "\n").replace("\r", "\n") #replace window's ending and old mac endings into \n
+    return path.read_text(errors="ignore")
+
+# Save a value into a variable named 'MONEY_STRIP' so we can use it later.
+# A translation table that deletes "," and "$" (so "$1,234.56" becomes "1234.56") in one pass.
+MONEY_STRIP = str.maketrans("", "", ",$")
 
 # Define a function named 'm2f'. Inputs: s: str. These are values the function expects when you call it.
 # A function is a reusable mini-program you can run by its name.
+# Statements repeat the same amounts over and over (0.00, fees, payments), so remember
+# each string's answer and skip re-parsing it the next time it shows up.
+@functools.lru_cache(maxsize=4096)
 def m2f(s: str):
     """Convert money string to float."""
     # Check a condition. If it's True, run the block under this 'if'.
@@ -130,13 +321,83 @@ def m2f(s: str):
         return None
     # Try to run some code. If it errors, we can handle it without crashing.
     try:
+        # float() ignores spaces at either end by itself, so no strip() is needed.
         # Send this value back to whoever called the function ('return' ends the function).
-        return float(s.replace(",", "").replace("$", "").strip())
-    # If an error happens in the 'try' block, this 'except' block runs to handle it.
-    except:
+        return float(s.translate(MONEY_STRIP))
+    # If the text isn't a number, this 'except' block runs to handle it.
+    except ValueError:
         # Send this value back to whoever called the function ('return' ends the function).
         return None
 
+# Define a function named 'page_has_text'. Inputs: body: str. These are values the function expects when you call it.
+# A function is a reusable mini-program you can run by its name.
+def page_has_text(body: str) -> bool:
+    """True if the page body has at least one non-space character (blank pages have nothing to extract)."""
+    # isspace() checks the text in place, without making a stripped copy of the whole page first.
+    # Send this value back to whoever called the function ('return' ends the function).
+    return bool(body) and not body.isspace()
+
+# Save a value into a variable named 'ASCII_LOWER' so we can use it later.
+# A translation table that turns A-Z into a-z and leaves every other character alone.
+ASCII_LOWER = str.maketrans("ABCDEFGHIJKLMNOPQRSTUVWXYZ", "abcdefghijklmnopqrstuvwxyz")
+
+# Define a function named 'fold_case'. Inputs: text: str. These are values the function expects when you call it.
+# A function is a reusable mini-program you can run by its name.
+def fold_case(text: str) -> str:
+    """
+    Lowercase text WITHOUT changing its length, so a match position found in the
+    lowercase copy points at the same characters in the original.
+    """
+    # lower() is fastest, but a few non-ASCII letters change length when lowercased,
+    # so for those texts only A-Z are lowered.
+    # Send this value back to whoever called the function ('return' ends the function).
+    return text.lower() if text.isascii() else text.translate(ASCII_LOWER)
+
+# Save a value into a variable named 'LINE_BREAK_RE' so we can use it later.
+# Every line break str.splitlines() knows about ("\r\n" counts as one).
+LINE_BREAK_RE = re.compile("\r\n|[\n\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029]")
+
+# Save a value into a variable named 'LINE_BREAKS_TO_NL' so we can use it later.
+# Turns every other line break splitlines() knows about (form feeds included) into "\n",
+# so re.MULTILINE's ^ and $ see the same lines splitlines() would.
+LINE_BREAKS_TO_NL = str.maketrans(dict.fromkeys("\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029", "\n"))
+
+# Define a function named 'in_line'. Inputs: pattern: str. These are values the function expects when you call it.
+# A function is a reusable mini-program you can run by its name.
+def in_line(pattern: str) -> str:
+    """
+    Rewrite a pattern written for ONE line so it can run over a whole block with re.MULTILINE:
+    every \s becomes "whitespace except a newline", so a match can never spill into the next line.
+    """
+    # Send this value back to whoever called the function ('return' ends the function).
+    return pattern.replace(r"\s", r"[^\S\n]")
+
+# Define a function named 'first_lines'. Inputs: text: str, start: int, n: int. These are values the function expects when you call it.
+# A function is a reusable mini-program you can run by its name.
+def first_lines(text: str, start: int, n: int) -> str:
+    """
+    Same as "\n".join(text[start:].splitlines()[:n]), but without splitting
+    (and copying) everything after the first n lines.
+    """
+    # Save a value into a variable named 'lines' so we can use it later.
+    lines = []
+    # Save a value into a variable named 'pos' so we can use it later.
+    pos = start
+    # Start a loop: repeat these steps once for each item in a collection.
+    for m in LINE_BREAK_RE.finditer(text, start):
+        # Check a condition. If it's True, run the block under this 'if'.
+        if len(lines) == n:
+            break
+        lines.append(text[pos:m.start()])
+        # Save a value into a variable named 'pos' so we can use it later.
+        pos = m.end()
+    # The last line may not end with a line break.
+    # Check a condition. If it's True, run the block under this 'if'.
+    if len(lines) < n and pos < len(text):
+        lines.append(text[pos:])
+    # Send this value back to whoever called the function ('return' ends the function).
+    return "\n".join(lines)
+
 # Common regex patterns
 # Save a value into a variable named 'ZIP_RE' so we can use it later.
 # This regex looks for a US-style address fragment: "STATE ZIPCODE"
@@ -161,161 +422,465 @@ MONEY_RE = r"\$[0-9][0-9,]*\.\d{2}"
 # Save a value into a variable named 'REM_ZIP_PATTS' so we can use it later.
 REM_ZIP_PATTS = (r"\bCHICAGO\s+IL\s+60603\b", r"\bWORTH[,\s]+IL\s+60482\b")
 
+# ============= SHARED PRE-COMPILED PATTERNS =============
+# These patterns are used by several processors. Compiling them once here (when the program starts)
+# means Python doesn't have to look them up / rebuild them every time a line is checked.
+
+# Both remittance ZIP patterns in one regex: "does this line match EITHER of them?"
+# Save a value into a variable named 'REM_ZIP_RE' so we can use it later.
+REM_ZIP_RE = re.compile("|".join(REM_ZIP_PATTS), re.IGNORECASE)
+# Every remittance match contains one of these ZIP codes, so a plain substring check can rule out
+# almost every line before the regex runs.
+# Save a value into a variable named 'REM_ZIP_CODES' so we can use it later.
+REM_ZIP_CODES = ("60603", "60482")
+
+# Define a function named 'is_remit_zip'. Inputs: line: str. These are values the function expects when you call it.
+# A function is a reusable mini-program you can run by its name.
+def is_remit_zip(line: str) -> bool:
+    """True if the line has one of the bank's remittance addresses (REM_ZIP_PATTS)."""
+    # Send this value back to whoever called the function ('return' ends the function).
+    return (REM_ZIP_CODES[0] in line or REM_ZIP_CODES[1] in line) and REM_ZIP_RE.search(line) is not None
+
+# ZIP_RE for a whole block of text: the gap after the state may be commas or any whitespace
+# EXCEPT the line breaks splitlines() knows about (see LINE_BREAK_RE), so a match never spans two lines.
+# Save a value into a variable named 'ZIP_IN_LINE_RE' so we can use it later.
+ZIP_IN_LINE_RE = re.compile(
+    r"\b[A-Z]{2}(?:,|[^\S\n\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029])+\d{5}(?:-\d{4})?\b",
+    re.IGNORECASE
+)
+
+# Define a function named 'lines_through_zip'. Inputs: text: str. These are values the function expects when you call it.
+# A function is a reusable mini-program you can run by its name.
+def lines_through_zip(text: str):
+    """
+    The lines of text (as splitlines() gives them) up to and including the first line
+    that has a ZIP (ZIP_RE), or [] if no line has one.
+    One search over the whole text instead of running ZIP_RE on every line.
+    """
+    # Save a value into a variable named 'm' so we can use it later.
+    m = ZIP_IN_LINE_RE.search(text)
+    # Check a condition. If it's True, run the block under this 'if'.
+    if m is None:
+        return []
+    # Save a value into a variable named 'eol' so we can use it later (the line break that ends the ZIP line).
+    eol = LINE_BREAK_RE.search(text, m.end())
+    # Send this value back to whoever called the function ('return' ends the function).
+    return text[:eol.start() if eol else len(text)].splitlines()
+# Save a value into a variable named 'MONEY_PAT' so we can use it later.
+# MONEY_RE (the text version) is still used to build bigger patterns; MONEY_PAT is the ready-to-use one.
+MONEY_PAT = re.compile(MONEY_RE)
+# Save a value into a variable named 'DIGIT_RE' so we can use it later (any single digit 0-9).
+DIGIT_RE = re.compile(r"\d")
+# Save a value into a variable named 'PO_BOX_RE' so we can use it later ("P.O. BOX", "PO BOX", "POBOX"...).
+PO_BOX_RE = re.compile(r"\bP\.?O\.?\s*BOX\b", re.IGNORECASE)
+# Save a value into a variable named 'BRANCH_SUFFIX_RE' so we can use it later.
+# A 3-digit number at the very end of a line (a branch code printed next to the name).
+BRANCH_SUFFIX_RE = re.compile(r"\s+\b\d{3}\b$")
+# Save a value into a variable named 'ACCT_NOTE_PAIR_RE' so we can use it later ("Account/Note Number 123 - 456").
+ACCT_NOTE_PAIR_RE = re.compile(r"Account/Note\s*Number\s*([0-9]+)\s*-\s*([0-9]+)", re.IGNORECASE)
+# Save a value into a variable named 'ACCT_NUMBER_RE' so we can use it later ("Account Number: 0000 0100").
+ACCT_NUMBER_RE = re.compile(r"Account\s*Number\s*:\s*([0-9 ]+)", re.IGNORECASE)
+# Save a value into a variable named 'NOTE_NUMBER_RE' so we can use it later ("Note Number: 02001").
+NOTE_NUMBER_RE = re.compile(r"Note\s*Number\s*:\s*([0-9 ]+)", re.IGNORECASE)
+
+# Try Hyperscan (optional). It checks MANY patterns against a line in one pass.
+# If it isn't installed, MultiPatternMatcher below falls back to Python's normal 're' module.
+# Try to run some code. If it errors, we can handle it without crashing.
+try:
+    # Importing Python modules (hyperscan) so we can use their ready-made tools and functions below.
+    import hyperscan
+    # Save a value into a variable named 'HAVE_HYPERSCAN' so we can use it later.
+    HAVE_HYPERSCAN = True
+# If an error happens in the 'try' block, this 'except' block runs to handle it.
+except Exception:
+    # Save a value into a variable named 'HAVE_HYPERSCAN' so we can use it later.
+    HAVE_HYPERSCAN = False
+
+# Characters Hyperscan can't be trusted with: anything outside ASCII (it scans bytes), and the
+# ASCII separators \x1c-\x1f, which Python's \s counts as whitespace but Hyperscan's \s does not.
+# A line with any of these is checked with the regex fallback instead.
+# Save a value into a variable named 'HS_UNSAFE_RE' so we can use it later.
+HS_UNSAFE_RE = re.compile(r"[^\x00-\x1b\x20-\x7f]")
+
+# Define a function named '_stop_scan'. Hyperscan calls it on a match; returning True stops the scan.
+def _stop_scan(pattern_id, start, end, flags, context):
+    # Send this value back to whoever called the function ('return' ends the function).
+    return True
+
+# Create a Class named 'MultiPatternMatcher'. A Class is a blueprint for objects (bundles of data + functions).
+class MultiPatternMatcher:
+    """
+    Answers one question fast: "does this text match ANY of these patterns?"
+    - With Hyperscan: all patterns are compiled into one database and the text is scanned once.
+    - Without it: all patterns are joined into one big regex (a | b | c ...) and searched once.
+    Both ways must give the same answer, so when Hyperscan is used it is first checked against
+    the regex on PROBES; if they disagree anywhere, this matcher just uses the regex.
+    """
+
+    # Typical field/footer lines, with each kind of whitespace (the ones \s treats differently
+    # in Hyperscan included) in place of the spaces. Save a value into a variable named 'PROBES'.
+    PROBES = tuple(
+        text.replace(" ", sep)
+        for text in ("Page 2 of 3", " Account Number 123", "Note Number: 02001", "Statement Date 01/02/24",
+                     "Payment Due Date", "CIBC BANK USA", "CHICAGO IL 60603", "Account/Note Number 1 - 2")
+        for sep in (" ", "  ", "\t", "\x0b", "\x0c", "\r", "\x1c", "\x1d", "\x1e", "\x1f", "\xa0")
+    )
+
+    # Define a function named '__init__'. Inputs: self, patterns, flags=re.IGNORECASE.
+    # __init__ runs once when the object is created (here: once, when the program starts).
+    def __init__(self, patterns, flags=re.IGNORECASE):
+        # Save a value into a variable named 'self.patterns' so we can use it later.
+        self.patterns = tuple(patterns)
+        # The plain-Python fallback: one regex that matches if any single pattern matches.
+        self._re = re.compile("|".join("(?:" + p + ")" for p in self.patterns), flags)
+        # Save a value into a variable named 'self._db' so we can use it later.
+        self._db = None
+        # Check a condition. If it's True, run the block under this 'if'.
+        if HAVE_HYPERSCAN:
+            # Try to run some code. If it errors, we can handle it without crashing.
+            try:
+                # SINGLEMATCH = report each pattern at most once per scan (we only need yes/no).
+                hs_flags = hyperscan.HS_FLAG_SINGLEMATCH
+                # Check a condition. If it's True, run the block under this 'if'.
+                if flags & re.IGNORECASE:
+                    hs_flags |= hyperscan.HS_FLAG_CASELESS
+                # Save a value into a variable named 'db' so we can use it later.
+                db = hyperscan.Database()
+                db.compile(
+                    expressions=[p.encode("ascii") for p in self.patterns],
+                    ids=list(range(len(self.patterns))),
+                    elements=len(self.patterns),
+                    flags=[hs_flags] * len(self.patterns),
+                )
+                # Save a value into a variable named 'self._db' so we can use it later.
+                self._db = db
+            # If an error happens in the 'try' block, this 'except' block runs to handle it.
+            except Exception:
+                # A pattern Hyperscan can't handle: just use the regex fallback.
+                self._db = None
+            # Check a condition. If it's True, run the block under this 'if'.
+            if self._db is not None and self.disagreements(self.PROBES):
+                # The two engines don't give the same answers for these patterns: use the regex only.
+                self._db = None
+
+    # Define a function named 'disagreements'. Inputs: self, lines. These are values the function expects when you call it.
+    def disagreements(self, lines):
+        """The lines where search() and the plain regex give different answers ([] when they always agree)."""
+        # Send this value back to whoever called the function ('return' ends the function).
+        return [ln for ln in lines if self.search(ln) != (self._re.search(ln) is not None)]
+
+    # Define a function named 'search'. Inputs: self, text. These are values the function expects when you call it.
+    def search(self, text) -> bool:
+        """Return True if any pattern matches somewhere in text."""
+        # Check a condition. If it's True, run the block under this 'if'.
+        if self._db is None:
+            # Send this value back to whoever called the function ('return' ends the function).
+            return self._re.search(text) is not None
+        # Check a condition. If it's True, run the block under this 'if'.
+        if HS_UNSAFE_RE.search(text):
+            # Odd characters on this line (see HS_UNSAFE_RE): let the regex fallback handle it.
+            return self._re.search(text) is not None
+        # Hyperscan works on bytes; the line is plain ASCII by now, so this can't fail.
+        # Save a value into a variable named 'data' so we can use it later.
+        data = text.encode("ascii")
+        # Try to run some code. If it errors, we can handle it without crashing.
+        try:
+            # Hyperscan calls the handler when a pattern matches. It returns True, which tells
+            # Hyperscan to stop right there: one hit already answers the question.
+            self._db.scan(data, match_event_handler=_stop_scan)
+        # Hyperscan reports "stopped early" as a ScanTerminated error, which here just means "found one".
+        except hyperscan.ScanTerminated:
+            # Send this value back to whoever called the function ('return' ends the function).
+            return True
+        # The whole line was scanned without a single match.
+        # Send this value back to whoever called the function ('return' ends the function).
+        return False
+
+# Candidate name lines for lazy spaCy
+# Save a value into a variable named 'NAME_LINE_RE' so we can use it later.
+# This regex picks out lines that *could* be a person/company name, like "JOHN P BURKE".
+# - ^[ \t]*                      = start of a line, ignoring leading spaces
+# - (?:(?:MR|MRS|MS|DR|DEAR)\.?  = an optional title such as "MR." or "Dear"
+# - [A-Za-z][A-Za-z.'&-]*        = a word made only of letters (plus . ' & -)
+# - (?: [A-Za-z][A-Za-z.'&-]*){1,5} = 1 to 5 more words, separated by ONE space
+# - (?:[ \t]{2,}.*)?$            = optionally followed by a right-hand column (2+ spaces, then anything)
+# Lines with digits (streets, ZIPs, amounts) never match, so spaCy never sees them.
+NAME_LINE_RE = re.compile(
+    r"^[ \t]*((?:(?:MR|MRS|MS|DR|DEAR)\.?[ \t]+)?"
+    r"[A-Za-z][A-Za-z.'&-]*(?: [A-Za-z][A-Za-z.'&-]*){1,5})(?:[ \t]{2,}.*)?$",
+    re.MULTILINE | re.IGNORECASE
+)
+
 # ============= SPACY ENHANCEMENT FUNCTIONS =============
-# Define a function named 'extract_names_with_spacy'. Inputs: text_block, max_names=5. These are values the function expects when you call it.
+# Define a function named 'ingest_entity_extractor'. Inputs: text_block. These are values the function expects when you call it.
 # A function is a reusable mini-program you can run by its name.
-def extract_names_with_spacy(text_block, max_names=5):
+def ingest_entity_extractor(text_block):
     """
-    Use spaCy NER (Named Entity Recognition) to pull out people’s names from text.
-    Returns a list of up to max_names names.
+    Cheap first pass (regex only, no spaCy): return the lines that look like they could be names.
     """
+    # findall() returns the text captured by group 1 for every matching line.
+    # Send this value back to whoever called the function ('return' ends the function).
+    return [c.strip() for c in NAME_LINE_RE.findall(text_block)]
 
-    # If spaCy wasn’t successfully loaded earlier, just stop here and return an empty list.
-    if not HAVE_SPACY:
+
+# Define a function named 'query_entity_extractor'. Inputs: text_block, max_names=5. These are values the function expects when you call it.
+# A function is a reusable mini-program you can run by its name.
+def query_entity_extractor(text_block, max_names=5):
+    """
+    Expensive second pass: run spaCy NER over text_block and return up to max_names PERSON names.
+    """
+    # Ask for the (cached) spaCy model. This is the only place the model gets loaded for names.
+    nlp = get_nlp()
+    # If the model couldn't be loaded, just stop here and return an empty list.
+    if nlp is None:
         return []
 
     try:
         # nlp() is spaCy’s main function: it takes text and breaks it down into tokens (words, punctuation),
         # and also tags them with info like "this is a PERSON", "this is a DATE", etc.
-        # [:1000] means "take only the first 1000 characters of the text_block" — this keeps it fast.
-        doc = nlp(text_block[:1000])
+        doc = nlp(text_block)
 
-        # names will be a list where we store any valid person names we find.
-        names = []
+        # Return the final list of names.
+        return person_names(doc, max_names)
 
-        # seen is a "set" — kind of like a list, but it can’t contain duplicates.
-        # We use this to keep track of names we’ve already added, so we don’t repeat them.
-        seen = set()
+    except Exception:
+        # If spaCy throws an error, don’t crash — just return an empty list.
+        return []
 
-        # Loop through each entity (ent) that spaCy identified in the text.
-        for ent in doc.ents:
-            # If this entity is labeled as a PERSON and we haven’t hit the limit yet…
-            if ent.label_ == "PERSON" and len(names) < max_names:
-                # Clean up the text of the name (remove extra spaces).
-                name = ent.text.strip()
 
-                # Filter out junk: skip known company names, skip duplicates, skip very short names.
-                if (name.upper() not in ("CIBC BANK USA", "LASALLE", "CHICAGO", "CIBC")
-                    and name not in seen
-                    and len(name) > 2):
-                    names.append(name)   # add to the list
-                    seen.add(name)       # mark it as already used
+# Define a function named 'person_names'. Inputs: doc, max_names=5. These are values the function expects when you call it.
+# A function is a reusable mini-program you can run by its name.
+def person_names(doc, max_names=5):
+    """Pick up to max_names PERSON entities out of a spaCy doc, skipping bank names, repeats and tiny matches."""
+    # names will be a list where we store any valid person names we find.
+    names = []
 
-        # Return the final list of names.
-        return names
+    # seen is a "set" — kind of like a list, but it can’t contain duplicates.
+    # We use this to keep track of names we’ve already added, so we don’t repeat them.
+    seen = set()
 
-    except Exception as e:
-        # If spaCy throws an error, don’t crash — just return an empty list.
+    # Loop through each entity (ent) that spaCy identified in the text.
+    for ent in doc.ents:
+        # If this entity is labeled as a PERSON and we haven’t hit the limit yet…
+        if ent.label_ == "PERSON" and len(names) < max_names:
+            # Clean up the text of the name (remove extra spaces).
+            name = ent.text.strip()
+
+            # Filter out junk: skip known company names, skip duplicates, skip very short names.
+            if (name.upper() not in ("CIBC BANK USA", "LASALLE", "CHICAGO", "CIBC")
+                and name not in seen
+                and len(name) > 2):
+                names.append(name)   # add to the list
+                seen.add(name)       # mark it as already used
+
+    # Send this value back to whoever called the function ('return' ends the function).
+    return names
+
+
+# Define a function named 'extract_names_with_spacy'. Inputs: text_block, max_names=5. These are values the function expects when you call it.
+# A function is a reusable mini-program you can run by its name.
+def extract_names_with_spacy(text_block, max_names=5):
+    """
+    Use spaCy NER (Named Entity Recognition) to pull out people’s names from text.
+    Returns a list of up to max_names names.
+    With LAZY_SPACY on, spaCy only sees the lines the regex flagged as possible names.
+    """
+
+    # If spaCy isn’t installed, just stop here and return an empty list.
+    if not HAVE_SPACY:
         return []
 
+    # Save a value into a variable named 'window' so we can use it later.
+    window = name_window(text_block)
+    # No name-looking lines means nothing for spaCy to do (and the model never loads).
+    if not window:
+        return []
+
+    # Send this value back to whoever called the function ('return' ends the function).
+    return query_entity_extractor(window, max_names)
 
-# Define a function named 'extract_address_with_spacy'. Inputs: text_block. These are values the function expects when you call it.
+
+# Define a function named 'name_window'. Inputs: text_block. These are values the function expects when you call it.
 # A function is a reusable mini-program you can run by its name.
-def extract_address_with_spacy(text_block):
+def name_window(text_block):
     """
-    Use spaCy to help extract address components.
-    Returns a tuple: (street, city_state_zip).
-    For example: ("123 Main St", "Chicago, IL 60602")
+    The text spaCy should look at for names: the first 1000 characters,
+    or (with LAZY_SPACY on) just the name-looking lines in them. "" means there is nothing to check.
     """
+    # [:1000] means "take only the first 1000 characters of the text_block" — this keeps it fast.
+    window = text_block[:1000]
+
+    # Check a condition. If it's True, run the block under this 'if'.
+    if LAZY_SPACY:
+        # Send this value back to whoever called the function ('return' ends the function).
+        return "\n".join(ingest_entity_extractor(window))
+    # Send this value back to whoever called the function ('return' ends the function).
+    return window
+
 
-    # If spaCy wasn’t loaded earlier, stop and return two empty strings.
+# Define a function named 'extract_names_with_spacy_batch'. Inputs: text_blocks, max_names=5. These are values the function expects when you call it.
+# A function is a reusable mini-program you can run by its name.
+def extract_names_with_spacy_batch(text_blocks, max_names=5):
+    """
+    Same as extract_names_with_spacy, but for a whole list of text blocks at once
+    (one per statement). Returns a list of name lists in the same order.
+    nlp.pipe() runs all the blocks through spaCy in batches instead of one nlp() call per statement.
+    """
+    # Save a value into a variable named 'results' so we can use it later.
+    results = [[] for _ in text_blocks]
+    # Check a condition. If it's True, run the block under this 'if'.
     if not HAVE_SPACY:
-        return "", ""
-    
+        return results
+
+    # Save a value into a variable named 'windows' so we can use it later.
+    windows = [name_window(b) for b in text_blocks]
+    # Only blocks with something to check go to spaCy, remembering where each one came from.
+    # Save a value into a variable named 'todo' so we can use it later.
+    todo = [i for i, w in enumerate(windows) if w]
+    # Nothing to check means the model never has to load.
+    if not todo:
+        return results
+    # Ask for the (cached) spaCy model; stop here if it couldn't be loaded.
+    nlp = get_nlp()
+    if nlp is None:
+        return results
+
     try:
-        # Split the text into separate lines, so we can examine them one by one.
-        lines = text_block.splitlines()
-        
-        # Look at each line (with its index i) to try to find the line that contains a ZIP code.
-        for i, line in enumerate(lines):
-            # Does this line match the ZIP code regex (like "IL 60602" or "CA, 94105-1234")?
-            if ZIP_RE.search(line):
-
-                # If this line is one of the "remittance" addresses we don’t care about, skip it.
-                # any(...) runs the inner test for each pattern in REM_ZIP_PATTS.
-                if any(re.search(p, line, re.IGNORECASE) for p in REM_ZIP_PATTS):
-                    continue
-                    
-                # We found a line with a ZIP code. Now check the line *above* it to see if that’s the street.
-                if i > 0:
-                    # Grab the text from the line before and strip off spaces.
-                    street = lines[i-1].strip()
-
-                    # Verify this really looks like a street:
-                    # - either it has a digit (house/building number), OR
-                    # - it contains "P.O. BOX" in some form.
-                    if re.search(r"\d", street) or re.search(r"\bP\.?O\.?\s*BOX\b", street, re.IGNORECASE):
-                        # If it looks good, return a tuple:
-                        # (the street line, the current line with city/state/zip).
-                        return street, line.strip()
-        
-        # If we didn’t find anything, return two empty strings.
-        return "", ""
+        docs = nlp.pipe(
+            (windows[i] for i in todo),
+            batch_size=SPACY_BATCH_SIZE,
+            n_process=SPACY_N_PROCESS,
+        )
+        # Start a loop: repeat these steps once for each item in a collection.
+        for i, doc in zip(todo, docs):
+            results[i] = person_names(doc, max_names)
+    # If an error happens in the 'try' block, this 'except' block runs to handle it.
+    except Exception:
+        # If spaCy throws an error, don’t crash — just return empty lists.
+        return [[] for _ in text_blocks]
+    # Send this value back to whoever called the function ('return' ends the function).
+    return results
 
-    except:
-        # If something went wrong (like bad input), return two empty strings instead of crashing.
+
+# ============= ADDRESS HELPERS =============
+# Define a function named 'extract_address'. Inputs: text_block. These are values the function expects when you call it.
+# A function is a reusable mini-program you can run by its name.
+def extract_address(text_block):
+    """
+    Find the customer address: the first ZIP line (that isn't a remittance address)
+    whose line above looks like a street.
+    Returns a tuple: (street, city_state_zip), or ("", "") if there isn't one.
+    For example: ("123 Main St", "Chicago, IL 60602")
+    Plain regex - this never needed spaCy, so it works whether or not spaCy is installed.
+    """
+
+    # No ZIP anywhere in the text means no address: skip splitting it into lines at all.
+    if not text_block or not ZIP_RE.search(text_block):
         return "", ""
 
+    # Split the text into separate lines, so we can examine them one by one.
+    lines = text_block.splitlines()
+
+    # Look at each line (with its index i) to try to find the line that contains a ZIP code.
+    for i, line in enumerate(lines):
+        # Does this line match the ZIP code regex (like "IL 60602" or "CA, 94105-1234")?
+        if ZIP_RE.search(line):
+
+            # If this line is one of the "remittance" addresses we don’t care about, skip it.
+            # is_remit_zip checks both remittance patterns in one go.
+            if is_remit_zip(line):
+                continue
+
+            # We found a line with a ZIP code. Now check the line *above* it to see if that’s the street.
+            if i > 0:
+                # Grab the text from the line before and strip off spaces.
+                street = lines[i-1].strip()
 
-# Define a function named 'classify_transaction_with_spacy'. Inputs: description. These are values the function expects when you call it.
+                # Verify this really looks like a street:
+                # - either it has a digit (house/building number), OR
+                # - it contains "P.O. BOX" in some form.
+                if DIGIT_RE.search(street) or PO_BOX_RE.search(street):
+                    # If it looks good, return a tuple:
+                    # (the street line, the current line with city/state/zip).
+                    return street, line.strip()
+
+    # If we didn’t find anything, return two empty strings.
+    return "", ""
+
+
+# ============= TRANSACTION CLASSIFICATION =============
+# Keywords for each transaction category, in priority order: if a description has words
+# from two categories, the one listed first wins (e.g. "PAYMENT FEE" is a payment).
+# A keyword with a space in it ("finance charge") must appear as those words in that order, and it
+# beats every single-word keyword: the phrase is more specific than its words ("FINANCE CHARGE" is
+# interest, even though "charge" alone would make it a fee).
+# Save a value into a variable named 'TXN_CATEGORIES' so we can use it later.
+TXN_CATEGORIES = (
+    ("payment",  ("payment", "pmt", "paid", "pay", "remittance", "credit")),
+    ("fee",      ("fee", "charge", "penalty", "cost", "fine")),
+    ("interest", ("interest", "int", "apr", "finance charge")),
+    ("transfer", ("transfer", "xfer", "wire", "ach")),
+    ("advance",  ("advance", "withdrawal", "draw", "debit")),
+)
+# The same table flipped around for fast lookups: word -> (priority, category).
+# Save a value into a variable named 'TXN_KEYWORDS' so we can use it later.
+TXN_KEYWORDS = {w: (rank, cat) for rank, (cat, words) in enumerate(TXN_CATEGORIES) for w in words if " " not in w}
+# The multi-word keywords, checked against the description's words joined back together: (" phrase ", (priority, category)).
+# Save a value into a variable named 'TXN_PHRASES' so we can use it later.
+TXN_PHRASES = tuple((f" {w} ", (rank, cat)) for rank, (cat, words) in enumerate(TXN_CATEGORIES) for w in words if " " in w)
+# Save a value into a variable named 'WORD_RE' so we can use it later (runs of letters/digits, i.e. the words).
+WORD_RE = re.compile(r"\w+")
+
+# Define a function named 'classify_transaction'. Inputs: description. These are values the function expects when you call it.
 # A function is a reusable mini-program you can run by its name.
-def classify_transaction_with_spacy(description):
+# The same few descriptions ("REGULAR PAYMENT", "LATE CHARGE") repeat on every
+# statement, so remember each one's category instead of re-tokenizing it.
+@functools.lru_cache(maxsize=8192)
+def classify_transaction(description):
     """
-    Use spaCy to figure out what kind of transaction this is.
+    Figure out what kind of transaction this is from the words in its description.
     Returns a category string like 'payment', 'fee', 'interest', 'transfer', or 'advance'.
-    If it doesn’t match any, returns 'other'.
+    If it doesn’t match any, returns 'other' (and "" for an empty description).
+    Plain dictionary lookups - no spaCy needed, so this works (and is fast) everywhere.
     """
-
-    # If spaCy wasn’t loaded OR the description text is empty, just return an empty string.
-    if not HAVE_SPACY or not description:
-        return ""
-    
-    try:
-        # Feed the transaction description into spaCy’s nlp() processor.
-        # .lower() makes the text all lowercase so "PAYMENT" and "payment" match the same.
-        doc = nlp(description.lower())
-        
-        # Define sets (groups) of keywords that indicate different categories.
-        # If any of these words appear in the description, we’ll classify accordingly.
-
-        payment_words  = {'payment', 'pmt', 'paid', 'pay', 'remittance', 'credit'}
-        fee_words      = {'fee', 'charge', 'penalty', 'cost', 'fine'}
-        interest_words = {'interest', 'int', 'apr', 'finance charge'}
-        transfer_words = {'transfer', 'xfer', 'wire', 'ach'}
-        advance_words  = {'advance', 'withdrawal', 'draw', 'debit'}
-        
-        # Convert the description into a set of tokens (individual words).
-        # {token.text for token in doc} builds a set, so duplicates are removed.
-        tokens = {token.text for token in doc}
-        
-        # Now check which keyword set overlaps with the tokens.
-        # "&" means “set intersection”: are there any words in common?
-
-        if tokens & payment_words:
-            return "payment"
-        elif tokens & fee_words:
-            return "fee"
-        elif tokens & interest_words:
-            return "interest"
-        elif tokens & transfer_words:
-            return "transfer"
-        elif tokens & advance_words:
-            return "advance"
-        else:
-            # If none of the categories matched, call it "other".
-            return "other"
-
-    except:
-        # If anything goes wrong (e.g. spaCy fails), return an empty string instead of crashing.
+    # Check a condition. If it's True, run the block under this 'if'.
+    if not description:
         return ""
+    # Save a value into a variable named 'best' so we can use it later.
+    best = None
+    # Save a value into a variable named 'words' so we can use it later.
+    words = WORD_RE.findall(description.lower())
+    # Phrases first: any phrase hit wins over the single words (see TXN_CATEGORIES).
+    # Save a value into a variable named 'joined' so we can use it later (spaces at both ends so whole words match).
+    joined = " " + " ".join(words) + " "
+    # Start a loop: repeat these steps once for each item in a collection.
+    for phrase, hit in TXN_PHRASES:
+        # Check a condition. If it's True, run the block under this 'if'.
+        if phrase in joined and (best is None or hit[0] < best[0]):
+            best = hit
+    # Check a condition. If it's True, run the block under this 'if'.
+    if best is not None:
+        # Send this value back to whoever called the function ('return' ends the function).
+        return best[1]
+    # Start a loop: repeat these steps once for each item in a collection.
+    for word in words:
+        # Save a value into a variable named 'hit' so we can use it later.
+        hit = TXN_KEYWORDS.get(word)
+        # Keep the highest-priority category seen so far.
+        if hit is not None and (best is None or hit[0] < best[0]):
+            best = hit
+    # Send this value back to whoever called the function ('return' ends the function).
+    return best[1] if best else "other"
 
 
 # Define a function named 'enhance_customer_extraction'. Inputs: names_regex, street_regex, csz_regex, content. These are values the function expects when you call it.
 # A function is a reusable mini-program you can run by its name.
-def enhance_customer_extraction(names_regex, street_regex, csz_regex, content):
+def enhance_customer_extraction(names_regex, street_regex, csz_regex, content, spacy_names=None):
     """
     Try spaCy first for name extraction, fall back to regex results.
     Combines the best of both approaches.
+    spacy_names can be passed in when the names were already found in a batch
+    (see extract_names_with_spacy_batch); otherwise spaCy runs here on this content.
     """
     # Check a condition. If it's True, run the block under this 'if'.
     if not HAVE_SPACY:
@@ -324,19 +889,23 @@ def enhance_customer_extraction(names_regex, street_regex, csz_regex, content):
     
     # Try to run some code. If it errors, we can handle it without crashing.
     try:
-        # Extract names with spaCy from the area around the address
-        # Save a value into a variable named 'search_window' so we can use it later.
-        search_window = content[:1500]  # Customer info usually in first part
-        # Save a value into a variable named 'spacy_names' so we can use it later.
-        spacy_names = extract_names_with_spacy(search_window)
+        # Check a condition. If it's True, run the block under this 'if'.
+        if spacy_names is None:
+            # Extract names with spaCy from the area around the address
+            # Save a value into a variable named 'search_window' so we can use it later.
+            search_window = content[:1500]  # Customer info usually in first part
+            # Save a value into a variable named 'spacy_names' so we can use it later.
+            spacy_names = extract_names_with_spacy(search_window)
+        # If none of the above conditions were True, do this 'else' part.
+        else:
+            # Copy it, so padding below doesn't change the caller's list.
+            spacy_names = list(spacy_names)
         
         # If spaCy found good names and we have address from regex, combine them
         # Check a condition. If it's True, run the block under this 'if'.
         if len(spacy_names) >= 1 and street_regex and csz_regex:
             # Pad spacy names to 5
-            # Start a loop that repeats while a condition stays True.
-            while len(spacy_names) < 5:
-                spacy_names.append("")
+            spacy_names += [""] * (5 - len(spacy_names))
             # Send this value back to whoever called the function ('return' ends the function).
             return spacy_names[:5], street_regex, csz_regex
         
@@ -352,6 +921,11 @@ def enhance_customer_extraction(names_regex, street_regex, csz_regex, content):
 # Create a Class named 'LoanStatementProcessor'. If you didn't know, a Class is a blueprint for objects (bundles of data + functions).
 # We'll make objects from this Class to organize related behavior and state.
 class LoanStatementProcessor:
+    # The report name printed in every page header of this kind. If it isn't anywhere in the
+    # text, no header can match, so the (slow, line-by-line) HDR scan is skipped.
+    # Save a value into a variable named 'FORM_NAME' so we can use it later.
+    FORM_NAME = "LOAN STATEMENT (BILL)"
+    
     # Save a value into a variable named 'HDR' so we can use it later.
     HDR = re.compile(
         r"^\s*\d{3}-\d{7}\s+CIBC BANK USA\s+LOAN STATEMENT \(BILL\)\s+"
@@ -373,6 +947,64 @@ class LoanStatementProcessor:
         r"RETAIN\s+THIS\s+STATEMENT", r"FOR\s+CUSTOMER\s+ASSISTANCE",
         r"YOUR\s+ACCOUNT\s+NUMBER", r"CALL\s+\d"
     )
+    # All the field starts in ONE matcher, each anchored at the start of the line.
+    # One scan per line instead of one per field name (Hyperscan when installed, one big regex otherwise).
+    # Save a value into a variable named 'FIELD_MATCHER' so we can use it later.
+    FIELD_MATCHER = MultiPatternMatcher(
+        [r"^\s*(?:" + p + r")\b" for p in FIELD_STARTS], re.IGNORECASE
+    )
+    
+    # Account/note numbers, compiled once here instead of on every page.
+    ACCT_RE = re.compile(r"\bAccount\s*Number\s*[: ]+\s*([0-9]+)\b", re.IGNORECASE)
+    NOTE_RE = re.compile(r"\bNote\s*Number\s*[: ]+\s*([0-9]+)\b", re.IGNORECASE)
+    
+    # Header fields. These are written in lowercase WITHOUT re.IGNORECASE: pull_header_fields
+    # lowercases the statement once and searches that copy, which is faster than
+    # case-insensitive matching over and over on the same text.
+    STMT_DATE_RE = re.compile(r"statement\s*date\s*[: ]+\s*([0-9/]{8}|[a-z]{3}\s+\d{2},\s+\d{4})")
+    OFFICER_RE = re.compile(r"\bofficer\s*[: ]+\s*([^\n]+)")
+    BRANCH_RE = re.compile(r"\bbranch\s*number\s*[: ]+\s*([0-9]+)")
+    CURR_BAL_RE = re.compile(r"current\s*balance\s*(" + MONEY_RE + r")")
+    DUE_DATE_RE = re.compile(r"payment\s*due\s*date\s*[: ]+\s*([0-9/]{8}|[a-z]{3}\s+\d{2},\s+\d{4})")
+    AMT_DUE_RE = re.compile(r"amount\s*due\s*(" + MONEY_RE + r")")
+    PAGE_OF_RE = re.compile(r"\bpage\s+(\d+)\s+of\s+(\d+)\b")
+    YTD_INTEREST_RE = re.compile(r"\binterest\s+paid\s+([0-9.,]+)")
+    YTD_ESCROW_INT_RE = re.compile(r"\bescrow\s+interest\s+paid\s+([0-9.,]+)")
+    YTD_UNAPPLIED_RE = re.compile(r"\bunapplied\s+funds\s+([0-9.,]+)")
+    YTD_ESCROW_BAL_RE = re.compile(r"\bescrow\s+balance\s+([0-9.,]+)")
+    YTD_TAXES_RE = re.compile(r"\btaxes\s+disbursed\s+([0-9.,]+)")
+    # The rate line is case-sensitive already and its text is returned as-is, so it runs on the original.
+    RATE_MARGIN_RE = re.compile(r"\*\*\s*([A-Za-z ]+)\+\s*([0-9.]+%)\s*\*\*")
+    
+    # SUMMARY section: where it starts, where it stops, and its two kinds of rows
+    # (a note row with balance/rate/maturity, or a total line like "Interest To 01/31/24").
+    SUMMARY_RE = re.compile(r"^\s*SUMMARY\s*$", re.IGNORECASE | re.MULTILINE)
+    SUMMARY_STOP_RE = re.compile(r"^\s*YEAR-TO-DATE\s+SUMMARY|^\s*RATE\s+INFORMATION", re.IGNORECASE | re.MULTILINE)
+    SUM_ROW_RE = re.compile(
+        r"^\s*([0-9]{5}/[A-Z])\s+([0-9,]+\.\d{2})\s+([0-9.]+)\s+([0-9/]{8}|00/00/00)\s+(.*?)\s+([0-9,$][0-9,]*\.\d{2})\s*$"
+    )
+    SUM_TOTAL_RE = re.compile(
+        r"^\s*(Interest\s+To\s+\d{2}/\d{2}/\d{2}|Total\s+Due\s+On\s+\d{2}/\d{2}/\d{2}|Principal\s+Payment)\s+([0-9,$][0-9,]*\.\d{2})\s*$",
+        re.IGNORECASE
+    )
+    # Both row kinds in one pattern that runs over the whole (newline-normalised) block with finditer,
+    # so the regex engine walks the lines instead of a Python loop. Row first, like before.
+    # Save a value into a variable named 'SUMMARY_LINES_RE' so we can use it later.
+    SUMMARY_LINES_RE = re.compile(
+        in_line(SUM_ROW_RE.pattern) + r"|(?i:" + in_line(SUM_TOTAL_RE.pattern) + r")", re.MULTILINE
+    )
+    # Save a value into a variable named 'HISTORY_RE' so we can use it later.
+    HISTORY_RE = re.compile(r"^\s*LOAN\s+HISTORY\s*$", re.IGNORECASE | re.MULTILINE)
+    
+    # One LOAN HISTORY row: note, posting date, effective date, description, then 5 amounts.
+    # Save a value into a variable named 'HIST_ROW_RE' so we can use it later.
+    HIST_ROW_RE = re.compile(
+        r"^\s*([0-9]{5})\s+([0-9/]{8})\s+([0-9/]{8})\s+(.+?)\s+([0-9,]+\.\d{2})\s+([0-9,]+\.\d{2})"
+        r"\s+([0-9,]+\.\d{2})\s+([0-9,]+\.\d{2})\s+([0-9,]+\.\d{2})\s*$"
+    )
+    # The same row pattern, plus the page-header stop, for running over the whole history block at once.
+    HIST_LINES_RE = re.compile(in_line(HIST_ROW_RE.pattern), re.MULTILINE)
+    HIST_STOP_RE = re.compile(in_line(HDR.pattern), re.MULTILINE)
     
     # Save a value into a variable named 'RIGHT_COL' so we can use it later.
     RIGHT_COL = re.compile(
@@ -384,31 +1016,29 @@ class LoanStatementProcessor:
         re.IGNORECASE
     )
     
-    @classmethod
-    def clean_left_column(cls, ln: str) -> str:
-        # Save a value into a variable named 'ln' so we can use it later.
-        ln = re.sub(cls.RIGHT_COL, "", ln)
-        # Save a value into a variable named 'ln' so we can use it later.
-        ln = re.sub(r"\s+\b\d{3}\b$", "", ln)
-        # Send this value back to whoever called the function ('return' ends the function).
-        return ln.strip()
+    # RIGHT_COL and the trailing 3-digit branch code in ONE pattern, so each line needs one sub():
+    # - a right column, plus the branch code right before it if there is one, OR
+    # - just a branch code at the end of the line.
+    # Save a value into a variable named 'LEFT_CLEAN_RE' so we can use it later.
+    LEFT_CLEAN_RE = re.compile(
+        r"(?:\s+\b\d{3}\b)?" + RIGHT_COL.pattern + r"|" + BRANCH_SUFFIX_RE.pattern,
+        re.IGNORECASE
+    )
     
     @classmethod
     def looks_like_field(cls, ln: str) -> bool:
         # Save a value into a variable named 'up' so we can use it later.
         up = ln.upper().strip()
         # Check a condition. If it's True, run the block under this 'if'.
-        if ":" in up and not re.search(r"\bP\.?O\.?\s*BOX\b", up):
+        if ":" in up and not PO_BOX_RE.search(up):
             # Send this value back to whoever called the function ('return' ends the function).
             return True
-        # Start a loop: repeat these steps once for each item in a collection.
-        for p in cls.FIELD_STARTS:
-            # Check a condition. If it's True, run the block under this 'if'.
-            if re.search(r"^\s*" + p + r"\b", up, re.IGNORECASE):
-                # Send this value back to whoever called the function ('return' ends the function).
-                return True
         # Check a condition. If it's True, run the block under this 'if'.
-        if any(re.search(p, up, re.IGNORECASE) for p in REM_ZIP_PATTS):
+        if cls.FIELD_MATCHER.search(up):
+            # Send this value back to whoever called the function ('return' ends the function).
+            return True
+        # Check a condition. If it's True, run the block under this 'if'.
+        if is_remit_zip(up):
             # Send this value back to whoever called the function ('return' ends the function).
             return True
         # Send this value back to whoever called the function ('return' ends the function).
@@ -417,17 +1047,22 @@ class LoanStatementProcessor:
     @classmethod
     # Define a function named 'find_acct_note'. Inputs: cls, block: str. These are values the function expects when you call it.
     # A function is a reusable mini-program you can run by its name.
-    def find_acct_note(cls, block: str):
+    def find_acct_note(cls, block: str, start: int = 0, end: int = None):
+        # Only look at block[start:end] (the patterns take the bounds directly, so no slice is copied).
+        # Check a condition. If it's True, run the block under this 'if'.
+        if end is None:
+            # Save a value into a variable named 'end' so we can use it later.
+            end = len(block)
         # Save a value into a variable named 'm' so we can use it later.
-        m = re.search(r"Account/Note\s*Number\s*([0-9]+)\s*-\s*([0-9]+)", block, re.IGNORECASE)
+        m = ACCT_NOTE_PAIR_RE.search(block, start, end)
         # Check a condition. If it's True, run the block under this 'if'.
         if m:
             # Send this value back to whoever called the function ('return' ends the function).
             return m.group(1), m.group(2)
         # Save a value into a variable named 'm_acc' so we can use it later.
-        m_acc = re.search(r"\bAccount\s*Number\s*[: ]+\s*([0-9]+)\b", block, re.IGNORECASE)
+        m_acc = cls.ACCT_RE.search(block, start, end)
         # Save a value into a variable named 'm_note' so we can use it later.
-        m_note = re.search(r"\bNote\s*Number\s*[: ]+\s*([0-9]+)\b", block, re.IGNORECASE)
+        m_note = cls.NOTE_RE.search(block, start, end)
         # Send this value back to whoever called the function ('return' ends the function).
         return (m_acc.group(1) if m_acc else ""), (m_note.group(1) if m_note else "")
     
@@ -435,33 +1070,51 @@ class LoanStatementProcessor:
     # Define a function named 'split_pages'. Inputs: cls, text: str. These are values the function expects when you call it.
     # A function is a reusable mini-program you can run by its name.
     def split_pages(cls, text: str):
-        # Save a value into a variable named 'ms' so we can use it later.
-        ms = list(cls.HDR.finditer(text))
-        # Save a value into a variable named 'pages' so we can use it later.
-        pages = []
+        """
+        Yield one page dict at a time (a generator), so the caller never holds a list of every page.
+        A page only records where its body starts and ends in text; nothing is copied out here.
+        """
+        # Check a condition. If it's True, run the block under this 'if'.
+        if cls.FORM_NAME not in text:
+            return
+        # Save a value into a variable named 'prev' so we can use it later (the header before the current one).
+        prev = None
         # Start a loop: repeat these steps once for each item in a collection.
-        for i, m in enumerate(ms):
-            # Save a value into a variable named 'start' so we can use it later.
-            start = m.end()
-            # Save a value into a variable named 'end' so we can use it later.
-            end = ms[i+1].start() if i+1 < len(ms) else len(text)
-            pages.append({
-                "code": m.group(1),
-                "hdate": m.group(2),
-                "page": int(m.group(3)),
-                "body": text[start:end]
-            })
+        for m in cls.HDR.finditer(text):
+            # Check a condition. If it's True, run the block under this 'if'.
+            if prev is not None:
+                # A page runs from the end of its header to the start of the next header.
+                yield cls.page_dict(prev, prev.end(), m.start())
+            # Save a value into a variable named 'prev' so we can use it later.
+            prev = m
+        # Check a condition. If it's True, run the block under this 'if'.
+        if prev is not None:
+            # The last page runs to the end of the text.
+            yield cls.page_dict(prev, prev.end(), len(text))
+    
+    @staticmethod
+    # Define a function named 'page_dict'. Inputs: m, start, end. These are values the function expects when you call it.
+    # A function is a reusable mini-program you can run by its name.
+    def page_dict(m, start, end):
         # Send this value back to whoever called the function ('return' ends the function).
-        return pages
+        return {
+            "code": m.group(1),
+            "hdate": m.group(2),
+            "page": int(m.group(3)),
+            "start": start,
+            "end": end
+        }
     
     @classmethod
-    # Define a function named 'group_statements_in_order'. Inputs: cls, pages. These are values the function expects when you call it.
+    # Define a function named 'group_statements_in_order'. Inputs: cls, pages, text. These are values the function expects when you call it.
     # A function is a reusable mini-program you can run by its name.
-    def group_statements_in_order(cls, pages):
+    def group_statements_in_order(cls, pages, text):
         statements, current = [], None
         # Start a loop: repeat these steps once for each item in a collection.
         for p in pages:
-            acct, note = cls.find_acct_note(p["body"])
+            # Save a value into a variable named 'span' so we can use it later (where this page's body sits in text).
+            span = (p["start"], p["end"])
+            acct, note = cls.find_acct_note(text, *span)
             # Check a condition. If it's True, run the block under this 'if'.
             if acct and note:
                 # Check a condition. If it's True, run the block under this 'if'.
@@ -473,76 +1126,99 @@ class LoanStatementProcessor:
                     "hdate": p["hdate"],
                     "acct": acct,
                     "note": note,
-                    "parts": [p["body"]]
+                    "parts": [span]
                 }
             # If none of the above conditions were True, do this 'else' part.
             else:
                 # Check a condition. If it's True, run the block under this 'if'.
                 if current:
-                    current["parts"].append(p["body"])
+                    current["parts"].append(span)
         # Check a condition. If it's True, run the block under this 'if'.
         if current:
             statements.append(current)
         # Start a loop: repeat these steps once for each item in a collection.
         for st in statements:
-# Combining two tables (DataFrames) together based on shared columns (like a database join).
-            st["content"] = "\n".join(st["parts"])
+            # Copy each page's body out of text only now, for pages that belong to a statement.
+            # pop() removes the page spans once they are joined.
+            st["content"] = "\n".join([text[a:b] for a, b in st.pop("parts")])
         # Send this value back to whoever called the function ('return' ends the function).
         return statements
     
     @classmethod
     # Define a function named 'extract_customer_block'. Inputs: cls, content: str. These are values the function expects when you call it.
     # A function is a reusable mini-program you can run by its name.
-    def extract_customer_block(cls, content: str):
-        # Save a value into a variable named 'raw_lines' so we can use it later.
-        raw_lines = [ln.rstrip() for ln in content.splitlines()]
+    def extract_customer_block(cls, content: str, spacy_names=None):
+        # Split the statement into lines ONCE and clean each one in the same pass.
+        # Save a value into a variable named 'clean' so we can use it later.
+        # (Cleaning a line = drop the right-hand column and branch code with LEFT_CLEAN_RE, then strip.
+        # This is the only place it's done; LEFT_CLEAN_RE.sub is looked up once here.)
+        clean = cls.LEFT_CLEAN_RE.sub
         # Save a value into a variable named 'lines' so we can use it later.
-        lines = [cls.clean_left_column(ln) for ln in raw_lines]
+        lines = [clean("", ln.rstrip()).strip() for ln in content.splitlines()]
+        
+        # Look up the methods used in the loops below once, instead of on every line.
+        # Save values into variables named 'zip_search', 'looks_like_field', 'digit_search' and 'po_box_search'.
+        zip_search, looks_like_field = ZIP_RE.search, cls.looks_like_field
+        digit_search, po_box_search = DIGIT_RE.search, PO_BOX_RE.search
+        
+        # Remember looks_like_field() answers by line number, so no line is checked twice.
+        # Save a value into a variable named 'field_cache' so we can use it later.
+        field_cache = {}
+        # Define a function named 'is_field'. Inputs: k. These are values the function expects when you call it.
+        # A function is a reusable mini-program you can run by its name.
+        def is_field(k):
+            # Check a condition. If it's True, run the block under this 'if'.
+            if k not in field_cache:
+                field_cache[k] = looks_like_field(lines[k])
+            # Send this value back to whoever called the function ('return' ends the function).
+            return field_cache[k]
+        
+        # The customer block is "name / street / city-state-zip", so it always ends on a ZIP line.
+        # ZIP lines are rare: find those first, then only check the two lines above each one.
+        # Save a value into a variable named 'zip_idx' so we can use it later.
+        zip_idx = [j for j in range(2, len(lines)) if zip_search(lines[j]) and not is_remit_zip(lines[j])]
         
         # Start a loop: repeat these steps once for each item in a collection.
-        for i in range(len(lines)-2):
+        for j in zip_idx:
+            # Save a value into a variable named 'i' so we can use it later.
+            i = j-2
             # Save a value into a variable named 'name' so we can use it later.
-            name = lines[i].strip()
+            name = lines[i]
             # Save a value into a variable named 'street' so we can use it later.
-            street = lines[i+1].strip()
+            street = lines[i+1]
             # Save a value into a variable named 'csz' so we can use it later.
-            csz = lines[i+2].strip()
+            csz = lines[j]
             # Check a condition. If it's True, run the block under this 'if'.
-            if not name or not street or not csz:
+            if not name or not street:
                 continue
             # Check a condition. If it's True, run the block under this 'if'.
-            if cls.looks_like_field(name) or cls.looks_like_field(street) or cls.looks_like_field(csz):
+            if not (digit_search(street) or po_box_search(street)):
                 continue
             # Check a condition. If it's True, run the block under this 'if'.
-            if not (re.search(r"\d", street) or re.search(r"\bP\.?O\.?\s*BOX\b", street, re.IGNORECASE)):
-                continue
-            # Check a condition. If it's True, run the block under this 'if'.
-            if not ZIP_RE.search(csz):
-                continue
-            # Check a condition. If it's True, run the block under this 'if'.
-            if any(re.search(p, csz, re.IGNORECASE) for p in REM_ZIP_PATTS):
+            if is_field(j) or is_field(i+1) or is_field(i):
                 continue
             
-            # Save a value into a variable named 'names' so we can use it later.
-            names = [name]
+            # Walk upwards collecting extra name lines (nearest first), then flip them into top-down order.
+            # Save a value into a variable named 'above' so we can use it later.
+            above = []
             # Save a value into a variable named 'k' so we can use it later.
             k = i-1
             # Start a loop that repeats while a condition stays True.
-            while k >= 0 and len(names) < 5:
+            while k >= 0 and len(above) < 4:
                 # Save a value into a variable named 'prev' so we can use it later.
-                prev = cls.clean_left_column(raw_lines[k]).strip()
+                # (lines[] already holds the cleaned, stripped version of each raw line.)
+                prev = lines[k]
                 # Check a condition. If it's True, run the block under this 'if'.
-                if not prev or cls.looks_like_field(prev) or ZIP_RE.search(prev):
+                if not prev or is_field(k) or zip_search(prev):
                     break
-                names.insert(0, prev)
+                above.append(prev)
                 k -= 1
-            
-            # Start a loop that repeats while a condition stays True.
-            while len(names) < 5:
-                names.append("")
+            # Save a value into a variable named 'names' so we can use it later.
+            names = above[::-1] + [name]
+            names += [""] * (5 - len(names))
             
             # Try to enhance with spaCy
-            names, street, csz = enhance_customer_extraction(names[:5], street, csz, content)
+            names, street, csz = enhance_customer_extraction(names[:5], street, csz, content, spacy_names)
             
             # Send this value back to whoever called the function ('return' ends the function).
             return (names, street, csz)
@@ -554,44 +1230,62 @@ class LoanStatementProcessor:
     # Define a function named 'pull_header_fields'. Inputs: cls, content: str. These are values the function expects when you call it.
     # A function is a reusable mini-program you can run by its name.
     def pull_header_fields(cls, content: str):
-        # Define a function named 'grab'. Inputs: pattern: str. These are values the function expects when you call it.
+        # Lowercase the statement ONCE; every header pattern below searches this copy.
+        # Save a value into a variable named 'low' so we can use it later.
+        low = fold_case(content)
+        
+        # Define a function named 'grab'. Inputs: rx (a compiled pattern), key. These are values the function expects when you call it.
         # A function is a reusable mini-program you can run by its name.
-        def grab(pattern: str):
+        def grab(rx, key):
+            # Quick check first: find where the field's label first shows up (a fast plain-text search).
+            # Every match starts with the label, so the regex can start there instead of at the top.
+            # Save a value into a variable named 'pos' so we can use it later.
+            pos = low.find(key)
+            # Check a condition. If it's True, run the block under this 'if'.
+            if pos < 0:
+                return ""
             # Save a value into a variable named 'm' so we can use it later.
-            m = re.search(pattern, content, re.IGNORECASE)
+            m = rx.search(low, pos)
+            # The match was found in the lowercase copy; cut the same span out of the
+            # original so names/months keep their real capitals.
             # Send this value back to whoever called the function ('return' ends the function).
-            return m.group(1).strip() if m else ""
+            return content[m.start(1):m.end(1)].strip() if m else ""
         
-        # Define a function named 'grab_money'. Inputs: pattern: str. These are values the function expects when you call it.
+        # Define a function named 'grab_money'. Inputs: rx (a compiled pattern), key. These are values the function expects when you call it.
         # A function is a reusable mini-program you can run by its name.
-        def grab_money(pattern: str):
+        def grab_money(rx, key):
+            # Save a value into a variable named 'pos' so we can use it later.
+            pos = low.find(key)
+            # Check a condition. If it's True, run the block under this 'if'.
+            if pos < 0:
+                return None
             # Save a value into a variable named 'm' so we can use it later.
-            m = re.search(pattern, content, re.IGNORECASE)
+            m = rx.search(low, pos)
             # Send this value back to whoever called the function ('return' ends the function).
             return m2f(m.group(1)) if m else None
         
         # Save a value into a variable named 'stmt_date' so we can use it later.
-        stmt_date = grab(r"Statement\s*Date\s*[: ]+\s*([0-9/]{8}|[A-Za-z]{3}\s+\d{2},\s+\d{4})")
+        stmt_date = grab(cls.STMT_DATE_RE, "statement")
         # Save a value into a variable named 'officer' so we can use it later.
-        officer = grab(r"\bOfficer\s*[: ]+\s*([^\n]+)")
+        officer = grab(cls.OFFICER_RE, "officer")
         # Save a value into a variable named 'branch' so we can use it later.
-        branch = grab(r"\bBranch\s*Number\s*[: ]+\s*([0-9]+)")
+        branch = grab(cls.BRANCH_RE, "branch")
         # Save a value into a variable named 'curr_bal' so we can use it later.
-        curr_bal = grab_money(r"Current\s*Balance\s*(" + MONEY_RE + r")")
+        curr_bal = grab_money(cls.CURR_BAL_RE, "current")
         # Save a value into a variable named 'due_date' so we can use it later.
-        due_date = grab(r"Payment\s*Due\s*Date\s*[: ]+\s*([0-9/]{8}|[A-Za-z]{3}\s+\d{2},\s+\d{4})")
+        due_date = grab(cls.DUE_DATE_RE, "payment")
         # Save a value into a variable named 'amt_due' so we can use it later.
-        amt_due = grab_money(r"Amount\s*Due\s*(" + MONEY_RE + r")")
+        amt_due = grab_money(cls.AMT_DUE_RE, "amount")
         
         # Save a value into a variable named 'page_info' so we can use it later.
-        page_info = re.findall(r"\bPage\s+(\d+)\s+of\s+(\d+)\b", content, re.IGNORECASE)
+        page_info = cls.PAGE_OF_RE.findall(low)
         # Save a value into a variable named 'total_pages' so we can use it later.
         total_pages = max((int(y) for _, y in page_info), default=None)
         
         # Save a value into a variable named 'rate_type' so we can use it later.
         rate_type = margin = ""
         # Save a value into a variable named 'mrate' so we can use it later.
-        mrate = re.search(r"\*\*\s*([A-Za-z ]+)\+\s*([0-9.]+%)\s*\*\*", content)
+        mrate = cls.RATE_MARGIN_RE.search(content)
         # Check a condition. If it's True, run the block under this 'if'.
         if mrate:
             # Save a value into a variable named 'rate_type' so we can use it later.
@@ -599,24 +1293,17 @@ class LoanStatementProcessor:
             # Save a value into a variable named 'margin' so we can use it later.
             margin = mrate.group(2).strip()
         
-        # Define a function named 'grab_num'. Inputs: pattern: str. These are values the function expects when you call it.
-        # A function is a reusable mini-program you can run by its name.
-        def grab_num(pattern: str):
-            # Save a value into a variable named 'm' so we can use it later.
-            m = re.search(pattern, content, re.IGNORECASE)
-            # Send this value back to whoever called the function ('return' ends the function).
-            return m2f(m.group(1)) if m else None
-        
         # Save a value into a variable named 'y_interest' so we can use it later.
-        y_interest = grab_num(r"\bInterest\s+Paid\s+([0-9.,]+)")
+        # (grab_money works for these too: pull group 1 and turn it into a number.)
+        y_interest = grab_money(cls.YTD_INTEREST_RE, "interest")
         # Save a value into a variable named 'y_escrow_int' so we can use it later.
-        y_escrow_int = grab_num(r"\bEscrow\s+Interest\s+Paid\s+([0-9.,]+)")
+        y_escrow_int = grab_money(cls.YTD_ESCROW_INT_RE, "escrow")
         # Save a value into a variable named 'y_unapplied' so we can use it later.
-        y_unapplied = grab_num(r"\bUnapplied\s+Funds\s+([0-9.,]+)")
+        y_unapplied = grab_money(cls.YTD_UNAPPLIED_RE, "unapplied")
         # Save a value into a variable named 'y_escrow_bal' so we can use it later.
-        y_escrow_bal = grab_num(r"\bEscrow\s+Balance\s+([0-9.,]+)")
+        y_escrow_bal = grab_money(cls.YTD_ESCROW_BAL_RE, "escrow")
         # Save a value into a variable named 'y_taxes_disb' so we can use it later.
-        y_taxes_disb = grab_num(r"\bTaxes\s+Disbursed\s+([0-9.,]+)")
+        y_taxes_disb = grab_money(cls.YTD_TAXES_RE, "taxes")
         
         # Send this value back to whoever called the function ('return' ends the function).
         return {
@@ -643,7 +1330,7 @@ class LoanStatementProcessor:
         # Save a value into a variable named 'rows' so we can use it later.
         rows = []
         # Save a value into a variable named 'm_sum' so we can use it later.
-        m_sum = re.search(r"^\s*SUMMARY\s*$", content, re.IGNORECASE | re.MULTILINE)
+        m_sum = cls.SUMMARY_RE.search(content)
         # Check a condition. If it's True, run the block under this 'if'.
         if not m_sum:
             # Send this value back to whoever called the function ('return' ends the function).
@@ -651,24 +1338,17 @@ class LoanStatementProcessor:
         # Save a value into a variable named 'after' so we can use it later.
         after = content[m_sum.end():]
         # Save a value into a variable named 'stop' so we can use it later.
-        stop = re.search(r"^\s*YEAR-TO-DATE\s+SUMMARY|^\s*RATE\s+INFORMATION", after, re.IGNORECASE | re.MULTILINE)
+        stop = cls.SUMMARY_STOP_RE.search(after)
         # Save a value into a variable named 'block' so we can use it later.
-        block = after[:stop.start()] if stop else after
+        # Every line break becomes "\n" so the ^...$ rows line up with the real lines.
+        # Save a value into a variable named 'block' so we can use it later.
+        block = (after[:stop.start()] if stop else after).translate(LINE_BREAKS_TO_NL)
         
         # Start a loop: repeat these steps once for each item in a collection.
-        for ln in block.splitlines():
-            # Save a value into a variable named 's' so we can use it later.
-            s = ln.rstrip()
-            # Check a condition. If it's True, run the block under this 'if'.
-            if not s.strip():
-                continue
-            # Save a value into a variable named 'm' so we can use it later.
-            m = re.match(
-                r"^\s*([0-9]{5}/[A-Z])\s+([0-9,]+\.\d{2})\s+([0-9.]+)\s+([0-9/]{8}|00/00/00)\s+(.*?)\s+([0-9,$][0-9,]*\.\d{2})\s*$",
-                s
-            )
+        for m in cls.SUMMARY_LINES_RE.finditer(block):
+            # Groups 1-6 are a note row; groups 7-8 are a total line.
             # Check a condition. If it's True, run the block under this 'if'.
-            if m:
+            if m.group(1) is not None:
                 rows.append({
                     "Account_Number": acct,
                     "Note_Number": note,
@@ -680,15 +1360,8 @@ class LoanStatementProcessor:
                     "Description": m.group(5).strip(),
                     "Amount": m2f(m.group(6)),
                 })
-                continue
-            # Save a value into a variable named 'm2' so we can use it later.
-            m2 = re.match(
-# This is a long line. It likely chains several steps together to do work in one go.
-                r"^\s*(Interest\s+To\s+\d{2}/\d{2}/\d{2}|Total\s+Due\s+On\s+\d{2}/\d{2}/\d{2}|Principal\s+Payment)\s+([0-9,$][0-9,]*\.\d{2})\s*$",
-                s, re.IGNORECASE
-            )
-            # Check a condition. If it's True, run the block under this 'if'.
-            if m2:
+            # If none of the above conditions were True, do this 'else' part.
+            else:
                 rows.append({
                     "Account_Number": acct,
                     "Note_Number": note,
@@ -697,8 +1370,8 @@ class LoanStatementProcessor:
                     "Current_Balance": None,
                     "Interest_Rate": None,
                     "Maturity_Date": "",
-                    "Description": m2.group(1).strip(),
-                    "Amount": m2f(m2.group(2)),
+                    "Description": m.group(7).strip(),
+                    "Amount": m2f(m.group(8)),
                 })
         # Send this value back to whoever called the function ('return' ends the function).
         return rows
@@ -710,104 +1383,130 @@ class LoanStatementProcessor:
         # Save a value into a variable named 'rows' so we can use it later.
         rows = []
         # Save a value into a variable named 'm_hist' so we can use it later.
-        m_hist = re.search(r"^\s*LOAN\s+HISTORY\s*$", content, re.IGNORECASE | re.MULTILINE)
+        m_hist = cls.HISTORY_RE.search(content)
         # Check a condition. If it's True, run the block under this 'if'.
         if not m_hist:
             # Send this value back to whoever called the function ('return' ends the function).
             return rows
         # Save a value into a variable named 'after' so we can use it later.
         after = content[m_hist.end():]
+        # Make every line break a plain "\n", so the row pattern's ^ and $ line up with real lines.
+        # Save a value into a variable named 'after' so we can use it later.
+        after = after.translate(LINE_BREAKS_TO_NL)
+        # Rows stop at the next page header.
+        # Save a value into a variable named 'stop' so we can use it later.
+        stop = cls.HIST_STOP_RE.search(after)
+        # Check a condition. If it's True, run the block under this 'if'.
+        if stop is not None:
+            # Save a value into a variable named 'after' so we can use it later.
+            after = after[:stop.start()]
+        # finditer walks the whole block inside the regex engine; only real rows come back.
         # Start a loop: repeat these steps once for each item in a collection.
-        for ln in after.splitlines():
-            # Save a value into a variable named 's' so we can use it later.
-            s = ln.rstrip()
-            # Check a condition. If it's True, run the block under this 'if'.
-            if not s.strip():
-                continue
-            # Save a value into a variable named 'm' so we can use it later.
-            m = re.match(
-# This is a long line. It likely chains several steps together to do work in one go.
-                r"^\s*([0-9]{5})\s+([0-9/]{8})\s+([0-9/]{8})\s+(.+?)\s+([0-9,]+\.\d{2})\s+([0-9,]+\.\d{2})\s+([0-9,]+\.\d{2})\s+([0-9,]+\.\d{2})\s+([0-9,]+\.\d{2})\s*$",
-                s
-            )
-            # Check a condition. If it's True, run the block under this 'if'.
-            if m:
-                # Save a value into a variable named 'desc' so we can use it later.
-                desc = m.group(4).strip()
-                rows.append({
-                    "Account_Number": acct,
-                    "Note_Number": note,
-                    "Header_Date": hdate,
-                    "Customer_Name_1": cust_name_1,
-                    "Hist_Note": m.group(1),
-                    "Posting_Date": m.group(2),
-                    "Effective_Date": m.group(3),
-                    "Transaction_Description": desc,
-                    "Transaction_Category": classify_transaction_with_spacy(desc),
-                    "Principal": m2f(m.group(5)),
-                    "Interest": m2f(m.group(6)),
-                    "LateFees_Others": m2f(m.group(7)),
-                    "Escrow": m2f(m.group(8)),
-                    "Insurance": m2f(m.group(9)),
-                })
-            # Check a condition. If it's True, run the block under this 'if'.
-            if cls.HDR.search(s):
-                break
+        for m in cls.HIST_LINES_RE.finditer(after):
+            # Save a value into a variable named 'g' so we can use it later.
+            g = m.groups()
+            # Save a value into a variable named 'desc' so we can use it later.
+            desc = g[3].strip()
+            rows.append({
+                "Account_Number": acct,
+                "Note_Number": note,
+                "Header_Date": hdate,
+                "Customer_Name_1": cust_name_1,
+                "Hist_Note": g[0],
+                "Posting_Date": g[1],
+                "Effective_Date": g[2],
+                "Transaction_Description": desc,
+                "Transaction_Category": classify_transaction(desc),
+                "Principal": m2f(g[4]),
+                "Interest": m2f(g[5]),
+                "LateFees_Others": m2f(g[6]),
+                "Escrow": m2f(g[7]),
+                "Insurance": m2f(g[8]),
+            })
         # Send this value back to whoever called the function ('return' ends the function).
         return rows
     
     @classmethod
-    # Define a function named 'process'. Inputs: cls, text: str. These are values the function expects when you call it.
+    # Define a function named 'process_statement'. Inputs: cls, st, spacy_names. These are values the function expects when you call it.
+    # A function is a reusable mini-program you can run by its name.
+    def process_statement(cls, st, spacy_names=None):
+        """
+        Build the rows for ONE grouped statement: (header_row, summary_rows, history_rows).
+        Statements don't depend on each other, so this can run in a worker process.
+        """
+        # pop() hands us the statement text and drops it from the dict, so it can be freed once we're done with it.
+        acct, note, hdate, content = st["acct"], st["note"], st["hdate"], st.pop("content")
+        
+        names, street, csz = cls.extract_customer_block(content, spacy_names)
+        n1, n2, n3, n4, n5 = (names + ["","","","",""])[:5]
+        
+        # Save a value into a variable named 'hdr' so we can use it later.
+        hdr = cls.pull_header_fields(content)
+        
+        # Send this value back to whoever called the function ('return' ends the function).
+        return {
+            "Notice_Type": "LOAN STATEMENT",
+            "Notice_Code": "R-06090-002",
+            "Header_Date": hdate,
+            "Account_Number": acct,
+            "Note_Number": note,
+            "Total_Pages": hdr["Total_Pages"],
+            "Statement_Date": hdr["Statement_Date"],
+            "Officer": hdr["Officer"],
+            "Branch_Number": hdr["Branch_Number"],
+            "Customer_Name_1": n1,
+            "Customer_Name_2": n2,
+            "Customer_Name_3": n3,
+            "Customer_Name_4": n4,
+            "Customer_Name_5": n5,
+            "Address_Street": street,
+            "Address_CityStateZip": csz,
+            "Current_Balance": hdr["Current_Balance"],
+            "Payment_Due_Date": hdr["Payment_Due_Date"],
+            "Amount_Due": hdr["Amount_Due"],
+            "Rate_Type": hdr["Rate_Type"],
+            "Rate_Margin": hdr["Rate_Margin"],
+            "YTD_Interest_Paid": hdr["YTD_Interest_Paid"],
+            "YTD_Escrow_Interest_Paid": hdr["YTD_Escrow_Interest_Paid"],
+            "YTD_Unapplied_Funds": hdr["YTD_Unapplied_Funds"],
+            "YTD_Escrow_Balance": hdr["YTD_Escrow_Balance"],
+            "YTD_Taxes_Disbursed": hdr["YTD_Taxes_Disbursed"],
+        }, cls.parse_summary_block(content, acct, note, hdate), cls.parse_history_block(content, acct, note, hdate, n1)
+    
+    @classmethod
+    # Define a function named 'process'. Inputs: cls, text: str, parallel. These are values the function expects when you call it.
     # A function is a reusable mini-program you can run by its name.
-    def process(cls, text: str):
-        # Save a value into a variable named 'pages' so we can use it later.
-        pages = cls.split_pages(text)
+    def process(cls, text: str, parallel: bool = False):
+        # Pages are handed over one at a time (split_pages is a generator), so no page list is ever built.
         # Save a value into a variable named 'statements' so we can use it later.
-        statements = cls.group_statements_in_order(pages)
+        statements = cls.group_statements_in_order(cls.split_pages(text), text)
         
         hdr_rows, sum_rows, hist_rows = [], [], []
         
+        # Find the spaCy names for every statement in one batch (the customer info is in the first part).
+        # This stays in this process, so the workers below never have to load spaCy.
+        # Without spaCy every statement just gets None (regex-only name search).
+        # Save a value into a variable named 'batch_names' so we can use it later.
+        batch_names = (extract_names_with_spacy_batch([st["content"][:1500] for st in statements])
+                       if HAVE_SPACY else [None] * len(statements))
+        
+        # Check a condition. If it's True, run the block under this 'if'.
+        if parallel and len(statements) >= MIN_PARALLEL_STATEMENTS:
+            # Open or manage a resource safely using 'with' (auto-closes files, etc.).
+            with ProcessPoolExecutor(max_workers=MAX_WORKERS) as ex:
+                # map() keeps the results in the same order as the statements.
+                # Save a value into a variable named 'results' so we can use it later.
+                results = list(ex.map(cls.process_statement, statements, batch_names, chunksize=8))
+        # If none of the above conditions were True, do this 'else' part.
+        else:
+            # Save a value into a variable named 'results' so we can use it later.
+            results = map(cls.process_statement, statements, batch_names)
+        
         # Start a loop: repeat these steps once for each item in a collection.
-        for st in statements:
-            acct, note, hdate, content = st["acct"], st["note"], st["hdate"], st["content"]
-            
-            names, street, csz = cls.extract_customer_block(content)
-            n1, n2, n3, n4, n5 = (names + ["","","","",""])[:5]
-            
-            # Save a value into a variable named 'hdr' so we can use it later.
-            hdr = cls.pull_header_fields(content)
-            
-            sum_rows.extend(cls.parse_summary_block(content, acct, note, hdate))
-            hist_rows.extend(cls.parse_history_block(content, acct, note, hdate, n1))
-            
-            hdr_rows.append({
-                "Notice_Type": "LOAN STATEMENT",
-                "Notice_Code": "R-06090-002",
-                "Header_Date": hdate,
-                "Account_Number": acct,
-                "Note_Number": note,
-                "Total_Pages": hdr["Total_Pages"],
-                "Statement_Date": hdr["Statement_Date"],
-                "Officer": hdr["Officer"],
-                "Branch_Number": hdr["Branch_Number"],
-                "Customer_Name_1": n1,
-                "Customer_Name_2": n2,
-                "Customer_Name_3": n3,
-                "Customer_Name_4": n4,
-                "Customer_Name_5": n5,
-                "Address_Street": street,
-                "Address_CityStateZip": csz,
-                "Current_Balance": hdr["Current_Balance"],
-                "Payment_Due_Date": hdr["Payment_Due_Date"],
-                "Amount_Due": hdr["Amount_Due"],
-                "Rate_Type": hdr["Rate_Type"],
-                "Rate_Margin": hdr["Rate_Margin"],
-                "YTD_Interest_Paid": hdr["YTD_Interest_Paid"],
-                "YTD_Escrow_Interest_Paid": hdr["YTD_Escrow_Interest_Paid"],
-                "YTD_Unapplied_Funds": hdr["YTD_Unapplied_Funds"],
-                "YTD_Escrow_Balance": hdr["YTD_Escrow_Balance"],
-                "YTD_Taxes_Disbursed": hdr["YTD_Taxes_Disbursed"],
-            })
+        for hdr, sums, hists in results:
+            hdr_rows.append(hdr)
+            sum_rows.extend(sums)
+            hist_rows.extend(hists)
         
         # Send this value back to whoever called the function ('return' ends the function).
         return hdr_rows, sum_rows, hist_rows
@@ -816,6 +1515,10 @@ class LoanStatementProcessor:
 # Create a Class named 'RevCreditProcessor'. A Class is a blueprint for objects (bundles of data + functions).
 # We'll make objects from this Class to organize related behavior and state.
 class RevCreditProcessor:
+    # Report name from the page header (same idea as LoanStatementProcessor.FORM_NAME).
+    # Save a value into a variable named 'FORM_NAME' so we can use it later.
+    FORM_NAME = "REV. CREDIT STATEMENT"
+    
     # Save a value into a variable named 'HDR' so we can use it later.
     HDR = re.compile(
         r"^\s*\d{3}-\d{7}\s+CIBC BANK USA\s+REV\. CREDIT STATEMENT\s+"
@@ -836,48 +1539,87 @@ class RevCreditProcessor:
         r"^\s*Page\s+\d+\s+of\s+\d+\s*$",
     ]
     
+    # All the "drop this line" patterns (plus the remittance ZIPs), checked together in one pass.
+    # Save a value into a variable named 'DROP_MATCHER' so we can use it later.
+    DROP_MATCHER = MultiPatternMatcher(DROP_PATTS + list(REM_ZIP_PATTS))
+    
+    # Right-hand remittance text that shares a line with the customer block (cut from there to the end).
+    # Save a value into a variable named 'INLINE_NOISE_RE' so we can use it later.
+    INLINE_NOISE_RE = re.compile(r"\s{2,}(?:AMOUNT\s+ENCLOSED|A\s+late\s+fee\s+of).*$", re.IGNORECASE)
+    
+    # "Account Number:" label, then the two ways account + note follow it.
+    ACCT_LABEL_RE = re.compile(r"\bAccount\s*Number\s*:", re.IGNORECASE)
+    ACCT_TWO_RE = re.compile(r"\bAccount\s*Number\s*:\s*([0-9]+)\s+([0-9]+)", re.IGNORECASE)
+    ACCT_DIGITS_RE = re.compile(r"\bAccount\s*Number\s*:\s*([0-9 ]+)", re.IGNORECASE)
+    
+    # Top-of-statement fields (pull_top_fields). Dates come in a long ("Jan 31, 2024") and a short ("01/31/24") form.
+    STMT_DATE_RE = re.compile(r"Statement\s*Date\s+([A-Za-z]{3}\s+\d{2},\s+\d{4})", re.IGNORECASE)
+    STMT_DATE_SHORT_RE = re.compile(r"Statement\s*Date\s*:\s*(\d{2}/\d{2}/\d{2})", re.IGNORECASE)
+    DUE_DATE_RE = re.compile(r"Payment\s*Due\s*Date\s+([A-Za-z]{3}\s+\d{2},\s+\d{4})", re.IGNORECASE)
+    DUE_DATE_SHORT_RE = re.compile(r"Payment\s*Due\s*Date\s*:\s*(\d{2}/\d{2}/\d{2})", re.IGNORECASE)
+    NEW_BAL_RE = re.compile(r"New\s*Statement\s*Balance\s*\$([0-9,]+\.\d{2})", re.IGNORECASE)
+    FEES_UNPAID_RE = re.compile(r"Fees\s*Charged/Unpaid\s*\$([0-9,]+\.\d{2})", re.IGNORECASE)
+    PAST_DUE_RE = re.compile(r"Past\s*Due\s*Amount\s*\$([0-9,]+\.\d{2})", re.IGNORECASE)
+    MIN_PAY_RE = re.compile(r"Minimum\s*Payment\s*Due\s*\$([0-9,]+\.\d{2})", re.IGNORECASE)
+    PERIOD_FEES_RE = re.compile(r"TOTAL\s+FEES\s+FOR\s+THIS\s+PERIOD\s*(" + MONEY_RE + r")", re.IGNORECASE)
+    PERIOD_INT_RE = re.compile(r"TOTAL\s+INTEREST\s+FOR\s+THIS\s+PERIOD\s*(" + MONEY_RE + r")", re.IGNORECASE)
+    YTD_FEES_RE = re.compile(r"Total\s+fees\s+charged\s+in\s+\d{4}\s*(" + MONEY_RE + r")", re.IGNORECASE)
+    YTD_INT_RE = re.compile(r"Total\s+interest\s+charged\s+in\s+\d{4}\s*(" + MONEY_RE + r")", re.IGNORECASE)
+    INT_PAID_YTD_RE = re.compile(r"Total\s+Interest\s+Charges\s+Paid\s+In\s+\d{4}:\s*(" + MONEY_RE + r")", re.IGNORECASE)
+    # The balance summary table header, and the account summary header whose next line holds 5 amounts.
+    BAL_SUMMARY_RE = re.compile(r"Previous\s+Statement.*?Equals\s+Current\s+Statement\s+Balance", re.IGNORECASE | re.DOTALL)
+    ACCT_SUMMARY_RE = re.compile(r"Available\s+Credit.*?Minimum\s+Payment\s+Due\s*\n([^\n]+)", re.IGNORECASE | re.DOTALL)
+    
+    # The transactions table (parse_transactions): where it starts, where it ends, and one table row.
+    TXN_START_RE = re.compile(r"^\s*\|\s*Transactions\s*\|\s*$", re.IGNORECASE | re.MULTILINE)
+    TXN_START_LOOSE_RE = re.compile(r"\bTransactions\b", re.IGNORECASE)
+    TXN_END_RE = re.compile(r"TOTAL\s+FEES\s+FOR\s+THIS\s+PERIOD", re.IGNORECASE)
+    FEES_HDR_RE = re.compile(r"^\s*\|\s*Fees\s*\|\s*$", re.IGNORECASE | re.MULTILINE)
+    # The same line without the ^, for a "| Fees |" that starts right where the search starts
+    # (a search from an offset only lets ^ match after a newline).
+    FEES_HDR_HERE_RE = re.compile(r"\s*\|\s*Fees\s*\|\s*$", re.IGNORECASE | re.MULTILINE)
+    # Trans date, post date, description, then up to 3 amounts (advance, payment, balance).
+    # Each amount has its own group (4, 5, 6), so the row match already hands them over one by one.
+    TXN_ROW_RE = re.compile(r"^\s*(\d{2}/\d{2})?\s*(\d{2}/\d{2})?\s*(.*?)\s*"
+                            r"(?:(" + MONEY_RE + r")(?:\s+(" + MONEY_RE + r"))?(?:\s+(" + MONEY_RE + r"))?)?\s*$")
+    PAY_CREDIT_RE = re.compile(r"payment|credit", re.IGNORECASE)
+    
     @classmethod
     def is_drop(cls, ln: str) -> bool:
-        # Save a value into a variable named 'up' so we can use it later.
-        up = ln.upper()
-        # Check a condition. If it's True, run the block under this 'if'.
-        if any(re.search(p, up, re.IGNORECASE) for p in cls.DROP_PATTS):
-            # Send this value back to whoever called the function ('return' ends the function).
-            return True
-        # Check a condition. If it's True, run the block under this 'if'.
-        if any(re.search(p, up, re.IGNORECASE) for p in REM_ZIP_PATTS):
-            # Send this value back to whoever called the function ('return' ends the function).
-            return True
+        # DROP_MATCHER already ignores case (re.IGNORECASE / Hyperscan CASELESS),
+        # so the line is checked as-is instead of making an uppercase copy first.
         # Send this value back to whoever called the function ('return' ends the function).
-        return False
+        return cls.DROP_MATCHER.search(ln)
     
     @classmethod
     def strip_inline_noise(cls, s: str) -> str:
-        # Save a value into a variable named 's' so we can use it later.
-        s = re.sub(r"\s{2,}AMOUNT\s+ENCLOSED.*$", "", s, flags=re.IGNORECASE)
-        # Save a value into a variable named 's' so we can use it later.
-        s = re.sub(r"\s{2,}A\s+late\s+fee\s+of.*$", "", s, flags=re.IGNORECASE)
+        # Both noise phrases in one pattern: cut the line at whichever comes first.
         # Send this value back to whoever called the function ('return' ends the function).
-        return s.strip()
+        return cls.INLINE_NOISE_RE.sub("", s).strip()
     
     @classmethod
     # Define a function named 'find_acct_note'. Inputs: cls, block: str. These are values the function expects when you call it.
     # A function is a reusable mini-program you can run by its name.
-    def find_acct_note(cls, block: str):
+    def find_acct_note(cls, block: str, start: int = 0, end: int = None):
+        # Only look at block[start:end] (the patterns take the bounds directly, so no slice is copied).
+        # Check a condition. If it's True, run the block under this 'if'.
+        if end is None:
+            # Save a value into a variable named 'end' so we can use it later.
+            end = len(block)
         # Save a value into a variable named 'm' so we can use it later.
-        m = re.search(r"Account/Note\s*Number\s*([0-9]+)\s*-\s*([0-9]+)", block, re.IGNORECASE)
+        m = ACCT_NOTE_PAIR_RE.search(block, start, end)
         # Check a condition. If it's True, run the block under this 'if'.
         if m:
             # Send this value back to whoever called the function ('return' ends the function).
             return m.group(1), m.group(2)
         # Save a value into a variable named 'm' so we can use it later.
-        m = re.search(r"\bAccount\s*Number\s*:\s*([0-9]+)\s+([0-9]+)", block, re.IGNORECASE)
+        m = cls.ACCT_TWO_RE.search(block, start, end)
         # Check a condition. If it's True, run the block under this 'if'.
         if m:
             # Send this value back to whoever called the function ('return' ends the function).
             return m.group(1), m.group(2)
         # Save a value into a variable named 'm' so we can use it later.
-        m = re.search(r"\bAccount\s*Number\s*:\s*([0-9 ]+)", block, re.IGNORECASE)
+        m = cls.ACCT_DIGITS_RE.search(block, start, end)
         # Check a condition. If it's True, run the block under this 'if'.
         if m:
             # Save a value into a variable named 'p' so we can use it later.
@@ -893,52 +1635,72 @@ class RevCreditProcessor:
     # Define a function named 'split_pages'. Inputs: cls, text: str. These are values the function expects when you call it.
     # A function is a reusable mini-program you can run by its name.
     def split_pages(cls, text: str):
-        # Save a value into a variable named 'ms' so we can use it later.
-        ms = list(cls.HDR.finditer(text))
-        # Save a value into a variable named 'pages' so we can use it later.
-        pages = []
+        """
+        Yield one page dict at a time (a generator), so the caller never holds a list of every page.
+        A page only records where its body starts and ends in text; nothing is copied out here.
+        """
+        # Check a condition. If it's True, run the block under this 'if'.
+        if cls.FORM_NAME not in text:
+            return
+        # Save a value into a variable named 'prev' so we can use it later (the header before the current one).
+        prev = None
         # Start a loop: repeat these steps once for each item in a collection.
-        for i, m in enumerate(ms):
-            # Save a value into a variable named 'start' so we can use it later.
-            start = m.end()
-            # Save a value into a variable named 'end' so we can use it later.
-            end = ms[i+1].start() if i+1 < len(ms) else len(text)
-            pages.append({
-                "code": m.group(1),
-                "hdate": m.group(2),
-                "page": int(m.group(3)),
-                "body": text[start:end]
-            })
+        for m in cls.HDR.finditer(text):
+            # Check a condition. If it's True, run the block under this 'if'.
+            if prev is not None:
+                # A page runs from the end of its header to the start of the next header.
+                yield cls.page_dict(prev, prev.end(), m.start())
+            # Save a value into a variable named 'prev' so we can use it later.
+            prev = m
+        # Check a condition. If it's True, run the block under this 'if'.
+        if prev is not None:
+            # The last page runs to the end of the text.
+            yield cls.page_dict(prev, prev.end(), len(text))
+    
+    @staticmethod
+    # Define a function named 'page_dict'. Inputs: m, start, end. These are values the function expects when you call it.
+    # A function is a reusable mini-program you can run by its name.
+    def page_dict(m, start, end):
         # Send this value back to whoever called the function ('return' ends the function).
-        return pages
+        return {
+            "code": m.group(1),
+            "hdate": m.group(2),
+            "page": int(m.group(3)),
+            "start": start,
+            "end": end
+        }
     
     @classmethod
-    # Define a function named 'group_statements'. Inputs: cls, pages. These are values the function expects when you call it.
+    # Define a function named 'group_statements'. Inputs: cls, pages, text. These are values the function expects when you call it.
     # A function is a reusable mini-program you can run by its name.
-    def group_statements(cls, pages):
+    def group_statements(cls, pages, text):
         # Save a value into a variable named 'groups' so we can use it later.
         groups = {}
         # Start a loop: repeat these steps once for each item in a collection.
         for p in pages:
-            acct, note = cls.find_acct_note(p["body"])
+            acct, note = cls.find_acct_note(text, p["start"], p["end"])
             # Save a value into a variable named 'key' so we can use it later.
             key = (acct, note, p["hdate"])
             groups.setdefault(key, {"code": "R-06088-001", "hdate": p["hdate"], "parts": []})
-            groups[key]["parts"].append((p["page"], p["body"]))
+            groups[key]["parts"].append((p["page"], p["start"], p["end"]))
         # Start a loop: repeat these steps once for each item in a collection.
         for k, g in groups.items():
-            g["parts"].sort(key=lambda x: x[0])
-# Combining two tables (DataFrames) together based on shared columns (like a database join).
-            g["content"] = "\n".join(b for _, b in g["parts"])
+            # pop() removes the per-page pieces once they are joined, so each page's text isn't kept twice.
+            parts = g.pop("parts")
+            # Sort the pages by page number.
+            parts.sort(key=itemgetter(0))
+            # Glue the page texts together. A list (not a generator) lets join size the result in one go.
+            # Pages with no account/note number are never processed, so their text is never copied out.
+            g["content"] = "\n".join([text[a:b] for _, a, b in parts]) if (k[0] or k[1]) else ""
         # Send this value back to whoever called the function ('return' ends the function).
         return groups
     
     @classmethod
     # Define a function named 'extract_customer_from_first_page'. Inputs: cls, content: str. These are values the function expects when you call it.
     # A function is a reusable mini-program you can run by its name.
-    def extract_customer_from_first_page(cls, content: str):
+    def extract_customer_from_first_page(cls, content: str, spacy_names=None):
         # Save a value into a variable named 'm_acc' so we can use it later.
-        m_acc = re.search(r"\bAccount\s*Number\s*:", content, re.IGNORECASE)
+        m_acc = cls.ACCT_LABEL_RE.search(content)
         # Check a condition. If it's True, run the block under this 'if'.
         if not m_acc:
             # Send this value back to whoever called the function ('return' ends the function).
@@ -976,7 +1738,7 @@ class RevCreditProcessor:
             # Check a condition. If it's True, run the block under this 'if'.
             if ZIP_RE.search(ln):
                 # Check a condition. If it's True, run the block under this 'if'.
-                if any(re.search(p, ln, re.IGNORECASE) for p in REM_ZIP_PATTS):
+                if is_remit_zip(ln):
                     continue
                 # Save a value into a variable named 'zi' so we can use it later.
                 zi = i
@@ -988,7 +1750,7 @@ class RevCreditProcessor:
         
         street_line = cleaned[zi-1].strip() if zi-1 >= 0 else ""
         # Check a condition. If it's True, run the block under this 'if'.
-        if not (re.search(r"\d", street_line) or re.search(r"\bP\.?O\.?\s*BOX\b", street_line, re.IGNORECASE)):
+        if not (DIGIT_RE.search(street_line) or PO_BOX_RE.search(street_line)):
             # Save a value into a variable named 'j' so we can use it later.
             j = zi-1
             # Save a value into a variable named 'street_line' so we can use it later.
@@ -998,7 +1760,7 @@ class RevCreditProcessor:
                 # Save a value into a variable named 'cand' so we can use it later.
                 cand = cleaned[j].strip()
                 # Check a condition. If it's True, run the block under this 'if'.
-                if re.search(r"\d", cand) or re.search(r"\bP\.?O\.?\s*BOX\b", cand, re.IGNORECASE):
+                if DIGIT_RE.search(cand) or PO_BOX_RE.search(cand):
                     # Save a value into a variable named 'street_line' so we can use it later.
                     street_line = cand
                     break
@@ -1031,19 +1793,19 @@ class RevCreditProcessor:
                 k -= 1
                 continue
             # Save a value into a variable named 'raw' so we can use it later.
-            raw = re.sub(r"\s+\b\d{3}\b$", "", raw).strip()
+            raw = BRANCH_SUFFIX_RE.sub("", raw).strip()
             # Check a condition. If it's True, run the block under this 'if'.
             if not raw or cls.is_drop(raw):
                 break
-            names.insert(0, raw)
+            # Collected bottom-up (nearest line first); flipped into top-down order below.
+            names.append(raw)
             k -= 1
-        
-        # Start a loop that repeats while a condition stays True.
-        while len(names) < 5:
-            names.append("")
+        # Save a value into a variable named 'names' so we can use it later.
+        names = names[::-1]
+        names += [""] * (5 - len(names))
         
         # Try to enhance with spaCy
-        names, street_line, csz = enhance_customer_extraction(names[:5], street_line, csz, content)
+        names, street_line, csz = enhance_customer_extraction(names[:5], street_line, csz, content, spacy_names)
         
         # Send this value back to whoever called the function ('return' ends the function).
         return (names[:5], street_line, csz)
@@ -1053,56 +1815,53 @@ class RevCreditProcessor:
     # A function is a reusable mini-program you can run by its name.
     def pull_top_fields(cls, content: str):
         # Save a value into a variable named 'stmt' so we can use it later.
-        stmt = (re.search(r"Statement\s*Date\s+([A-Za-z]{3}\s+\d{2},\s+\d{4})", content, re.IGNORECASE) or
-# Using Regular Expressions (regex) to find or clean patterns in text (like dates, amounts, IDs).
-                re.search(r"Statement\s*Date\s*:\s*(\d{2}/\d{2}/\d{2})", content, re.IGNORECASE))
+        stmt = cls.STMT_DATE_RE.search(content) or cls.STMT_DATE_SHORT_RE.search(content)
         # Save a value into a variable named 'due' so we can use it later.
-        due = (re.search(r"Payment\s*Due\s*Date\s+([A-Za-z]{3}\s+\d{2},\s+\d{4})", content, re.IGNORECASE) or
-# Using Regular Expressions (regex) to find or clean patterns in text (like dates, amounts, IDs).
-               re.search(r"Payment\s*Due\s*Date\s*:\s*(\d{2}/\d{2}/\d{2})", content, re.IGNORECASE))
+        due = cls.DUE_DATE_RE.search(content) or cls.DUE_DATE_SHORT_RE.search(content)
         # Save a value into a variable named 'stmt_date' so we can use it later.
         stmt_date = stmt.group(1) if stmt else ""
         # Save a value into a variable named 'due_date' so we can use it later.
         due_date = due.group(1) if due else ""
         
         # Save a value into a variable named 'new_bal' so we can use it later.
-        new_bal = m2f((re.search(r"New\s*Statement\s*Balance\s*\$([0-9,]+\.\d{2})", content, re.IGNORECASE) or [None,None])[1])
+        new_bal = m2f((cls.NEW_BAL_RE.search(content) or [None,None])[1])
         # Save a value into a variable named 'fees_unpd' so we can use it later.
-        fees_unpd = m2f((re.search(r"Fees\s*Charged/Unpaid\s*\$([0-9,]+\.\d{2})", content, re.IGNORECASE) or [None,None])[1])
+        fees_unpd = m2f((cls.FEES_UNPAID_RE.search(content) or [None,None])[1])
         # Save a value into a variable named 'past_due' so we can use it later.
-        past_due = m2f((re.search(r"Past\s*Due\s*Amount\s*\$([0-9,]+\.\d{2})", content, re.IGNORECASE) or [None,None])[1])
+        past_due = m2f((cls.PAST_DUE_RE.search(content) or [None,None])[1])
         # Save a value into a variable named 'min_pay' so we can use it later.
-        min_pay = m2f((re.search(r"Minimum\s*Payment\s*Due\s*\$([0-9,]+\.\d{2})", content, re.IGNORECASE) or [None,None])[1])
+        min_pay = m2f((cls.MIN_PAY_RE.search(content) or [None,None])[1])
         
-        # Define a function named 'grab'. Inputs: pattern: str. These are values the function expects when you call it.
+        # Define a function named 'grab'. Inputs: rx (a compiled pattern). These are values the function expects when you call it.
         # A function is a reusable mini-program you can run by its name.
-        def grab(pattern: str):
+        def grab(rx):
             # Save a value into a variable named 'm' so we can use it later.
-            m = re.search(pattern, content, re.IGNORECASE)
+            m = rx.search(content)
             # Send this value back to whoever called the function ('return' ends the function).
             return m2f(m.group(1)) if m else None
         
         # Save a value into a variable named 'pfees' so we can use it later.
-        pfees = grab(r"TOTAL\s+FEES\s+FOR\s+THIS\s+PERIOD\s*(" + MONEY_RE + r")")
+        pfees = grab(cls.PERIOD_FEES_RE)
         # Save a value into a variable named 'pint' so we can use it later.
-        pint = grab(r"TOTAL\s+INTEREST\s+FOR\s+THIS\s+PERIOD\s*(" + MONEY_RE + r")")
+        pint = grab(cls.PERIOD_INT_RE)
         # Save a value into a variable named 'yfees' so we can use it later.
-        yfees = grab(r"Total\s+fees\s+charged\s+in\s+\d{4}\s*(" + MONEY_RE + r")")
+        yfees = grab(cls.YTD_FEES_RE)
         # Save a value into a variable named 'yint' so we can use it later.
-        yint = grab(r"Total\s+interest\s+charged\s+in\s+\d{4}\s*(" + MONEY_RE + r")")
+        yint = grab(cls.YTD_INT_RE)
         # Save a value into a variable named 'tip' so we can use it later.
-        tip = grab(r"Total\s+Interest\s+Charges\s+Paid\s+In\s+\d{4}:\s*(" + MONEY_RE + r")")
+        tip = grab(cls.INT_PAID_YTD_RE)
         
         # Save a value into a variable named 'prev' so we can use it later.
         prev=adv=pay=intr=other=curr=None
         # Save a value into a variable named 'mh' so we can use it later.
-        mh = re.search(r"Previous\s+Statement.*?Equals\s+Current\s+Statement\s+Balance", content, re.IGNORECASE|re.DOTALL)
+        mh = cls.BAL_SUMMARY_RE.search(content)
         # Check a condition. If it's True, run the block under this 'if'.
         if mh:
             # Save a value into a variable named 'tail' so we can use it later.
-            tail = "\n".join(content[mh.end():].splitlines()[:4])
+            # Only the next 4 lines are needed, so cut them out directly instead of splitting the rest of the statement.
+            tail = first_lines(content, mh.end(), 4)
             # Save a value into a variable named 'nums' so we can use it later.
-            nums = re.findall(MONEY_RE, tail)
+            nums = MONEY_PAT.findall(tail)
             # Check a condition. If it's True, run the block under this 'if'.
             if len(nums) >= 6:
                 prev,adv,pay,intr,other,curr = [m2f(x) for x in nums[:6]]
@@ -1110,11 +1869,11 @@ class RevCreditProcessor:
         # Save a value into a variable named 'ac' so we can use it later.
         ac=fcu=cad=pda=mpd=None
         # Save a value into a variable named 'm5' so we can use it later.
-        m5 = re.search(r"Available\s+Credit.*?Minimum\s+Payment\s+Due\s*\n([^\n]+)", content, re.IGNORECASE|re.DOTALL)
+        m5 = cls.ACCT_SUMMARY_RE.search(content)
         # Check a condition. If it's True, run the block under this 'if'.
         if m5:
             # Save a value into a variable named 'amts' so we can use it later.
-            amts = re.findall(MONEY_RE, m5.group(1))
+            amts = MONEY_PAT.findall(m5.group(1))
             # Check a condition. If it's True, run the block under this 'if'.
             if len(amts) >= 5:
                 ac,fcu,cad,pda,mpd = [m2f(x) for x in amts[:5]]
@@ -1130,11 +1889,11 @@ class RevCreditProcessor:
     # A function is a reusable mini-program you can run by its name.
     def parse_transactions(cls, content: str, acct: str, note: str, hdate: str):
         # Save a value into a variable named 'mstart' so we can use it later.
-        mstart = re.search(r"^\s*\|\s*Transactions\s*\|\s*$", content, re.IGNORECASE | re.MULTILINE)
+        mstart = cls.TXN_START_RE.search(content)
         # Check a condition. If it's True, run the block under this 'if'.
         if not mstart:
             # Save a value into a variable named 'mstart' so we can use it later.
-            mstart = re.search(r"\bTransactions\b", content, re.IGNORECASE)
+            mstart = cls.TXN_START_LOOSE_RE.search(content)
         # Check a condition. If it's True, run the block under this 'if'.
         if not mstart:
             # Send this value back to whoever called the function ('return' ends the function).
@@ -1143,36 +1902,75 @@ class RevCreditProcessor:
         start_idx = mstart.end()
         
         # Save a value into a variable named 'mend' so we can use it later.
-        mend = re.search(r"TOTAL\s+FEES\s+FOR\s+THIS\s+PERIOD", content[start_idx:], re.IGNORECASE)
+        # (Searching from start_idx gives positions in content itself, so no slice is copied.)
+        mend = cls.TXN_END_RE.search(content, start_idx)
         # Check a condition. If it's True, run the block under this 'if'.
         if mend:
             # Save a value into a variable named 'end_idx' so we can use it later.
-            end_idx = start_idx + mend.start()
+            end_idx = mend.start()
         # If none of the above conditions were True, do this 'else' part.
         else:
             # Save a value into a variable named 'mfees' so we can use it later.
-            mfees = re.search(r"^\s*\|\s*Fees\s*\|\s*$", content[start_idx:], re.IGNORECASE | re.MULTILINE)
+            # Search from start_idx instead of a copied slice. The slice treated start_idx as the
+            # start of a line, so a "| Fees |" right there is checked first.
+            mfees = cls.FEES_HDR_HERE_RE.match(content, start_idx) or cls.FEES_HDR_RE.search(content, start_idx)
             # Save a value into a variable named 'end_idx' so we can use it later.
-            end_idx = start_idx + (mfees.start() if mfees else len(content) - start_idx)
+            end_idx = mfees.start() if mfees else len(content)
         
         # Save a value into a variable named 'block' so we can use it later.
         block = content[start_idx:end_idx]
         # Save a value into a variable named 'lines' so we can use it later.
-        lines = [ln.rstrip() for ln in block.splitlines() if ln.strip()]
+        # rstrip each line once; a line that is empty after rstrip was blank, so no second strip() is needed.
+        lines = [ln for ln in map(str.rstrip, block.splitlines()) if ln]
         # Save a value into a variable named 'txns' so we can use it later.
         txns = []
+        # Description pieces for each row in txns (same order). Continuation lines get added to
+        # the row's list and joined ONCE at the end, instead of rebuilding the string every line.
+        desc_parts = []
         # Save a value into a variable named 'last' so we can use it later.
         last = None
         
+        # Grab the bound methods once, so the loop doesn't look them up again on every line.
+        row_match = cls.TXN_ROW_RE.match
+        pay_credit_search = cls.PAY_CREDIT_RE.search
+        # (Same for the money converter: a local name is quicker to reach than the module-level m2f.)
+        to_float = m2f
+        
         # Start a loop: repeat these steps once for each item in a collection.
         for raw in lines:
             # Save a value into a variable named 's' so we can use it later.
             s = raw
-            # Save a value into a variable named 'm' so we can use it later.
-            m = re.match(r"^\s*(\d{2}/\d{2})?\s*(\d{2}/\d{2})?\s*(.*?)\s*("
-                        + MONEY_RE + r"(?:\s+" + MONEY_RE + r"){0,2})?\s*$", s)
+            # A line with no "$" and no "/" can't hold an amount or a date, so the row pattern
+            # would only hand back the whole line as the description. Only run it on lines that could have more.
             # Check a condition. If it's True, run the block under this 'if'.
-            if m:
+            if "$" in s or "/" in s:
+                # Save a value into a variable named 'm' so we can use it later.
+                m = row_match(s)
+                # Check a condition. If it's True, run the block under this 'if'.
+                if not m:
+                    # Save a value into a variable named 'cont' so we can use it later.
+                    cont = s.strip()
+                    # Check a condition. If it's True, run the block under this 'if'.
+                    if cont and last:
+                        desc_parts[-1].append(cont)
+                    # If the earlier 'if' was False, check another condition here with 'elif'.
+                    elif cont:
+                        txns.append({
+                            "Account_Number": acct,
+                            "Note_Number": note,
+                            "Header_Date": hdate,
+                            "Trans_Date": "",
+                            "Post_Date": "",
+                            "Description": cont,
+                            "Transaction_Category": "",
+                            "Advances_Debits_or_IntCharge": None,
+                            "Payments_Credits": None,
+                            "Balance_Subject_to_IntRate": None
+                        })
+                        desc_parts.append([cont])
+                        # Save a value into a variable named 'last' so we can use it later.
+                        last = txns[-1]
+                    continue
                 # Save a value into a variable named 'd1' so we can use it later.
                 d1 = (m.group(1) or "").strip()
                 # Save a value into a variable named 'd2' so we can use it later.
@@ -1180,136 +1978,160 @@ class RevCreditProcessor:
                 # Save a value into a variable named 'desc' so we can use it later.
                 desc = (m.group(3) or "").strip()
                 # Save a value into a variable named 'amts' so we can use it later.
-                amts = re.findall(MONEY_RE, m.group(4) or "")
-                # Save a value into a variable named 'adv' so we can use it later.
-                adv=pay=bal=None
-                # Check a condition. If it's True, run the block under this 'if'.
-                if len(amts) == 3:
-                    adv, pay, bal = [m2f(x) for x in amts]
-                # If the earlier 'if' was False, check another condition here with 'elif'.
-                elif len(amts) == 2:
-                    # Check a condition. If it's True, run the block under this 'if'.
-                    if re.search(r"payment|credit", desc, re.IGNORECASE):
-                        pay, bal = [m2f(x) for x in amts]
-                    # If none of the above conditions were True, do this 'else' part.
-                    else:
-                        adv, bal = [m2f(x) for x in amts]
-                # If the earlier 'if' was False, check another condition here with 'elif'.
-                elif len(amts) == 1:
-                    # Save a value into a variable named 'bal' so we can use it later.
-                    bal = m2f(amts[0])
-                
-                # Save a value into a variable named 'row' so we can use it later.
-                row = {
-                    "Account_Number": acct,
-                    "Note_Number": note,
-                    "Header_Date": hdate,
-                    "Trans_Date": d1,
-                    "Post_Date": d2,
-                    "Description": desc,
-                    "Transaction_Category": classify_transaction_with_spacy(desc),
-                    "Advances_Debits_or_IntCharge": adv,
-                    "Payments_Credits": pay,
-                    "Balance_Subject_to_IntRate": bal
-                }
-                txns.append(row)
-                # Save a value into a variable named 'last' so we can use it later.
-                last = row
+                # (The amounts fill groups 4, 5, 6 from the left; unused ones are None.)
+                amts = [a for a in m.group(4, 5, 6) if a]
             # If none of the above conditions were True, do this 'else' part.
             else:
-                # Save a value into a variable named 'cont' so we can use it later.
-                cont = s.strip()
+                # Save a value into a variable named 'd1' (and 'd2') so we can use it later.
+                d1 = d2 = ""
+                # Save a value into a variable named 'desc' so we can use it later.
+                desc = s.strip()
+                # Save a value into a variable named 'amts' so we can use it later.
+                amts = []
+            
+            # Save a value into a variable named 'adv' so we can use it later.
+            adv=pay=bal=None
+            # Check a condition. If it's True, run the block under this 'if'.
+            if len(amts) == 3:
+                adv, pay, bal = map(to_float, amts)
+            # If the earlier 'if' was False, check another condition here with 'elif'.
+            elif len(amts) == 2:
                 # Check a condition. If it's True, run the block under this 'if'.
-                if cont and last:
-                    last["Description"] = (last["Description"] + " " + cont).strip()
-                    # Re-classify with updated description
-                    last["Transaction_Category"] = classify_transaction_with_spacy(last["Description"])
-                # If the earlier 'if' was False, check another condition here with 'elif'.
-                elif cont:
-                    txns.append({
-                        "Account_Number": acct,
-                        "Note_Number": note,
-                        "Header_Date": hdate,
-                        "Trans_Date": "",
-                        "Post_Date": "",
-                        "Description": cont,
-                        "Transaction_Category": classify_transaction_with_spacy(cont),
-                        "Advances_Debits_or_IntCharge": None,
-                        "Payments_Credits": None,
-                        "Balance_Subject_to_IntRate": None
-                    })
-                    # Save a value into a variable named 'last' so we can use it later.
-                    last = txns[-1]
+                if pay_credit_search(desc):
+                    pay, bal = map(to_float, amts)
+                # If none of the above conditions were True, do this 'else' part.
+                else:
+                    adv, bal = map(to_float, amts)
+            # If the earlier 'if' was False, check another condition here with 'elif'.
+            elif len(amts) == 1:
+                # Save a value into a variable named 'bal' so we can use it later.
+                bal = to_float(amts[0])
+            
+            # Save a value into a variable named 'row' so we can use it later.
+            row = {
+                "Account_Number": acct,
+                "Note_Number": note,
+                "Header_Date": hdate,
+                "Trans_Date": d1,
+                "Post_Date": d2,
+                "Description": desc,
+                "Transaction_Category": "",
+                "Advances_Debits_or_IntCharge": adv,
+                "Payments_Credits": pay,
+                "Balance_Subject_to_IntRate": bal
+            }
+            txns.append(row)
+            desc_parts.append([desc])
+            # Save a value into a variable named 'last' so we can use it later.
+            last = row
+        # Join each row's description pieces together (skipping empty ones) in a single step.
+        # Start a loop: repeat these steps once for each item in a collection.
+        for t, parts in zip(txns, desc_parts):
+            t["Description"] = " ".join(p for p in parts if p)
+        # Classify each description once continuation lines have been joined on.
+        # Start a loop: repeat these steps once for each item in a collection.
+        for t in txns:
+            t["Transaction_Category"] = classify_transaction(t["Description"])
         # Send this value back to whoever called the function ('return' ends the function).
         return txns
     
     @classmethod
-    # Define a function named 'process'. Inputs: cls, text: str. These are values the function expects when you call it.
+    # Define a function named 'process_statement'. Inputs: cls, key, content, spacy_names. These are values the function expects when you call it.
     # A function is a reusable mini-program you can run by its name.
-    def process(cls, text: str):
-        # Save a value into a variable named 'pages' so we can use it later.
-        pages = cls.split_pages(text)
+    def process_statement(cls, key, content, spacy_names=None):
+        """
+        Build the rows for ONE grouped statement: (header_row, transaction_rows).
+        key is (acct, note, hdate). Statements don't depend on each other, so this can run in a worker process.
+        """
+        acct, note, hdate = key
+        names, street, csz = cls.extract_customer_from_first_page(content, spacy_names)
+        n1, n2, n3, n4, n5 = (names + ["", "", "", "", ""])[:5]
+        
+        (stmt_date, due_date, new_bal, fees_unpd, past_due, min_pay,
+         ac, fcu, cad, pda, mpd,
+         pfees, pint, yfees, yint, tip,
+         prev, adv, pay, intr, other, curr) = cls.pull_top_fields(content)
+        
+        # Save a value into a variable named 'txns' so we can use it later.
+        txns = cls.parse_transactions(content, acct, note, hdate)
+        
+        # Send this value back to whoever called the function ('return' ends the function).
+        return {
+            "Notice_Type": "REV. CREDIT STATEMENT",
+            "Notice_Code": "R-06088-001",
+            "Header_Date": hdate,
+            "Account_Number": acct,
+            "Note_Number": note,
+            "Statement_Date": stmt_date,
+            "Payment_Due_Date": due_date,
+            "Customer_Name_1": n1,
+            "Customer_Name_2": n2,
+            "Customer_Name_3": n3,
+            "Customer_Name_4": n4,
+            "Customer_Name_5": n5,
+            "Address_Street": street,
+            "Address_CityStateZip": csz,
+            "New_Statement_Balance": new_bal,
+            "Fees_Charged_Unpaid_top": fees_unpd,
+            "Past_Due_Amount_top": past_due,
+            "Minimum_Payment_Due_top": min_pay,
+            "Available_Credit": ac,
+            "Fees_Charged_Unpaid": fcu,
+            "Current_Amount_Due": cad,
+            "Past_Due_Amount": pda,
+            "Minimum_Payment_Due": mpd,
+            "Period_Fees_Total": pfees,
+            "Period_Interest_Total": pint,
+            "YTD_Fees": yfees,
+            "YTD_Interest": yint,
+            "Total_Interest_Charges_Paid_YTD": tip,
+            "Previous_Statement_Balance": prev,
+            "Advances_Debits": adv,
+            "Payments_Credits": pay,
+            "Interest_Charge": intr,
+            "Other_Charges": other,
+            "Current_Statement_Balance": curr,
+        }, txns
+    
+    @classmethod
+    # Define a function named 'process'. Inputs: cls, text: str, parallel. These are values the function expects when you call it.
+    # A function is a reusable mini-program you can run by its name.
+    def process(cls, text: str, parallel: bool = False):
+        # Pages are handed over one at a time (split_pages is a generator), so no page list is ever built.
         # Save a value into a variable named 'groups' so we can use it later.
-        groups = cls.group_statements(pages)
+        groups = cls.group_statements(cls.split_pages(text), text)
         
         header_rows, txn_rows = [], []
         
+        # Only pages where an account or note number was found make a statement.
+        # Save a value into a variable named 'keys' so we can use it later.
+        keys = [k for k in groups if k[0] or k[1]]
+        # pop() drops each statement's text from its group, so it can be freed once that statement is done.
+        # Save a value into a variable named 'contents' so we can use it later.
+        contents = [groups[k].pop("content") for k in keys]
+        
+        # Find the spaCy names for every statement in one batch (the customer info is in the first part).
+        # This stays in this process, so the workers below never have to load spaCy.
+        # Save a value into a variable named 'batch_names' so we can use it later.
+        batch_names = (extract_names_with_spacy_batch([c[:1500] for c in contents])
+                       if HAVE_SPACY else [None] * len(keys))
+        
+        # Check a condition. If it's True, run the block under this 'if'.
+        if parallel and len(keys) >= MIN_PARALLEL_STATEMENTS:
+            # Open or manage a resource safely using 'with' (auto-closes files, etc.).
+            with ProcessPoolExecutor(max_workers=MAX_WORKERS) as ex:
+                # map() keeps the results in the same order as the statements.
+                # Save a value into a variable named 'results' so we can use it later.
+                results = list(ex.map(cls.process_statement, keys, contents, batch_names, chunksize=8))
+        # If none of the above conditions were True, do this 'else' part.
+        else:
+            # Save a value into a variable named 'results' so we can use it later.
+            results = map(cls.process_statement, keys, contents, batch_names)
+        
         # Start a loop: repeat these steps once for each item in a collection.
-        for (acct, note, hdate), g in groups.items():
-            # Check a condition. If it's True, run the block under this 'if'.
-            if not acct and not note:
-                continue
-            # Save a value into a variable named 'content' so we can use it later.
-            content = g["content"]
-            
-            names, street, csz = cls.extract_customer_from_first_page(content)
-            n1, n2, n3, n4, n5 = (names + ["", "", "", "", ""])[:5]
-            
-            (stmt_date, due_date, new_bal, fees_unpd, past_due, min_pay,
-             ac, fcu, cad, pda, mpd,
-             pfees, pint, yfees, yint, tip,
-             prev, adv, pay, intr, other, curr) = cls.pull_top_fields(content)
-            
-            # Save a value into a variable named 'txns' so we can use it later.
-            txns = cls.parse_transactions(content, acct, note, hdate)
+        for hdr, txns in results:
+            header_rows.append(hdr)
             txn_rows.extend(txns)
-            
-            header_rows.append({
-                "Notice_Type": "REV. CREDIT STATEMENT",
-                "Notice_Code": "R-06088-001",
-                "Header_Date": hdate,
-                "Account_Number": acct,
-                "Note_Number": note,
-                "Statement_Date": stmt_date,
-                "Payment_Due_Date": due_date,
-                "Customer_Name_1": n1,
-                "Customer_Name_2": n2,
-                "Customer_Name_3": n3,
-                "Customer_Name_4": n4,
-                "Customer_Name_5": n5,
-                "Address_Street": street,
-                "Address_CityStateZip": csz,
-                "New_Statement_Balance": new_bal,
-                "Fees_Charged_Unpaid_top": fees_unpd,
-                "Past_Due_Amount_top": past_due,
-                "Minimum_Payment_Due_top": min_pay,
-                "Available_Credit": ac,
-                "Fees_Charged_Unpaid": fcu,
-                "Current_Amount_Due": cad,
-                "Past_Due_Amount": pda,
-                "Minimum_Payment_Due": mpd,
-                "Period_Fees_Total": pfees,
-                "Period_Interest_Total": pint,
-                "YTD_Fees": yfees,
-                "YTD_Interest": yint,
-                "Total_Interest_Charges_Paid_YTD": tip,
-                "Previous_Statement_Balance": prev,
-                "Advances_Debits": adv,
-                "Payments_Credits": pay,
-                "Interest_Charge": intr,
-                "Other_Charges": other,
-                "Current_Statement_Balance": curr,
-            })
         
         # Send this value back to whoever called the function ('return' ends the function).
         return header_rows, txn_rows
@@ -1318,29 +2140,45 @@ class RevCreditProcessor:
 # Create a Class named 'AdviceOfRateChangeProcessor'. A Class is a blueprint for objects (bundles of data + functions).
 # We'll make objects from this Class to organize related behavior and state.
 class AdviceOfRateChangeProcessor:
+    # Report name from the page header (same idea as LoanStatementProcessor.FORM_NAME).
+    # Save a value into a variable named 'FORM_NAME' so we can use it later.
+    FORM_NAME = "ADVICE OF RATE CHANGE"
+    
     # Save a value into a variable named 'HDR' so we can use it later.
     HDR = re.compile(
         r"^\s*\d{3}-\d{7}\s+CIBC BANK USA\s+ADVICE OF RATE CHANGE\s+(R-\d{5}-\d{3})\s+(\d{2}-\d{2}-\d{2})\s+PAGE\s+(\d+)\s*$",
         re.MULTILINE
     )
     
-    @staticmethod
-    def clean_tail(s: str) -> str:
-        # Save a value into a variable named 's' so we can use it later.
-        s = re.sub(r"\s+Account\s*Number\s*:.*$", "", s, flags=re.IGNORECASE)
-        # Save a value into a variable named 's' so we can use it later.
-        s = re.sub(r"\s+Note\s*Number\s*:.*$", "", s, flags=re.IGNORECASE)
+    # "from 7.25% to 7.50% on 01-15-24": old rate, new rate, date of the change.
+    # Save a value into a variable named 'RATE_RE' so we can use it later.
+    RATE_RE = re.compile(r"from\s+([0-9.]+)%\s+to\s+([0-9.]+)%\s+on\s+(\d{2}-\d{2}-\d{2})", re.IGNORECASE)
+    
+    # Save a value into a variable named 'NOISE' so we can use it later.
+    NOISE = ("CIBC BANK USA", "ADVICE OF RATE CHANGE", "PAGE")
+    # Header words that mean a line is not a name. One case-insensitive search per line
+    # instead of uppercasing it and checking each word.
+    # Save a value into a variable named 'NOISE_RE' so we can use it later.
+    NOISE_RE = re.compile("|".join(map(re.escape, NOISE)), re.IGNORECASE)
+    
+    # Right-hand labels that share a line with the name/address (cut from the first one to the end).
+    # All of them in one pattern, so each line is scanned once instead of once per label.
+    # Save a value into a variable named 'TAIL_RE' so we can use it later.
+    TAIL_RE = re.compile(r"\s+(?:Account\s*Number|Note\s*Number)\s*:.*$", re.IGNORECASE)
+    
+    @classmethod
+    def clean_tail(cls, s: str) -> str:
         # Send this value back to whoever called the function ('return' ends the function).
-        return s.strip()
+        return cls.TAIL_RE.sub("", s, 1).strip()
     
     @classmethod
     # Define a function named 'extract_names_address'. Inputs: cls, page_body: str. These are values the function expects when you call it.
     # A function is a reusable mini-program you can run by its name.
     def extract_names_address(cls, page_body: str):
-        # Save a value into a variable named 'lines' so we can use it later.
-        lines = [ln.rstrip() for ln in page_body.splitlines()]
-        # Save a value into a variable named 'zi' so we can use it later.
-        zi = next((i for i, ln in enumerate(lines) if ZIP_RE.search(ln)), -1)
+        # Save a value into a variable named 'lines' so we can use it later (only the lines up to the ZIP line are needed).
+        lines = [ln.rstrip() for ln in lines_through_zip(page_body)]
+        # Save a value into a variable named 'zi' so we can use it later (the ZIP line is the last one).
+        zi = len(lines) - 1
         # Check a condition. If it's True, run the block under this 'if'.
         if zi <= 0:
             # Send this value back to whoever called the function ('return' ends the function).
@@ -1353,10 +2191,8 @@ class AdviceOfRateChangeProcessor:
         start = max(0, (zi - 1) - 7)
         # Save a value into a variable named 'candidates' so we can use it later.
         candidates = [cls.clean_tail(ln) for ln in lines[start:zi-1] if ln.strip()]
-        # Save a value into a variable named 'noise' so we can use it later.
-        noise = ("CIBC BANK USA", "ADVICE OF RATE CHANGE", "PAGE")
         # Save a value into a variable named 'names' so we can use it later.
-        names = [ln for ln in candidates if not any(n in ln.upper() for n in noise)][-5:]
+        names = [ln for ln in candidates if not cls.NOISE_RE.search(ln)][-5:]
         
         # Try to enhance with spaCy
         names, street, csz = enhance_customer_extraction(names, street, csz, page_body)
@@ -1365,13 +2201,15 @@ class AdviceOfRateChangeProcessor:
         return names, street, csz
     
     @classmethod
-    # Define a function named 'process'. Inputs: cls, text: str. These are values the function expects when you call it.
+    # Define a function named 'process'. Inputs: cls, text: str, blank_pages: list. These are values the function expects when you call it.
     # A function is a reusable mini-program you can run by its name.
-    def process(cls, text: str):
+    # blank_pages (optional): a list that gets one (code, header date, page) entry per blank page skipped.
+    def process(cls, text: str, blank_pages=None):
         # Save a value into a variable named 'records' so we can use it later.
         records = []
         # Save a value into a variable named 'matches' so we can use it later.
-        matches = list(cls.HDR.finditer(text))
+        # (A quick plain-text check first: no report name, no pages of this kind to find.)
+        matches = list(cls.HDR.finditer(text)) if cls.FORM_NAME in text else []
         
         # Start a loop: repeat these steps once for each item in a collection.
         for i, m in enumerate(matches):
@@ -1386,20 +2224,28 @@ class AdviceOfRateChangeProcessor:
             end = matches[i+1].start() if i+1 < len(matches) else len(text)
             # Save a value into a variable named 'body' so we can use it later.
             body = text[start:end]
+            # Skip pages with no text at all (nothing to extract). No record is made for them;
+            # the caller can count them through blank_pages for the run summary.
+            # Check a condition. If it's True, run the block under this 'if'.
+            if not page_has_text(body):
+                # Check a condition. If it's True, run the block under this 'if'.
+                if blank_pages is not None:
+                    blank_pages.append((code, hdr_date, page_no))
+                continue
             
             names, street, csz = cls.extract_names_address(body)
             
             # Save a value into a variable named 'acct_m' so we can use it later.
-            acct_m = re.search(r"Account\s*Number\s*:\s*([0-9 ]+)", body, re.IGNORECASE)
+            acct_m = ACCT_NUMBER_RE.search(body)
             # Save a value into a variable named 'note_m' so we can use it later.
-            note_m = re.search(r"Note\s*Number\s*:\s*([0-9 ]+)", body, re.IGNORECASE)
+            note_m = NOTE_NUMBER_RE.search(body)
             # Save a value into a variable named 'acct_num' so we can use it later.
             acct_num = acct_m.group(1).replace(" ","") if acct_m else ""
             # Save a value into a variable named 'note_num' so we can use it later.
             note_num = note_m.group(1).replace(" ","") if note_m else ""
             
             # Save a value into a variable named 'rate' so we can use it later.
-            rate = re.search(r"from\s+([0-9.]+)%\s+to\s+([0-9.]+)%\s+on\s+(\d{2}-\d{2}-\d{2})", body, re.IGNORECASE)
+            rate = cls.RATE_RE.search(body)
             # Save a value into a variable named 'prev_rate' so we can use it later.
             prev_rate = float(rate.group(1)) if rate else None
             # Save a value into a variable named 'curr_rate' so we can use it later.
@@ -1435,6 +2281,10 @@ class AdviceOfRateChangeProcessor:
 # Create a Class named 'PayoffNoticeProcessor'. A Class is a blueprint for objects (bundles of data + functions).
 # We'll make objects from this Class to organize related behavior and state.
 class PayoffNoticeProcessor:
+    # Report name from the page header (same idea as LoanStatementProcessor.FORM_NAME).
+    # Save a value into a variable named 'FORM_NAME' so we can use it later.
+    FORM_NAME = "PAYOFF NOTICE TO PAYEE"
+    
     # Save a value into a variable named 'HDR' so we can use it later.
     HDR = re.compile(
         r"^\s*\d{3}-\d{7}\s+CIBC BANK USA\s+PAYOFF NOTICE TO PAYEE\s+"
@@ -1442,55 +2292,52 @@ class PayoffNoticeProcessor:
         re.MULTILINE
     )
     
-    @staticmethod
-    def clean_tail(s: str) -> str:
-        # Save a value into a variable named 's' so we can use it later.
-        s = re.sub(r"\s+Ref\s*No\..*$", "", s, flags=re.IGNORECASE)
-        # Save a value into a variable named 's' so we can use it later.
-        s = re.sub(r"\s+Account\s*:.*$", "", s, flags=re.IGNORECASE)
-        # Save a value into a variable named 's' so we can use it later.
-        s = re.sub(r"\s+Note\s*:.*$", "", s, flags=re.IGNORECASE)
-        # Save a value into a variable named 's' so we can use it later.
-        s = re.sub(r"\s+Issue\s*Date\s*:.*$", "", s, flags=re.IGNORECASE)
-        # Save a value into a variable named 's' so we can use it later.
-        s = re.sub(r"\s+Acct\s*Name\s*:.*$", "", s, flags=re.IGNORECASE)
+    # Notice fields (process). Compiled once here instead of on every page.
+    NOTICE_DATE_RE = re.compile(r"\bDate\s*:\s*([0-9/]{8})")
+    REF_NO_RE = re.compile(r"Ref\s*No\.\s+([^\n]+)", re.IGNORECASE)
+    ACCOUNT_RE = re.compile(r"\bAccount\s*:\s*([0-9 ]+)", re.IGNORECASE)
+    NOTE_RE = re.compile(r"\bNote\s*:\s*([0-9 ]+)", re.IGNORECASE)
+    ISSUE_DATE_RE = re.compile(r"Issue\s*Date\s*:\s*([0-9/]{8})", re.IGNORECASE)
+    ACCT_NAME_RE = re.compile(r"Acct\s*Name\s*:\s*(.+)", re.IGNORECASE)
+    PROPERTY_RE = re.compile(r"Property\s*At\s*:\s*\n\s*(.+)\n\s*(.+)", re.IGNORECASE)
+    # The notice comment runs from the "The loan shown below..." line up to the "Ref No." line.
+    COMMENT_START_RE = re.compile(r"The loan shown below.+?(?=\n)", re.IGNORECASE | re.DOTALL)
+    COMMENT_END_RE = re.compile(r"\n\s*Ref\s*No\.\s", re.IGNORECASE | re.DOTALL)
+    
+    # Right-hand labels that share a line with the payee address, in one pattern (see AdviceOfRateChangeProcessor.TAIL_RE).
+    # Save a value into a variable named 'TAIL_RE' so we can use it later.
+    TAIL_RE = re.compile(r"\s+(?:Ref\s*No\.|Account\s*:|Note\s*:|Issue\s*Date\s*:|Acct\s*Name\s*:).*$", re.IGNORECASE)
+    
+    @classmethod
+    def clean_tail(cls, s: str) -> str:
         # Send this value back to whoever called the function ('return' ends the function).
-        return s.strip()
+        return cls.TAIL_RE.sub("", s, 1).strip()
     
     @classmethod
     # Define a function named 'extract_payee_address'. Inputs: cls, page_body: str. These are values the function expects when you call it.
     # A function is a reusable mini-program you can run by its name.
     def extract_payee_address(cls, page_body: str):
         # Save a value into a variable named 'lines' so we can use it later.
-        lines = [ln.rstrip() for ln in page_body.splitlines() if ln.strip()]
-        # Start a loop: repeat these steps once for each item in a collection.
-        for i, ln in enumerate(lines):
-            # Check a condition. If it's True, run the block under this 'if'.
-            if ZIP_RE.search(ln):
-                # Save a value into a variable named 'csz' so we can use it later.
-                csz = cls.clean_tail(ln.strip())
-                street = cls.clean_tail(lines[i-1].strip()) if i-1 >= 0 else ""
-                name = cls.clean_tail(lines[i-2].strip()) if i-2 >= 0 else ""
-                
-                # Try spaCy enhancement for county name
-                # Check a condition. If it's True, run the block under this 'if'.
-                if HAVE_SPACY and name:
-                    # Save a value into a variable named 'spacy_names' so we can use it later.
-                    spacy_names = extract_names_with_spacy(page_body[:500], max_names=1)
-                    # Check a condition. If it's True, run the block under this 'if'.
-                    if spacy_names and "COUNTY" in name.upper():
-                        # Keep the county designation but maybe improve name extraction
-                        pass
-                
-                # Send this value back to whoever called the function ('return' ends the function).
-                return name, (street + ("\n" if street and csz else "") + csz).strip()
+        # Only the lines up to the first ZIP line matter; rstrip each once and drop the blank ones.
+        lines = [ln for ln in map(str.rstrip, lines_through_zip(page_body)) if ln]
+        # Check a condition. If it's True, run the block under this 'if'.
+        if not lines:
+            # Send this value back to whoever called the function ('return' ends the function).
+            return "", ""
+        # Save a value into a variable named 'i' so we can use it later (the ZIP line is the last one left).
+        i = len(lines) - 1
+        # Save a value into a variable named 'csz' so we can use it later.
+        csz = cls.clean_tail(lines[i].strip())
+        street = cls.clean_tail(lines[i-1].strip()) if i-1 >= 0 else ""
+        name = cls.clean_tail(lines[i-2].strip()) if i-2 >= 0 else ""
+        
         # Send this value back to whoever called the function ('return' ends the function).
-        return "", ""
+        return name, (street + ("\n" if street and csz else "") + csz).strip()
     
     @staticmethod
-    def get_between(body: str, start_pat: str, end_pat: str) -> str:
+    def get_between(body: str, start_rx, end_rx) -> str:
         # Save a value into a variable named 's' so we can use it later.
-        s = re.search(start_pat, body, re.IGNORECASE | re.DOTALL)
+        s = start_rx.search(body)
         # Check a condition. If it's True, run the block under this 'if'.
         if not s:
             # Send this value back to whoever called the function ('return' ends the function).
@@ -1498,7 +2345,8 @@ class PayoffNoticeProcessor:
         # Save a value into a variable named 'start_idx' so we can use it later.
         start_idx = s.start()
         # Save a value into a variable named 'e' so we can use it later.
-        e = re.search(end_pat, body[start_idx:], re.IGNORECASE | re.DOTALL)
+        # (Searching from start_idx gives positions in body itself, so no slice is copied.)
+        e = end_rx.search(body, start_idx)
         # Check a condition. If it's True, run the block under this 'if'.
         if not e:
             # Save a value into a variable named 'chunk' so we can use it later.
@@ -1506,29 +2354,32 @@ class PayoffNoticeProcessor:
         # If none of the above conditions were True, do this 'else' part.
         else:
             # Save a value into a variable named 'chunk' so we can use it later.
-            chunk = body[start_idx:start_idx + e.start()]
+            chunk = body[start_idx:e.start()]
         # Save a value into a variable named 'lines' so we can use it later.
-        lines = [ln.rstrip() for ln in chunk.splitlines()]
+        # rstrip each line once; the empty ones were blank lines, so drop them.
+        lines = [ln for ln in map(str.rstrip, chunk.splitlines()) if ln]
         # Send this value back to whoever called the function ('return' ends the function).
-        return "\n".join([ln for ln in lines if ln.strip()]).strip()
+        return "\n".join(lines).strip()
     
     @staticmethod
-    # Define a function named 'first_group'. Inputs: rx, body, flags=0, default="". These are values the function expects when you call it.
+    # Define a function named 'first_group'. Inputs: rx (a compiled pattern), body, default="". These are values the function expects when you call it.
     # A function is a reusable mini-program you can run by its name.
-    def first_group(rx, body, flags=0, default=""):
+    def first_group(rx, body, default=""):
         # Save a value into a variable named 'm' so we can use it later.
-        m = re.search(rx, body, flags)
+        m = rx.search(body)
         # Send this value back to whoever called the function ('return' ends the function).
         return m.group(1).strip() if m else default
     
     @classmethod
-    # Define a function named 'process'. Inputs: cls, text: str. These are values the function expects when you call it.
+    # Define a function named 'process'. Inputs: cls, text: str, blank_pages: list. These are values the function expects when you call it.
     # A function is a reusable mini-program you can run by its name.
-    def process(cls, text: str):
+    # blank_pages (optional): a list that gets one (code, header date, page) entry per blank page skipped.
+    def process(cls, text: str, blank_pages=None):
         # Save a value into a variable named 'records' so we can use it later.
         records = []
         # Save a value into a variable named 'matches' so we can use it later.
-        matches = list(cls.HDR.finditer(text))
+        # (A quick plain-text check first: no report name, no pages of this kind to find.)
+        matches = list(cls.HDR.finditer(text)) if cls.FORM_NAME in text else []
         
         # Start a loop: repeat these steps once for each item in a collection.
         for i, m in enumerate(matches):
@@ -1543,31 +2394,35 @@ class PayoffNoticeProcessor:
             end = matches[i+1].start() if i+1 < len(matches) else len(text)
             # Save a value into a variable named 'body' so we can use it later.
             body = text[start:end]
+            # Skip pages with no text at all (nothing to extract). No record is made for them;
+            # the caller can count them through blank_pages for the run summary.
+            # Check a condition. If it's True, run the block under this 'if'.
+            if not page_has_text(body):
+                # Check a condition. If it's True, run the block under this 'if'.
+                if blank_pages is not None:
+                    blank_pages.append((code, header_date, page_no))
+                continue
             
             # Save a value into a variable named 'notice_date' so we can use it later.
-            notice_date = cls.first_group(r"\bDate\s*:\s*([0-9/]{8})", body)
+            notice_date = cls.first_group(cls.NOTICE_DATE_RE, body)
             county_name, county_addr = cls.extract_payee_address(body)
             
             # Save a value into a variable named 'notice_comment' so we can use it later.
-            notice_comment = cls.get_between(
-                body,
-                r"The loan shown below.+?(?=\n)",
-                r"\n\s*Ref\s*No\.\s"
-            )
+            notice_comment = cls.get_between(body, cls.COMMENT_START_RE, cls.COMMENT_END_RE)
             
             # Save a value into a variable named 'ref_no' so we can use it later.
-            ref_no = cls.first_group(r"Ref\s*No\.\s+([^\n]+)", body, re.IGNORECASE)
+            ref_no = cls.first_group(cls.REF_NO_RE, body)
             # Save a value into a variable named 'account' so we can use it later.
-            account = cls.first_group(r"\bAccount\s*:\s*([0-9 ]+)", body, re.IGNORECASE).replace(" ","")
+            account = cls.first_group(cls.ACCOUNT_RE, body).replace(" ","")
             # Save a value into a variable named 'note' so we can use it later.
-            note = cls.first_group(r"\bNote\s*:\s*([0-9 ]+)", body, re.IGNORECASE).replace(" ","")
+            note = cls.first_group(cls.NOTE_RE, body).replace(" ","")
             # Save a value into a variable named 'issue_date' so we can use it later.
-            issue_date = cls.first_group(r"Issue\s*Date\s*:\s*([0-9/]{8})", body, re.IGNORECASE)
+            issue_date = cls.first_group(cls.ISSUE_DATE_RE, body)
             # Save a value into a variable named 'acct_name' so we can use it later.
-            acct_name = cls.first_group(r"Acct\s*Name\s*:\s*(.+)", body, re.IGNORECASE)
+            acct_name = cls.first_group(cls.ACCT_NAME_RE, body)
             
             # Save a value into a variable named 'prop_m' so we can use it later.
-            prop_m = re.search(r"Property\s*At\s*:\s*\n\s*(.+)\n\s*(.+)", body, re.IGNORECASE)
+            prop_m = cls.PROPERTY_RE.search(body)
             # Save a value into a variable named 'property_at' so we can use it later.
             property_at = ""
             # Check a condition. If it's True, run the block under this 'if'.
@@ -1603,6 +2458,10 @@ class PayoffNoticeProcessor:
 # Create a Class named 'PastDueNoticeProcessor'. A Class is a blueprint for objects (bundles of data + functions).
 # We'll make objects from this Class to organize related behavior and state.
 class PastDueNoticeProcessor:
+    # Report name from the page header (same idea as LoanStatementProcessor.FORM_NAME).
+    # Save a value into a variable named 'FORM_NAME' so we can use it later.
+    FORM_NAME = "PAST DUE NOTICE"
+    
     # Save a value into a variable named 'HDR' so we can use it later.
     HDR = re.compile(
         r"^\s*\d{3}-\d{7}\s+CIBC BANK USA\s+PAST DUE NOTICE\s+"
@@ -1610,32 +2469,49 @@ class PastDueNoticeProcessor:
         re.MULTILINE
     )
     
+    # Notice fields (process). Compiled once here instead of on every page.
+    NOTICE_DATE_RE = re.compile(r"Notice\s*Date\s*:\s*(\d{2}/\d{2}/\d{2})", re.IGNORECASE)
+    OFFICER_RE = re.compile(r"Officer\s*:\s*([A-Z0-9 &]+)")
+    BRANCH_RE = re.compile(r"Branch\s*:\s*([A-Z0-9 &]+)")
+    LOAN_TYPE_RE = re.compile(r"^\s*(Revolving Credit Loan|Installment Loan|Commercial Loan)\s*$", re.IGNORECASE | re.MULTILINE)
+    DUE_DATE_RE = re.compile(r"Your\s+loan\s+payment\s+was\s+due\s+(\d{2}/\d{2}/\d{2})", re.IGNORECASE)
+    # The four "Label: $1,234.56" amounts all share one shape; only the label changes.
+    PRINCIPAL_RE, INTEREST_RE, LATE_FEES_RE, TOTAL_DUE_RE = (
+        re.compile(label + r"\s*:\s*\$?([0-9,]+\.\d{2})", re.IGNORECASE)
+        for label in (r"Principal", r"Interest", r"Late\s*Fees", r"Total\s*Due")
+    )
+    # Lowercase twins of the date and amount patterns, with no re.IGNORECASE. On an ASCII page they run
+    # on body.lower() instead: a case-sensitive search is much faster, and since what they capture is only
+    # digits and "/,.", the text that comes back is the same. Keep each one in step with its pattern above.
+    NOTICE_DATE_LC_RE = re.compile(r"notice\s*date\s*:\s*(\d{2}/\d{2}/\d{2})")
+    DUE_DATE_LC_RE = re.compile(r"your\s+loan\s+payment\s+was\s+due\s+(\d{2}/\d{2}/\d{2})")
+    PRINCIPAL_LC_RE, INTEREST_LC_RE, LATE_FEES_LC_RE, TOTAL_DUE_LC_RE = (
+        re.compile(label + r"\s*:\s*\$?([0-9,]+\.\d{2})")
+        for label in (r"principal", r"interest", r"late\s*fees", r"total\s*due")
+    )
+    
     # Save a value into a variable named 'NOISE' so we can use it later.
     NOISE = ("CIBC BANK USA","PAST DUE NOTICE","PAST DUE LOAN NOTICE","PAGE")
+    # Save a value into a variable named 'NOISE_RE' so we can use it later (see AdviceOfRateChangeProcessor.NOISE_RE).
+    NOISE_RE = re.compile("|".join(map(re.escape, NOISE)), re.IGNORECASE)
     
-    @staticmethod
-    def clean_tail(s: str) -> str:
-        # Save a value into a variable named 's' so we can use it later.
-        s = re.sub(r"\s+Notice\s*Date\s*:.*$", "", s, flags=re.IGNORECASE)
-        # Save a value into a variable named 's' so we can use it later.
-        s = re.sub(r"\s+Account\s*Number\s*:.*$", "", s, flags=re.IGNORECASE)
-        # Save a value into a variable named 's' so we can use it later.
-        s = re.sub(r"\s+Note\s*Number\s*:.*$", "", s, flags=re.IGNORECASE)
-        # Save a value into a variable named 's' so we can use it later.
-        s = re.sub(r"\s+Officer\s*:.*$", "", s, flags=re.IGNORECASE)
-        # Save a value into a variable named 's' so we can use it later.
-        s = re.sub(r"\s+Branch\s*:.*$", "", s, flags=re.IGNORECASE)
+    # Right-hand labels that share a line with the name/address, in one pattern (see AdviceOfRateChangeProcessor.TAIL_RE).
+    # Save a value into a variable named 'TAIL_RE' so we can use it later.
+    TAIL_RE = re.compile(r"\s+(?:Notice\s*Date|Account\s*Number|Note\s*Number|Officer|Branch)\s*:.*$", re.IGNORECASE)
+    
+    @classmethod
+    def clean_tail(cls, s: str) -> str:
         # Send this value back to whoever called the function ('return' ends the function).
-        return s.strip()
+        return cls.TAIL_RE.sub("", s, 1).strip()
     
     @classmethod
     # Define a function named 'extract_names_address'. Inputs: cls, page_body: str. These are values the function expects when you call it.
     # A function is a reusable mini-program you can run by its name.
     def extract_names_address(cls, page_body: str):
-        # Save a value into a variable named 'lines' so we can use it later.
-        lines = [ln.rstrip() for ln in page_body.splitlines()]
-        # Save a value into a variable named 'zi' so we can use it later.
-        zi = next((i for i, ln in enumerate(lines) if ZIP_RE.search(ln)), -1)
+        # Save a value into a variable named 'lines' so we can use it later (only the lines up to the ZIP line are needed).
+        lines = [ln.rstrip() for ln in lines_through_zip(page_body)]
+        # Save a value into a variable named 'zi' so we can use it later (the ZIP line is the last one).
+        zi = len(lines) - 1
         # Check a condition. If it's True, run the block under this 'if'.
         if zi <= 0:
             # Send this value back to whoever called the function ('return' ends the function).
@@ -1649,7 +2525,7 @@ class PastDueNoticeProcessor:
         # Save a value into a variable named 'candidates' so we can use it later.
         candidates = [cls.clean_tail(ln) for ln in lines[start:zi-1] if ln.strip()]
         # Save a value into a variable named 'names' so we can use it later.
-        names = [ln for ln in candidates if not any(n in ln.upper() for n in cls.NOISE)][-5:]
+        names = [ln for ln in candidates if not cls.NOISE_RE.search(ln)][-5:]
         
         # Try to enhance with spaCy
         names, street, csz = enhance_customer_extraction(names, street, csz, page_body)
@@ -1657,14 +2533,40 @@ class PastDueNoticeProcessor:
         # Send this value back to whoever called the function ('return' ends the function).
         return names, street, csz
     
+    @staticmethod
+    # Define a function named 'search_if'. Inputs: rx, body, low, word. These are values the function expects when you call it.
+    # A function is a reusable mini-program you can run by its name.
+    def search_if(rx, body, low, word, lc_rx=None):
+        """
+        rx.search(body), but only if the lowercase word (a label the pattern needs) is on the page.
+        low is body.lower() for an ASCII page (there lower() and re.IGNORECASE agree letter for letter),
+        or None to always search. A plain "in" check is much cheaper than a regex walking the whole body.
+        lc_rx, if given, is rx's lowercase twin; on an ASCII page it searches low instead of body.
+        """
+        # Check a condition. If it's True, run the block under this 'if'.
+        if low is None:
+            # Send this value back to whoever called the function ('return' ends the function).
+            return rx.search(body)
+        # Check a condition. If it's True, run the block under this 'if'.
+        if word not in low:
+            return None
+        # Check a condition. If it's True, run the block under this 'if'.
+        if lc_rx is not None:
+            # Send this value back to whoever called the function ('return' ends the function).
+            return lc_rx.search(low)
+        # Send this value back to whoever called the function ('return' ends the function).
+        return rx.search(body)
+    
     @classmethod
-    # Define a function named 'process'. Inputs: cls, text: str. These are values the function expects when you call it.
+    # Define a function named 'process'. Inputs: cls, text: str, blank_pages: list. These are values the function expects when you call it.
     # A function is a reusable mini-program you can run by its name.
-    def process(cls, text: str):
+    # blank_pages (optional): a list that gets one (code, header date, page) entry per blank page skipped.
+    def process(cls, text: str, blank_pages=None):
         # Save a value into a variable named 'records' so we can use it later.
         records = []
         # Save a value into a variable named 'matches' so we can use it later.
-        matches = list(cls.HDR.finditer(text))
+        # (A quick plain-text check first: no report name, no pages of this kind to find.)
+        matches = list(cls.HDR.finditer(text)) if cls.FORM_NAME in text else []
         
         # Start a loop: repeat these steps once for each item in a collection.
         for i, m in enumerate(matches):
@@ -1675,39 +2577,48 @@ class PastDueNoticeProcessor:
             end = matches[i+1].start() if i+1 < len(matches) else len(text)
             # Save a value into a variable named 'body' so we can use it later.
             body = text[start:end]
+            # Skip pages with no text at all (nothing to extract). No record is made for them;
+            # the caller can count them through blank_pages for the run summary.
+            # Check a condition. If it's True, run the block under this 'if'.
+            if not page_has_text(body):
+                # Check a condition. If it's True, run the block under this 'if'.
+                if blank_pages is not None:
+                    blank_pages.append((code, hdr_date, page_no))
+                continue
             
             names, street, csz = cls.extract_names_address(body)
             
+            # A page body runs to the next past-due header, so it can be long; a search for a label
+            # that isn't there would walk all of it. Lowercase the page ONCE for the quick label checks.
+            # Save a value into a variable named 'low' so we can use it later.
+            low = body.lower() if body.isascii() else None
+            # Save a value into a variable named 'search_if' so we can use it later.
+            search_if = cls.search_if
+            
             # Save a value into a variable named 'notice_date' so we can use it later.
-            notice_date = re.search(r"Notice\s*Date\s*:\s*(\d{2}/\d{2}/\d{2})", body, re.IGNORECASE)
+            notice_date = search_if(cls.NOTICE_DATE_RE, body, low, "date", cls.NOTICE_DATE_LC_RE)
             # Save a value into a variable named 'acct_m' so we can use it later.
-            acct_m = re.search(r"Account\s*Number\s*:\s*([0-9 ]+)", body, re.IGNORECASE)
+            acct_m = search_if(ACCT_NUMBER_RE, body, low, "account")
             # Save a value into a variable named 'note_m' so we can use it later.
-            note_m = re.search(r"Note\s*Number\s*:\s*([0-9 ]+)", body, re.IGNORECASE)
+            note_m = search_if(NOTE_NUMBER_RE, body, low, "number")
             # Save a value into a variable named 'officer_m' so we can use it later.
-            officer_m = re.search(r"Officer\s*:\s*([A-Z0-9 &]+)", body)
+            officer_m = search_if(cls.OFFICER_RE, body, low, "officer")
             # Save a value into a variable named 'branch_m' so we can use it later.
-            branch_m = re.search(r"Branch\s*:\s*([A-Z0-9 &]+)", body)
+            branch_m = search_if(cls.BRANCH_RE, body, low, "branch")
             
             # Save a value into a variable named 'loan_type_m' so we can use it later.
-            loan_type_m = re.search(
-                r"^\s*(Revolving Credit Loan|Installment Loan|Commercial Loan)\s*$",
-                body, re.IGNORECASE | re.MULTILINE
-            )
+            loan_type_m = search_if(cls.LOAN_TYPE_RE, body, low, "loan")
             # Save a value into a variable named 'due_date_m' so we can use it later.
-            due_date_m = re.search(
-                r"Your\s+loan\s+payment\s+was\s+due\s+(\d{2}/\d{2}/\d{2})",
-                body, re.IGNORECASE
-            )
+            due_date_m = search_if(cls.DUE_DATE_RE, body, low, "payment", cls.DUE_DATE_LC_RE)
             
             # Save a value into a variable named 'pr' so we can use it later.
-            pr = re.search(r"Principal\s*:\s*\$?([0-9,]+\.\d{2})", body, re.IGNORECASE)
+            pr = search_if(cls.PRINCIPAL_RE, body, low, "principal", cls.PRINCIPAL_LC_RE)
             # Save a value into a variable named 'it' so we can use it later.
-            it = re.search(r"Interest\s*:\s*\$?([0-9,]+\.\d{2})", body, re.IGNORECASE)
+            it = search_if(cls.INTEREST_RE, body, low, "interest", cls.INTEREST_LC_RE)
             # Save a value into a variable named 'lf' so we can use it later.
-            lf = re.search(r"Late\s*Fees\s*:\s*\$?([0-9,]+\.\d{2})", body, re.IGNORECASE)
+            lf = search_if(cls.LATE_FEES_RE, body, low, "fees", cls.LATE_FEES_LC_RE)
             # Save a value into a variable named 'td' so we can use it later.
-            td = re.search(r"Total\s*Due\s*:\s*\$?([0-9,]+\.\d{2})", body, re.IGNORECASE)
+            td = search_if(cls.TOTAL_DUE_RE, body, low, "total", cls.TOTAL_DUE_LC_RE)
             
             # Save a value into a variable named 'rec' so we can use it later.
             rec = {
@@ -1740,40 +2651,179 @@ class PastDueNoticeProcessor:
         return records
 
 # ============= OUTPUT UTILITIES =============
-# Define a function named 'write_tsv'. Inputs: filepath, rows, columns. These are values the function expects when you call it.
+# Save a value into a variable named 'TSV_BUFFER_SIZE' so we can use it later.
+# Output files are written in big 1 MB chunks instead of Python's default 8 KB,
+# so large batches hit the disk far less often.
+TSV_BUFFER_SIZE = 1 << 20
+
+# Define a function named 'open_tsv'. Inputs: filepath. These are values the function expects when you call it.
 # A function is a reusable mini-program you can run by its name.
-def write_tsv(filepath, rows, columns):
-    """Write rows to TSV file."""
-    # Open or manage a resource safely using 'with' (auto-closes files, etc.).
-    with filepath.open("w", newline="", encoding="utf-8") as f:
-        # Save a value into a variable named 'w' so we can use it later.
-        w = csv.DictWriter(f, fieldnames=columns, delimiter="\t")
-        w.writeheader()
+def open_tsv(filepath):
+    """Open a TSV file for writing with a large buffer. Returns (file, csv writer)."""
+    # Open the file for writing (newline="" lets the csv module control the line endings).
+    f = open(filepath, "w", encoding="utf-8", newline="", buffering=TSV_BUFFER_SIZE)
+    # Send this value back to whoever called the function ('return' ends the function).
+    return f, csv.writer(f, dialect="excel-tab")
+
+# Create a Class named 'TableWriter'. A Class is a blueprint for objects (bundles of data + functions).
+class TableWriter:
+    """
+    One output table, written a few rows at a time: the TSV file, plus the Excel file
+    when xlsx_path is given (and xlsxwriter/openpyxl is installed).
+    Rows go straight out to the files, so they never have to be kept in memory.
+    """
+
+    # Define a function named '__init__'. Inputs: self, tsv_path, xlsx_path, sheet_name, columns.
+    # __init__ runs once when the object is created: it opens the files and writes the column names.
+    def __init__(self, tsv_path, xlsx_path, sheet_name, columns):
+        # Save a value into a variable named 'self.columns' so we can use it later.
+        self.columns = columns
+        # Pulls every column's value out of a row dict in one call (every table has several
+        # columns, so this always hands back a tuple).
+        # Save a value into a variable named 'self._values_of' so we can use it later.
+        self._values_of = itemgetter(*columns)
+        # Save a value into a variable named 'self.rows_written' so we can use it later.
+        self.rows_written = 0
+        # A plain csv.writer takes each row as a list, so we don't build (and throw away)
+        # a second dict for every row like DictWriter needs.
+        self._f, self._w = open_tsv(tsv_path)
+        self._w.writerow(columns)
+        # Save values into variables named 'self._xlsx_path', 'self._wb' and 'self._ws' so we can use them later.
+        self._xlsx_path, self._wb, self._ws = xlsx_path, None, None
+        # The files this table writes (the Excel file is added below when there is one).
+        # Save a value into a variable named 'self.paths' so we can use it later.
+        self.paths = [tsv_path]
+        # Check a condition. If it's True, run the block under this 'if'.
+        if xlsx_path is None or not HAVE_XLSX:
+            # Send this value back to whoever called the function ('return' ends the function).
+            return
+        self.paths.append(xlsx_path)
+        # Check a condition. If it's True, run the block under this 'if'.
+        if HAVE_XLSXWRITER:
+            # constant_memory: each row is flushed to disk as soon as the next one starts.
+            self._wb = xlsxwriter.Workbook(str(xlsx_path), {"constant_memory": True})
+            self._ws = self._wb.add_worksheet(sheet_name)
+            self._ws.write_row(0, 0, columns)
+        # If none of the above conditions were True, do this 'else' part.
+        else:
+            # write_only: openpyxl streams rows out instead of building every cell object in memory.
+            self._wb = Workbook(write_only=True)
+            self._ws = self._wb.create_sheet(sheet_name)
+            self._ws.append(columns)
+
+    # Define a function named 'write_rows'. Inputs: self, rows. These are values the function expects when you call it.
+    def write_rows(self, rows):
+        """Append rows (dicts) to the table. Missing/None values become ""."""
+        # Save a value into a variable named 'columns' so we can use it later.
+        columns = self.columns
+        # Grab the TSV writer's method once, so the loop doesn't look it up again on every row.
+        writerow = self._w.writerow
+        # Save a value into a variable named 'values_of' so we can use it later.
+        values_of = self._values_of
         # Start a loop: repeat these steps once for each item in a collection.
         for r in rows:
-            # Start a loop: repeat these steps once for each item in a collection.
-            for c in columns:
-                r.setdefault(c, "")
-            w.writerow({k: ("" if r[k] is None else r[k]) for k in columns})
+            # Try to run some code. If it errors, we can handle it without crashing.
+            try:
+                # Save a value into a variable named 'raw' so we can use it later.
+                raw = values_of(r)
+            # A row that is missing a column: look each one up (missing counts as None).
+            except KeyError:
+                # Save a value into a variable named 'raw' so we can use it later.
+                raw = [r.get(c) for c in columns]
+            # Save a value into a variable named 'values' so we can use it later.
+            values = ["" if v is None else v for v in raw]
+            writerow(values)
+            # Check a condition. If it's True, run the block under this 'if'.
+            if self._ws is not None:
+                # Check a condition. If it's True, run the block under this 'if'.
+                if HAVE_XLSXWRITER:
+                    # Row 0 holds the column names, so data rows start at 1.
+                    self._ws.write_row(self.rows_written + 1, 0, values)
+                # If none of the above conditions were True, do this 'else' part.
+                else:
+                    self._ws.append(values)
+            self.rows_written += 1
+
+    # Define a function named 'close'. Inputs: self. These are values the function expects when you call it.
+    def close(self):
+        """Finish the files (the Excel file is only complete once this runs)."""
+        self._f.close()
+        # Check a condition. If it's True, run the block under this 'if'.
+        if self._wb is None:
+            # Send this value back to whoever called the function ('return' ends the function).
+            return
+        # Check a condition. If it's True, run the block under this 'if'.
+        if HAVE_XLSXWRITER:
+            self._wb.close()
+        # If none of the above conditions were True, do this 'else' part.
+        else:
+            self._wb.save(self._xlsx_path)
 
-# Define a function named 'write_xlsx'. Inputs: filepath, rows, columns, sheet_name. These are values the function expects when you call it.
+# ============= FILE-LEVEL PROCESSING =============
+# Define a function named 'find_input_files'. Inputs: path. These are values the function expects when you call it.
 # A function is a reusable mini-program you can run by its name.
-def write_xlsx(filepath, rows, columns, sheet_name):
-    """Write rows to Excel file."""
+def find_input_files(path):
+    """Return the list of files to parse: the file itself, or every .txt file in a folder (sorted by name)."""
     # Check a condition. If it's True, run the block under this 'if'.
-    if not HAVE_XLSX:
+    if path.is_dir():
         # Send this value back to whoever called the function ('return' ends the function).
-        return
-    # Save a value into a variable named 'wb' so we can use it later.
-    wb = Workbook()
-    # Save a value into a variable named 'ws' so we can use it later.
-    ws = wb.active
-    ws.title = sheet_name
-    ws.append(columns)
-    # Start a loop: repeat these steps once for each item in a collection.
-    for r in rows:
-        ws.append([r.get(c, "") if r.get(c, "") is not None else "" for c in columns])
-    wb.save(filepath)
+        return sorted(p for p in path.iterdir() if p.is_file() and p.suffix.lower() == ".txt")
+    # Send this value back to whoever called the function ('return' ends the function).
+    return [path]
+
+# Define a function named 'parse_file'. Inputs: path. These are values the function expects when you call it.
+# A function is a reusable mini-program you can run by its name.
+def parse_file(path, parallel=False):
+    """
+    Read one input file and run every processor over it.
+    Returns a dict of row lists (one entry per output table), plus "blank_<table>" lists
+    of the blank notice pages that were skipped (see write_outputs' summary).
+    This lives at the top level of the file so worker processes can call it.
+    parallel=True lets a big file spread its loan/rev. credit statements over worker processes
+    (only used when the file isn't already running inside a worker).
+    """
+    # Save a value into a variable named 'text' so we can use it later.
+    text = read_text(path)
+    loan_hdr, loan_sum, loan_hist = LoanStatementProcessor.process(text, parallel)
+    rev_hdr, rev_txn = RevCreditProcessor.process(text, parallel)
+    # Save values into variables named 'blank_advice', 'blank_payoff' and 'blank_past_due' so we can use them later.
+    blank_advice, blank_payoff, blank_past_due = [], [], []
+    # Send this value back to whoever called the function ('return' ends the function).
+    return {
+        "loan_hdr": loan_hdr,
+        "loan_sum": loan_sum,
+        "loan_hist": loan_hist,
+        "rev_hdr": rev_hdr,
+        "rev_txn": rev_txn,
+        "advice": AdviceOfRateChangeProcessor.process(text, blank_advice),
+        "payoff": PayoffNoticeProcessor.process(text, blank_payoff),
+        "past_due": PastDueNoticeProcessor.process(text, blank_past_due),
+        # (Filled in by the three process() calls just above.)
+        "blank_advice": blank_advice,
+        "blank_payoff": blank_payoff,
+        "blank_past_due": blank_past_due,
+    }
+
+# Define a function named 'parse_each'. Inputs: paths. These are values the function expects when you call it.
+# A function is a reusable mini-program you can run by its name.
+def parse_each(paths):
+    """
+    Parse every file in paths and yield one result dict per file (same order as paths).
+    This is a generator: each file's result is handed over as soon as it is ready,
+    so the caller can write it out and drop it before the next one arrives.
+    """
+    # Check a condition. If it's True, run the block under this 'if'.
+    if len(paths) > 1:
+        # Each worker process has its own Python (and its own spaCy model, loaded on first use).
+        # Open or manage a resource safely using 'with' (auto-closes files, etc.).
+        with ProcessPoolExecutor(max_workers=MAX_WORKERS) as ex:
+            # map() hands back the results in file order while the workers keep going.
+            yield from ex.map(parse_file, paths, chunksize=4)
+    # If none of the above conditions were True, do this 'else' part.
+    else:
+        # Start a loop: repeat these steps once for each item in a collection.
+        for p in paths:
+            yield parse_file(p, parallel=True)
 
 # ============= MAIN PROCESSING =============
 # Define a function named 'main'. This function takes no inputs.
@@ -1784,188 +2834,341 @@ def main():
     print("WITH OPTIONAL SPACY ENHANCEMENT")
     print("=" * 60)
     
-    # Read input file once
-    print(f"\nReading input file: {INPUT_PATH}")
-    # Save a value into a variable named 'text' so we can use it later.
-    text = read_text(INPUT_PATH)
-    print(f"Total size: {len(text):,} characters")
+    # Check a condition. If it's True, run the block under this 'if'.
+    if WATCH_INPUT:
+        watch_input()
+        # Send this value back to whoever called the function ('return' ends the function).
+        return
+
+    # Find the input file(s). Each file is written out as soon as it is parsed (in parallel when there are several)
+    print(f"\nReading input: {INPUT_PATH}")
+    # Save a value into a variable named 'paths' so we can use it later.
+    paths = find_input_files(INPUT_PATH)
+    print(f"Files: {len(paths)}  Total size: {sum(p.stat().st_size for p in paths):,} bytes")
+    # Check a condition. If it's True, run the block under this 'if'.
+    if SKIP_UNCHANGED:
+        # Save a value into a variable named 'sig' so we can use it later.
+        sig = input_signature(paths)
+        # Check a condition. If it's True, run the block under this 'if'.
+        if outputs_up_to_date(sig):
+            print(f"\nInput unchanged since the last run; outputs in {OUTPUT_DIR} are up to date.")
+            print(f"(Delete {INPUT_SIG_PATH.name} or set SKIP_UNCHANGED = False to parse again.)")
+            # Send this value back to whoever called the function ('return' ends the function).
+            return
+    # Save a value into a variable named 'written' so we can use it later.
+    written = write_outputs(parse_each(paths))
+    # Check a condition. If it's True, run the block under this 'if'.
+    if SKIP_UNCHANGED:
+        # Only saved after every output was written, so a run that failed halfway is never skipped.
+        INPUT_SIG_PATH.write_text("\n".join([sig, *map(str, written)]) + "\n", encoding="utf-8")
+
+# Define a function named 'input_signature'. Inputs: paths. These are values the function expects when you call it.
+# A function is a reusable mini-program you can run by its name.
+def input_signature(paths):
+    """
+    Fingerprint of everything the outputs depend on: each input file (name and contents),
+    every loaded script from this script's folder (this one included), and which optional
+    packages are available (spaCy and its model version change the names; xlsxwriter/openpyxl
+    decide whether the Excel files are written). Returns a hex string.
+    """
+    # Save a value into a variable named 'here' so we can use it later.
+    here = Path(__file__).resolve().parent
+    # Every module loaded from this folder, so a change to any of them counts as a change.
+    # Save a value into a variable named 'sources' so we can use it later.
+    sources = {Path(__file__).resolve()}
+    # Start a loop: repeat these steps once for each item in a collection.
+    for mod in list(sys.modules.values()):
+        # Save a value into a variable named 'f' so we can use it later.
+        f = getattr(mod, "__file__", None)
+        # Check a condition. If it's True, run the block under this 'if'.
+        if f and f.endswith(".py") and Path(f).resolve().parent == here:
+            sources.add(Path(f).resolve())
+    # BLAKE2 hashes much faster than SHA-256, so reading the files stays the slow part.
+    # Save a value into a variable named 'h' so we can use it later.
+    h = hashlib.blake2b(digest_size=32)
+    h.update(f"spacy={HAVE_SPACY} ({spacy_versions()}) xlsx={HAVE_XLSX} xlsxwriter={HAVE_XLSXWRITER}\n".encode())
+    # Start a loop: repeat these steps once for each item in a collection.
+    for p in [*sorted(sources), *paths]:
+        h.update(f"{p.name}\n".encode("utf-8"))
+        # Open or manage a resource safely using 'with' (auto-closes files, etc.).
+        with open(p, "rb") as f:
+            # Read 8 MB at a time, so a huge input never has to fit in memory at once.
+            # Start a loop: repeat these steps once for each item in a collection.
+            for chunk in iter(lambda: f.read(8 << 20), b""):
+                h.update(chunk)
+    # Send this value back to whoever called the function ('return' ends the function).
+    return h.hexdigest()
+
+# Define a function named 'outputs_up_to_date'. Inputs: sig. These are values the function expects when you call it.
+# A function is a reusable mini-program you can run by its name.
+def outputs_up_to_date(sig):
+    """True if the last run saved this same fingerprint and all of its output files still exist."""
+    # Try to run some code. If it errors, we can handle it without crashing.
+    try:
+        # Save a value into a variable named 'saved' so we can use it later.
+        saved = INPUT_SIG_PATH.read_text(encoding="utf-8").splitlines()
+    # If an error happens in the 'try' block, this 'except' block runs to handle it.
+    except OSError:
+        # No fingerprint saved yet (first run, or it was deleted).
+        return False
+    # Send this value back to whoever called the function ('return' ends the function).
+    return bool(saved) and saved[0] == sig and all(Path(p).exists() for p in saved[1:])
+
+# Define a function named 'watch_input'. This function takes no inputs.
+# A function is a reusable mini-program you can run by its name.
+def watch_input():
+    """
+    Keep checking INPUT_PATH for new or changed .txt files and parse them as they show up.
+    Everything runs in this one process, so spaCy is loaded once and reused for every file.
+    The output files always cover every file currently in the folder: a table with no rows left
+    (e.g. the last input file was removed) has its old output files deleted.
+    A file that can't be read or parsed yet (still being copied, locked, ...) is reported
+    and tried again on the next check instead of stopping the watcher.
+    """
+    print(f"\nWatching: {INPUT_PATH} (every {WATCH_INTERVAL}s, Ctrl+C to stop)")
+    # Remember each file's last-modified time and its parsed rows, so unchanged files aren't parsed again.
+    # Save a value into a variable named 'seen' so we can use it later.
+    seen = {}
+    # True while the outputs need rewriting (kept until a write succeeds).
+    # Save a value into a variable named 'changed' so we can use it later.
+    changed = False
+    # Try to run some code. If it errors, we can handle it without crashing.
+    try:
+        # Keep looping until the user stops the script.
+        while True:
+            # Save a value into a variable named 'paths' so we can use it later.
+            paths = find_input_files(INPUT_PATH) if INPUT_PATH.exists() else []
+            # Start a loop: repeat these steps once for each item in a collection.
+            for p in paths:
+                # Try to run some code. If it errors, we can handle it without crashing.
+                try:
+                    # Save a value into a variable named 'mtime' so we can use it later.
+                    mtime = p.stat().st_mtime
+                    # Check a condition. If it's True, run the block under this 'if'.
+                    if p not in seen or seen[p][0] != mtime:
+                        print(f"\nParsing: {p.name}")
+                        seen[p] = (mtime, parse_file(p, parallel=True))
+                        changed = True
+                # If an error happens in the 'try' block, this 'except' block runs to handle it.
+                except Exception as e:
+                    # Leave the file out for now; it is tried again on the next check.
+                    print(f"  Could not parse {p.name} (will retry): {e}")
+            # Forget files that were removed from the folder.
+            # Start a loop: repeat these steps once for each item in a collection.
+            for p in set(seen) - set(paths):
+                del seen[p]
+                changed = True
+            # Check a condition. If it's True, run the block under this 'if'.
+            if changed:
+                # Try to run some code. If it errors, we can handle it without crashing.
+                try:
+                    # Save a value into a variable named 'written' so we can use it later.
+                    written = write_outputs(seen[p][1] for p in paths if p in seen)
+                    # Tables with no rows left get no new files; delete their old ones.
+                    # Start a loop: repeat these steps once for each item in a collection.
+                    for out in OUTPUT_FILES:
+                        # Check a condition. If it's True, run the block under this 'if'.
+                        if out not in written and out.exists():
+                            out.unlink()
+                    # Save a value into a variable named 'changed' so we can use it later.
+                    changed = False
+                # If an error happens in the 'try' block, this 'except' block runs to handle it.
+                except OSError as e:
+                    # E.g. an output file is open in Excel: keep 'changed' set and write again next time.
+                    print(f"  Could not write the outputs (will retry): {e}")
+            time.sleep(WATCH_INTERVAL)
+    # If an error happens in the 'try' block, this 'except' block runs to handle it.
+    except KeyboardInterrupt:
+        print("\nStopped watching.")
+
+# Define a function named 'write_outputs'. Inputs: per_file. These are values the function expects when you call it.
+# A function is a reusable mini-program you can run by its name.
+def write_outputs(per_file):
+    """
+    Write every output table (TSV, plus Excel if available) and print a summary.
+    per_file gives one result dict per input file (a list, or the parse_each generator).
+    Each file's rows are written out as soon as that file arrives and are then dropped,
+    so memory holds one file's rows at a time instead of every file's.
+    Returns the list of files that were written.
+    """
+    # Define columns
+    # Save a value into a variable named 'loan_hdr_cols' so we can use it later.
+    loan_hdr_cols = [
+        "Notice_Type","Notice_Code","Header_Date","Account_Number","Note_Number",
+        "Total_Pages","Statement_Date","Officer","Branch_Number",
+        "Customer_Name_1","Customer_Name_2","Customer_Name_3","Customer_Name_4","Customer_Name_5",
+        "Address_Street","Address_CityStateZip",
+        "Current_Balance","Payment_Due_Date","Amount_Due",
+        "Rate_Type","Rate_Margin",
+        "YTD_Interest_Paid","YTD_Escrow_Interest_Paid","YTD_Unapplied_Funds",
+        "YTD_Escrow_Balance","YTD_Taxes_Disbursed"
+    ]
+    # Save a value into a variable named 'loan_sum_cols' so we can use it later.
+    loan_sum_cols = [
+        "Account_Number","Note_Number","Header_Date",
+        "Note_Category","Current_Balance","Interest_Rate","Maturity_Date","Description","Amount"
+    ]
+    # Save a value into a variable named 'loan_hist_cols' so we can use it later.
+    loan_hist_cols = [
+        "Account_Number","Note_Number","Header_Date","Customer_Name_1",
+        "Hist_Note","Posting_Date","Effective_Date","Transaction_Description",
+        "Transaction_Category",  # Keyword-based (see classify_transaction)
+        "Principal","Interest","LateFees_Others","Escrow","Insurance"
+    ]
+    # Save a value into a variable named 'rev_hdr_cols' so we can use it later.
+    rev_hdr_cols = [
+        "Notice_Type","Notice_Code","Header_Date","Account_Number","Note_Number",
+        "Statement_Date","Payment_Due_Date",
+        "Customer_Name_1","Customer_Name_2","Customer_Name_3","Customer_Name_4","Customer_Name_5",
+        "Address_Street","Address_CityStateZip",
+        "New_Statement_Balance","Fees_Charged_Unpaid_top","Past_Due_Amount_top","Minimum_Payment_Due_top",
+        "Available_Credit","Fees_Charged_Unpaid","Current_Amount_Due","Past_Due_Amount","Minimum_Payment_Due",
+        "Period_Fees_Total","Period_Interest_Total","YTD_Fees","YTD_Interest","Total_Interest_Charges_Paid_YTD",
+        "Previous_Statement_Balance","Advances_Debits","Payments_Credits","Interest_Charge",
+        "Other_Charges","Current_Statement_Balance"
+    ]
+    # Save a value into a variable named 'rev_txn_cols' so we can use it later.
+    rev_txn_cols = [
+        "Account_Number","Note_Number","Header_Date","Trans_Date","Post_Date",
+        "Description","Transaction_Category",  # Keyword-based (see classify_transaction)
+        "Advances_Debits_or_IntCharge","Payments_Credits","Balance_Subject_to_IntRate"
+    ]
+    # Save a value into a variable named 'advice_cols' so we can use it later.
+    advice_cols = [
+        "Notice_Type","Notice_Code","Header_Date","Page",
+        "Customer_Name_1","Customer_Name_2","Customer_Name_3","Customer_Name_4","Customer_Name_5",
+        "Address_Street","Address_CityStateZip",
+        "Account_Number","Note_Number",
+        "Previous_Rate","Current_Rate","Date_of_RateChange"
+    ]
+    # Save a value into a variable named 'payoff_cols' so we can use it later.
+    payoff_cols = [
+        "Notice_Type","Notice_Code","Header_Date","Page","Notice_Date",
+        "County_Name","County_Address","Notice_Comment",
+        "Ref_No","Account","Note","Issue_Date","Acct_Name","Property_At"
+    ]
+    # Save a value into a variable named 'past_due_cols' so we can use it later.
+    past_due_cols = [
+        "Notice_Type","Notice_Code","Header_Date","Page",
+        "Customer_Name_1","Customer_Name_2","Customer_Name_3","Customer_Name_4","Customer_Name_5",
+        "Address_Street","Address_CityStateZip",
+        "Notice_Date","Account_Number","Note_Number","Officer","Branch",
+        "Loan_Type","Due_Date","Principal","Interest","Late_Fees","Total_Due",
+    ]
+    
+    # Every table as (results key, TSV file, Excel file, Excel sheet name, columns), grouped by document type.
+    # A group's files are only created once its first table (the statements/notices) has a row,
+    # so a document type that never shows up leaves its old output files alone, like before.
+    # Save a value into a variable named 'groups' so we can use it later.
+    groups = [
+        [("loan_hdr", OUT_LOAN_HDR_TSV, OUT_LOAN_HDR_XLSX, "loan_header", loan_hdr_cols),
+         ("loan_sum", OUT_LOAN_SUM_TSV, OUT_LOAN_SUM_XLSX, "summary", loan_sum_cols),
+         ("loan_hist", OUT_LOAN_HIST_TSV, OUT_LOAN_HIST_XLSX, "loan_history", loan_hist_cols)],
+        [("rev_hdr", OUT_REV_HDR_TSV, OUT_REV_HDR_XLSX, "rev_stmt", rev_hdr_cols),
+         ("rev_txn", OUT_REV_TXN_TSV, OUT_REV_TXN_XLSX, "transactions", rev_txn_cols)],
+        [("advice", OUT_ADVICE_TSV, OUT_ADVICE_XLSX, "advice_only", advice_cols)],
+        [("payoff", OUT_PAYOFF_TSV, OUT_PAYOFF_XLSX, "payoff_only", payoff_cols)],
+        [("past_due", OUT_PAST_DUE_TSV, OUT_PAST_DUE_XLSX, "past_due_only", past_due_cols)],
+    ]
+    
+    # The open TableWriter for each results key (only for groups that have started).
+    # Save a value into a variable named 'writers' so we can use it later.
+    writers = {}
+    # How many blank notice pages were skipped, per table (they have no rows, so they're counted here).
+    # Save a value into a variable named 'blank' so we can use it later.
+    blank = {"advice": 0, "payoff": 0, "past_due": 0}
+    # Try to run some code. If it errors, we can handle it without crashing.
+    try:
+        # Start a loop: repeat these steps once for each item in a collection.
+        for result in per_file:
+            # Start a loop: repeat these steps once for each item in a collection.
+            for key in blank:
+                blank[key] += len(result.get("blank_" + key, ()))
+            # Start a loop: repeat these steps once for each item in a collection.
+            for group in groups:
+                # Check a condition. If it's True, run the block under this 'if'.
+                if group[0][0] not in writers and not result.get(group[0][0]):
+                    continue
+                # Start a loop: repeat these steps once for each item in a collection.
+                for key, tsv_path, xlsx_path, sheet_name, columns in group:
+                    # Check a condition. If it's True, run the block under this 'if'.
+                    if key not in writers:
+                        writers[key] = TableWriter(tsv_path, xlsx_path, sheet_name, columns)
+                    writers[key].write_rows(result.get(key, []))
+    # 'finally' runs whether or not there was an error: always finish the files that were started.
+    finally:
+        # Start a loop: repeat these steps once for each item in a collection.
+        for w in writers.values():
+            w.close()
     
-    # Process Loan Statements
+    # How many rows went into each table.
+    # Save a value into a variable named 'counts' so we can use it later.
+    counts = {key: w.rows_written for key, w in writers.items()}
+    
+    # Loan Statements
     print("\n" + "-" * 40)
     print("Processing LOAN STATEMENTS...")
-    loan_hdr, loan_sum, loan_hist = LoanStatementProcessor.process(text)
-    
     # Check a condition. If it's True, run the block under this 'if'.
-    if loan_hdr:
-        # Define columns
-        # Save a value into a variable named 'loan_hdr_cols' so we can use it later.
-        loan_hdr_cols = [
-            "Notice_Type","Notice_Code","Header_Date","Account_Number","Note_Number",
-            "Total_Pages","Statement_Date","Officer","Branch_Number",
-            "Customer_Name_1","Customer_Name_2","Customer_Name_3","Customer_Name_4","Customer_Name_5",
-            "Address_Street","Address_CityStateZip",
-            "Current_Balance","Payment_Due_Date","Amount_Due",
-            "Rate_Type","Rate_Margin",
-            "YTD_Interest_Paid","YTD_Escrow_Interest_Paid","YTD_Unapplied_Funds",
-            "YTD_Escrow_Balance","YTD_Taxes_Disbursed"
-        ]
-        # Save a value into a variable named 'loan_sum_cols' so we can use it later.
-        loan_sum_cols = [
-            "Account_Number","Note_Number","Header_Date",
-            "Note_Category","Current_Balance","Interest_Rate","Maturity_Date","Description","Amount"
-        ]
-        # Save a value into a variable named 'loan_hist_cols' so we can use it later.
-        loan_hist_cols = [
-            "Account_Number","Note_Number","Header_Date","Customer_Name_1",
-            "Hist_Note","Posting_Date","Effective_Date","Transaction_Description",
-            "Transaction_Category",  # Added if spaCy is available
-            "Principal","Interest","LateFees_Others","Escrow","Insurance"
-        ]
-        
-        # Write outputs
-        write_tsv(OUT_LOAN_HDR_TSV, loan_hdr, loan_hdr_cols)
-        write_tsv(OUT_LOAN_SUM_TSV, loan_sum, loan_sum_cols)
-        write_tsv(OUT_LOAN_HIST_TSV, loan_hist, loan_hist_cols)
-        
-        # Check a condition. If it's True, run the block under this 'if'.
-        if HAVE_XLSX:
-            write_xlsx(OUT_LOAN_HDR_XLSX, loan_hdr, loan_hdr_cols, "loan_header")
-            write_xlsx(OUT_LOAN_SUM_XLSX, loan_sum, loan_sum_cols, "summary")
-            write_xlsx(OUT_LOAN_HIST_XLSX, loan_hist, loan_hist_cols, "loan_history")
-        
-        print(f"  Found {len(loan_hdr)} statements")
-        print(f"  Wrote {len(loan_sum)} summary rows")
-        print(f"  Wrote {len(loan_hist)} history rows")
+    if counts.get("loan_hdr"):
+        print(f"  Found {counts['loan_hdr']} statements")
+        print(f"  Wrote {counts['loan_sum']} summary rows")
+        print(f"  Wrote {counts['loan_hist']} history rows")
         # Check a condition. If it's True, run the block under this 'if'.
         if HAVE_SPACY:
-            print("  Enhanced with spaCy NER and classification")
+            print("  Enhanced with spaCy NER")
     # If none of the above conditions were True, do this 'else' part.
     else:
         print("  No loan statements found")
     
-    # Process Rev Credit Statements
+    # Rev Credit Statements
     print("\n" + "-" * 40)
     print("Processing REV. CREDIT STATEMENTS...")
-    rev_hdr, rev_txn = RevCreditProcessor.process(text)
-    
     # Check a condition. If it's True, run the block under this 'if'.
-    if rev_hdr:
-        # Define columns
-        # Save a value into a variable named 'rev_hdr_cols' so we can use it later.
-        rev_hdr_cols = [
-            "Notice_Type","Notice_Code","Header_Date","Account_Number","Note_Number",
-            "Statement_Date","Payment_Due_Date",
-            "Customer_Name_1","Customer_Name_2","Customer_Name_3","Customer_Name_4","Customer_Name_5",
-            "Address_Street","Address_CityStateZip",
-            "New_Statement_Balance","Fees_Charged_Unpaid_top","Past_Due_Amount_top","Minimum_Payment_Due_top",
-            "Available_Credit","Fees_Charged_Unpaid","Current_Amount_Due","Past_Due_Amount","Minimum_Payment_Due",
-            "Period_Fees_Total","Period_Interest_Total","YTD_Fees","YTD_Interest","Total_Interest_Charges_Paid_YTD",
-            "Previous_Statement_Balance","Advances_Debits","Payments_Credits","Interest_Charge",
-            "Other_Charges","Current_Statement_Balance"
-        ]
-        # Save a value into a variable named 'rev_txn_cols' so we can use it later.
-        rev_txn_cols = [
-            "Account_Number","Note_Number","Header_Date","Trans_Date","Post_Date",
-            "Description","Transaction_Category",  # Added if spaCy is available
-            "Advances_Debits_or_IntCharge","Payments_Credits","Balance_Subject_to_IntRate"
-        ]
-        
-        # Write outputs
-        write_tsv(OUT_REV_HDR_TSV, rev_hdr, rev_hdr_cols)
-        write_tsv(OUT_REV_TXN_TSV, rev_txn, rev_txn_cols)
-        
-        # Check a condition. If it's True, run the block under this 'if'.
-        if HAVE_XLSX:
-            write_xlsx(OUT_REV_HDR_XLSX, rev_hdr, rev_hdr_cols, "rev_stmt")
-            write_xlsx(OUT_REV_TXN_XLSX, rev_txn, rev_txn_cols, "transactions")
-        
-        print(f"  Found {len(rev_hdr)} statements")
-        print(f"  Wrote {len(rev_txn)} transactions")
-        # Check a condition. If it's True, run the block under this 'if'.
-        if HAVE_SPACY:
-            print("  Transaction categories added via spaCy")
+    if counts.get("rev_hdr"):
+        print(f"  Found {counts['rev_hdr']} statements")
+        print(f"  Wrote {counts['rev_txn']} transactions")
     # If none of the above conditions were True, do this 'else' part.
     else:
         print("  No rev credit statements found")
     
-    # Process Advice of Rate Change
+    # Advice of Rate Change
     print("\n" + "-" * 40)
     print("Processing ADVICE OF RATE CHANGE...")
-    # Save a value into a variable named 'advice_records' so we can use it later.
-    advice_records = AdviceOfRateChangeProcessor.process(text)
-    
     # Check a condition. If it's True, run the block under this 'if'.
-    if advice_records:
-        # Save a value into a variable named 'advice_cols' so we can use it later.
-        advice_cols = [
-            "Notice_Type","Notice_Code","Header_Date","Page",
-            "Customer_Name_1","Customer_Name_2","Customer_Name_3","Customer_Name_4","Customer_Name_5",
-            "Address_Street","Address_CityStateZip",
-            "Account_Number","Note_Number",
-            "Previous_Rate","Current_Rate","Date_of_RateChange"
-        ]
-        
-        write_tsv(OUT_ADVICE_TSV, advice_records, advice_cols)
-        # Check a condition. If it's True, run the block under this 'if'.
-        if HAVE_XLSX:
-            write_xlsx(OUT_ADVICE_XLSX, advice_records, advice_cols, "advice_only")
-        
-        print(f"  Found {len(advice_records)} rate change notices")
+    if counts.get("advice"):
+        print(f"  Found {counts['advice']} rate change notices")
     # If none of the above conditions were True, do this 'else' part.
     else:
         print("  No advice of rate change notices found")
+    # Check a condition. If it's True, run the block under this 'if'.
+    if blank["advice"]:
+        print(f"  Skipped {blank['advice']} blank page(s) (no record written for them)")
     
-    # Process Payoff Notices
+    # Payoff Notices
     print("\n" + "-" * 40)
     print("Processing PAYOFF NOTICES...")
-    # Save a value into a variable named 'payoff_records' so we can use it later.
-    payoff_records = PayoffNoticeProcessor.process(text)
-    
     # Check a condition. If it's True, run the block under this 'if'.
-    if payoff_records:
-        # Save a value into a variable named 'payoff_cols' so we can use it later.
-        payoff_cols = [
-            "Notice_Type","Notice_Code","Header_Date","Page","Notice_Date",
-            "County_Name","County_Address","Notice_Comment",
-            "Ref_No","Account","Note","Issue_Date","Acct_Name","Property_At"
-        ]
-        
-        write_tsv(OUT_PAYOFF_TSV, payoff_records, payoff_cols)
-        # Check a condition. If it's True, run the block under this 'if'.
-        if HAVE_XLSX:
-            write_xlsx(OUT_PAYOFF_XLSX, payoff_records, payoff_cols, "payoff_only")
-        
-        print(f"  Found {len(payoff_records)} payoff notices")
+    if counts.get("payoff"):
+        print(f"  Found {counts['payoff']} payoff notices")
     # If none of the above conditions were True, do this 'else' part.
     else:
         print("  No payoff notices found")
+    # Check a condition. If it's True, run the block under this 'if'.
+    if blank["payoff"]:
+        print(f"  Skipped {blank['payoff']} blank page(s) (no record written for them)")
     
-    # Process Past Due Notices
+    # Past Due Notices
     print("\n" + "-" * 40)
     print("Processing PAST DUE NOTICES...")
-    # Save a value into a variable named 'past_due_records' so we can use it later.
-    past_due_records = PastDueNoticeProcessor.process(text)
-    
     # Check a condition. If it's True, run the block under this 'if'.
-    if past_due_records:
-        # Save a value into a variable named 'past_due_cols' so we can use it later.
-        past_due_cols = [
-            "Notice_Type","Notice_Code","Header_Date","Page",
-            "Customer_Name_1","Customer_Name_2","Customer_Name_3","Customer_Name_4","Customer_Name_5",
-            "Address_Street","Address_CityStateZip",
-            "Notice_Date","Account_Number","Note_Number","Officer","Branch",
-            "Loan_Type","Due_Date","Principal","Interest","Late_Fees","Total_Due",
-        ]
-        
-        write_tsv(OUT_PAST_DUE_TSV, past_due_records, past_due_cols)
-        # Check a condition. If it's True, run the block under this 'if'.
-        if HAVE_XLSX:
-            write_xlsx(OUT_PAST_DUE_XLSX, past_due_records, past_due_cols, "past_due_only")
-        
-        print(f"  Found {len(past_due_records)} past due notices")
+    if counts.get("past_due"):
+        print(f"  Found {counts['past_due']} past due notices")
     # If none of the above conditions were True, do this 'else' part.
     else:
         print("  No past due notices found")
+    # Check a condition. If it's True, run the block under this 'if'.
+    if blank["past_due"]:
+        print(f"  Skipped {blank['past_due']} blank page(s) (no record written for them)")
     
     # Summary
     print("\n" + "=" * 60)
@@ -1973,17 +3176,16 @@ def main():
     print("=" * 60)
     print("\nOutput files created in:", OUTPUT_DIR)
     print("\nSummary:")
-    print(f"  - Loan Statements: {len(loan_hdr)} statements")
-    print(f"  - Rev Credit Statements: {len(rev_hdr)} statements")
-    print(f"  - Advice of Rate Change: {len(advice_records)} notices")
-    print(f"  - Payoff Notices: {len(payoff_records)} notices")
-    print(f"  - Past Due Notices: {len(past_due_records)} notices")
+    print(f"  - Loan Statements: {counts.get('loan_hdr', 0)} statements")
+    print(f"  - Rev Credit Statements: {counts.get('rev_hdr', 0)} statements")
+    print(f"  - Advice of Rate Change: {counts.get('advice', 0)} notices")
+    print(f"  - Payoff Notices: {counts.get('payoff', 0)} notices")
+    print(f"  - Past Due Notices: {counts.get('past_due', 0)} notices")
     
     # Check a condition. If it's True, run the block under this 'if'.
     if HAVE_SPACY:
         print("\n✓ spaCy enhancements applied:")
         print("  - Enhanced name extraction with NER")
-        print("  - Transaction categorization")
     # If none of the above conditions were True, do this 'else' part.
     else:
         print("\nTo enable ML enhancements, install spaCy:")
@@ -1992,7 +3194,10 @@ def main():
     
     # Check a condition. If it's True, run the block under this 'if'.
     if not HAVE_XLSX:
-        print("\nNote: Excel files were skipped (install openpyxl for Excel output)")
+        print("\nNote: Excel files were skipped (install xlsxwriter or openpyxl for Excel output)")
+    
+    # Send this value back to whoever called the function ('return' ends the function).
+    return [p for w in writers.values() for p in w.paths]
 
 # Run the script when executed
 # Check a condition. If it's True, run the block under this 'if'.
@@ -1,7 +1,22 @@
 # file_loader.py
 import os
 import pandas as pd
-import pdfplumber
+
+try:
+    import pymupdf as fitz  # PyMuPDF: C-backed, much faster text extraction than pdfplumber
+except ImportError:
+    try:
+        import fitz  # older PyMuPDF releases
+    except ImportError:
+        fitz = None
+try:
+    import pdfplumber
+except ImportError:
+    pdfplumber = None
+
+PDF_BACKEND = "pymupdf" if fitz else "pdfplumber"
+# What each backend name needs installed (pip package name, module or None if missing)
+PDF_BACKENDS = {"pymupdf": ("pymupdf", fitz), "pdfplumber": ("pdfplumber", pdfplumber)}
 
 def read_text_file(filepath):
     with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
@@ -11,13 +26,36 @@ def read_csv_file(filepath):
     df = pd.read_csv(filepath)
     return "\n".join(df.astype(str).apply(lambda x: ' '.join(x), axis=1))
 
-def read_pdf_file(filepath):
-    text = ""
-    with pdfplumber.open(filepath) as pdf:
-        for page in pdf.pages:
-            if page.extract_text():
-                text += page.extract_text() + "\n"
-    return text
+def read_pdf_file(filepath, backend=None):
+    if backend is None:
+        if fitz is None and pdfplumber is None:
+            raise ImportError("Reading PDFs needs PyMuPDF (pip install pymupdf) or pdfplumber")
+        backend = PDF_BACKEND
+    if backend not in PDF_BACKENDS:
+        raise ValueError(f"Unknown PDF backend {backend!r}; use one of: {', '.join(PDF_BACKENDS)}")
+    package, module = PDF_BACKENDS[backend]
+    if module is None:
+        raise ImportError(f"PDF backend {backend!r} is not installed (pip install {package})")
+    pages = []
+    if backend == "pymupdf":
+        with fitz.open(filepath) as doc:
+            for page in doc:
+                text = page.get_text("text")
+                if not text.strip():
+                    continue  # image-only (scanned) or empty page: no text layer to keep
+                pages.append(text.rstrip("\n"))
+    else:
+        with pdfplumber.open(filepath) as pdf:
+            for page in pdf.pages:
+                # Image-only (scanned) page: no characters at all, so skip the text layout work
+                if page.chars:
+                    pages.append(page.extract_text())
+                # Drop the page's parsed objects now, so they don't pile up across the whole document
+                if hasattr(page, "close"):
+                    page.close()  # pdfplumber >= 0.10: flushes the cache and the text map
+                else:
+                    page.flush_cache()
+    return "".join(t + "\n" for t in pages if t)
 
 def read_rpg_report(filepath):
     with open(filepath, 'r', encoding='utf-8', errors='ignore') as f: